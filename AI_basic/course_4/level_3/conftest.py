@@ -0,0 +1,34 @@
+'''
+스마트 팜 테스트 공용 fixture
+
+모듈 전역 db_config 를 임시 SQLite 파일 DB 로 바꿔 MariaDB 없이 저장/조회 경로를 실행함.
+'''
+
+import pytest
+
+import smart_farm_sensors_queue_sqlalchemy as queue_pipeline
+from database import DatabaseConfig
+
+
+@pytest.fixture
+def farm_db(tmp_path, monkeypatch):
+    '''
+    DatabaseConfig 를 만드는 팩토리 (인자는 DatabaseConfig 와 같음, URL 은 임시 SQLite)
+
+    만든 설정은 queue_pipeline.db_config 로 교체되고, 테스트가 끝나면 원래 값으로 돌아감.
+    '''
+    monkeypatch.delenv('SMART_FARM_PARTITION', raising=False)
+    monkeypatch.delenv('SMART_FARM_RETENTION', raising=False)
+    configs = []
+
+    def make(**kwargs) -> DatabaseConfig:
+        config = DatabaseConfig(f'sqlite:///{tmp_path / "farm.db"}', **kwargs)
+        config.create_tables()
+        monkeypatch.setattr(queue_pipeline, 'db_config', config)
+        configs.append(config)
+        return config
+
+    yield make
+    for config in configs:
+        config.remove_session()
+        config.engine.dispose()
@@ -0,0 +1,154 @@
+'''
+스마트 팜 온도 그래프 렌더링 모듈
+
+- LTTB(Largest-Triangle-Three-Buckets) 다운샘플링: 그래프 폭(픽셀)보다 많은 점은 그리지 않음
+- SeriesCache: 다운샘플링된 시리즈를 (센서 집합, 기간, 마지막 data_id) 키로 보관
+- 헤드리스 배치 모드: pyplot 없이 Agg 캔버스로 센서별 PNG 를 여러 프로세스에서 병렬 렌더링
+'''
+
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import matplotlib.dates as mdates
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+FIGSIZE = (14, 7)
+SAVE_DPI = 150
+DEFAULT_WIDTH_PX = FIGSIZE[0] * SAVE_DPI  # 저장 이미지 가로 픽셀 수 = 다운샘플링 목표 점 수
+MARKER_MAX_POINTS = 100  # 점이 이보다 많으면 마커 생략
+CACHE_MAX_ENTRIES = 16
+
+# 센서 이름 → (x: matplotlib 날짜 숫자, y: 평균 온도)
+Series = Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+
+def lttb_downsample(x: np.ndarray, y: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    '''
+    LTTB 다운샘플링 (x 는 오름차순)
+
+    첫 점과 마지막 점은 유지하고, 나머지를 threshold - 2 개 구간으로 나눠 구간마다
+    '이전 선택 점 - 후보 - 다음 구간 평균점' 삼각형 넓이가 가장 큰 점 하나를 고름.
+    피크와 급변 구간이 평균/간격 추출보다 잘 보존됨.
+    '''
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    every = (n - 2) / (threshold - 2)
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return x[selected], y[selected]
+
+
+def downsample_series(data_dict: Dict[str, Dict[datetime, float]],
+                      width_px: int = DEFAULT_WIDTH_PX) -> Series:
+    '''get_hourly_average_temperature 결과를 센서별 정렬 배열로 바꾸고 width_px 점 이하로 줄임'''
+    series = {}
+    for sensor_name, hour_temps in data_dict.items():
+        hours = sorted(hour_temps)
+        x = mdates.date2num(hours)
+        y = np.fromiter((hour_temps[h] for h in hours), dtype=np.float64, count=len(hours))
+        series[sensor_name] = lttb_downsample(x, y, width_px)
+    return series
+
+
+class SeriesCache:
+    '''다운샘플링된 시리즈 LRU 캐시 (키에 마지막 data_id 를 넣어 새 데이터가 들어오면 자동 무효화)'''
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, Series]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Series]:
+        series = self._entries.get(key)
+        if series is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return series
+
+    def put(self, key: Hashable, series: Series) -> None:
+        self._entries[key] = series
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def draw_temperature_lines(ax, series: Series, title: str) -> None:
+    '''시리즈를 축에 그리고 기존 그래프와 같은 제목/축/눈금 설정 적용'''
+    for sensor_name, (x, y) in series.items():
+        marker = 'o' if len(x) <= MARKER_MAX_POINTS else None
+        ax.plot(x, y, marker=marker, label=sensor_name, linewidth=2)
+
+    ax.set_title(title, fontsize=16, fontweight='bold')
+    ax.set_xlabel('시간 (시)', fontsize=12)
+    ax.set_ylabel('평균 온도 (°C)', fontsize=12)
+    ax.legend(loc='best', fontsize=10)
+    ax.grid(True, alpha=0.3)
+    ax.xaxis_date()
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
+    for label in ax.get_xticklabels():
+        label.set_rotation(45)
+        label.set_ha('right')
+    ax.set_ylim(19, 31)
+
+
+def _render_sensor_png(task: Tuple[str, np.ndarray, np.ndarray, str, Dict]) -> str:
+    '''프로세스 워커: pyplot 없이 Agg 캔버스로 센서 1개 PNG 저장'''
+    sensor_name, x, y, save_path, rc_params = task
+    import matplotlib
+    matplotlib.rcParams.update(rc_params)
+
+    fig = Figure(figsize=FIGSIZE)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    draw_temperature_lines(ax, {sensor_name: (x, y)}, f'{sensor_name} 시간별 평균 온도')
+    fig.tight_layout()
+    fig.savefig(save_path, dpi=SAVE_DPI, bbox_inches='tight')
+    return save_path
+
+
+def render_sensor_pngs(series: Series, output_dir: str, processes: Optional[int] = None,
+                       rc_params: Optional[Dict] = None) -> List[str]:
+    '''
+    센서별 PNG 를 프로세스 풀에서 병렬 렌더링 (헤드리스, 화면 출력 없음)
+
+    Args:
+        rc_params: 워커에 적용할 matplotlib 설정 (한글 폰트 등)
+
+    Returns:
+        저장된 파일 경로 목록
+    '''
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = [
+        (sensor_name, x, y, os.path.join(output_dir, f'temperature_{sensor_name}.png'), rc_params or {})
+        for sensor_name, (x, y) in series.items()
+    ]
+    if not tasks:
+        return []
+    with ProcessPoolExecutor(max_workers=processes or min(len(tasks), os.cpu_count() or 1)) as pool:
+        return list(pool.map(_render_sensor_png, tasks))
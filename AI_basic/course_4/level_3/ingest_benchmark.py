@@ -0,0 +1,353 @@
+'''
+스마트 팜 수집 파이프라인 처리량 벤치마크
+
+세 가지 구현을 같은 조건(로컬 SQLite 임시 파일, 센서 주기 0초)으로 실행해 비교함.
+- print_only: smart_farm_sensor.py (DB 없음, 생성 + 출력만 하는 기준선)
+- direct: smart_farm_sensors_sqlalchemy.py (센서 스레드마다 행 단위 INSERT + 커밋)
+- queue: smart_farm_sensors_queue_sqlalchemy.py (생산자 → Queue/spill → 배치 DB writer)
+
+측정 항목
+- rows_per_s: 커밋된 행 수 / 경과 시간
+- latency_ms: 측정값 생성(enqueue) 시각부터 커밋 완료까지 p50 / p99 / max
+- queue_depth: 일정 간격으로 샘플링한 미저장 적체량 = 메모리 Queue 길이 + spill 파일에 남은 행 수
+  (queue 만 해당, 메모리 Queue 최대 길이는 pipeline.max_queue_depth)
+- spill: spill 파일을 거쳐 저장된 행 수와 비율 (queue 만 해당)
+  센서 주기가 0초라 Queue 가 곧바로 가득 차므로 queue 변형은 대부분의 행이
+  spill 파일 기록 → 재생 경로로 저장됨. 즉 Queue 단독이 아닌 Queue + spill 재생 경로의 측정값임.
+- peak_rss_mb: 프로세스 최대 RSS (변형마다 별도 프로세스로 실행하므로 서로 섞이지 않음)
+
+사용법
+    python ingest_benchmark.py [센서 수 목록] [센서당 측정 횟수] [결과 JSON 경로] [기준 JSON 경로]
+    예) python ingest_benchmark.py 5,50,200 200 bench_ingest.json bench_baseline.json
+기준 JSON 을 주면 같은 (변형, 센서 수) 의 rows/s 변화율을 함께 출력함.
+'''
+
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+VARIANTS = ('print_only', 'direct', 'queue')
+DEFAULT_SENSOR_COUNTS = (5, 50)
+DEFAULT_ROWS_PER_SENSOR = 200
+DEFAULT_OUTPUT = 'bench_ingest.json'
+QUEUE_SAMPLE_INTERVAL = 0.01  # Queue 길이 샘플링 간격 (초)
+DRAIN_TIMEOUT = 300  # 생산 종료 후 남은 데이터 커밋 대기 한도 (초)
+
+
+class LatencyRecorder:
+    '''(sensor_name, input_time) 키로 생성 시각을 기록하고 커밋 시 지연 시간을 계산'''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, datetime], float] = {}
+        self.latencies: List[float] = []
+        self.committed = 0
+
+    def enqueued(self, row: Dict) -> None:
+        with self._lock:
+            self._pending[(row['sensor_name'], row['input_time'])] = time.perf_counter()
+
+    def committed_rows(self, rows: List[Dict]) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            for row in rows:
+                start = self._pending.pop((row['sensor_name'], row['input_time']), None)
+                if start is not None:
+                    self.latencies.append(now - start)
+            self.committed += len(rows)
+
+    def record(self, latency: float) -> None:
+        with self._lock:
+            self.latencies.append(latency)
+            self.committed += 1
+
+    def summary(self) -> Dict[str, float]:
+        if not self.latencies:
+            return {'p50': None, 'p99': None, 'max': None}
+        values = np.asarray(self.latencies) * 1000
+        p50, p99 = np.percentile(values, [50, 99])
+        return {'p50': round(float(p50), 3), 'p99': round(float(p99), 3),
+                'max': round(float(values.max()), 3)}
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 는 KB, macOS 는 바이트 단위
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / scale, 1)
+
+
+def _run_threads(target, sensors) -> None:
+    threads = [threading.Thread(target=target, args=(sensor,), daemon=True) for sensor in sensors]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def _sensor_row(sensor) -> Dict:
+    sensor.set_data()
+    temp, light, humi = sensor.get_data()
+    return {
+        'sensor_name': sensor.sensor_name,
+        'input_time': datetime.now(),
+        'temperature': temp,
+        'illuminance': light,
+        'humidity': humi
+    }
+
+
+def bench_print_only(sensor_count: int, rows_per_sensor: int) -> Dict:
+    '''smart_farm_sensor.sensor_worker 와 같은 생성 + 출력 루프 (sleep 0, 출력은 버림)'''
+    import smart_farm_sensor as variant
+
+    recorder = LatencyRecorder()
+
+    def worker(sensor):
+        for _ in range(rows_per_sensor):
+            start = time.perf_counter()
+            sensor.set_data()
+            temp, light, humi = sensor.get_data()
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            print(f'{timestamp} {sensor.sensor_name} -- temp {temp:02d}, '
+                  f'light {light:04d}, humi {humi:02d}')
+            recorder.record(time.perf_counter() - start)
+
+    sensors = [variant.FarmSensor(f'Farm-{i}') for i in range(1, sensor_count + 1)]
+    start = time.perf_counter()
+    _run_threads(worker, sensors)
+    return {'elapsed': time.perf_counter() - start, 'recorder': recorder,
+            'failed_rows': 0, 'queue_depth': None}
+
+
+def bench_direct(sensor_count: int, rows_per_sensor: int) -> Dict:
+    '''smart_farm_sensors_sqlalchemy.sensor_worker 와 같은 행 단위 저장 루프 (sleep 0)'''
+    import smart_farm_sensors_sqlalchemy as variant
+
+    variant.db_config.create_tables()
+    recorder = LatencyRecorder()
+    failed = [0]
+
+    def worker(sensor):
+        try:
+            for _ in range(rows_per_sensor):
+                row = _sensor_row(sensor)
+                start = time.perf_counter()
+                if variant.insert_sensor_data(**row):
+                    recorder.record(time.perf_counter() - start)
+                else:
+                    failed[0] += 1
+        finally:
+            variant.db_config.remove_session()
+
+    sensors = [variant.FarmSensor(f'Farm-{i}') for i in range(1, sensor_count + 1)]
+    start = time.perf_counter()
+    _run_threads(worker, sensors)
+    elapsed = time.perf_counter() - start
+    variant.db_config.dispose_engine()
+    return {'elapsed': elapsed, 'recorder': recorder, 'failed_rows': failed[0], 'queue_depth': None}
+
+
+def bench_queue(sensor_count: int, rows_per_sensor: int, spill_dir: str) -> Dict:
+    '''
+    smart_farm_sensors_queue_sqlalchemy 의 생산자 → Queue → db_consumer 경로 (sleep 0)
+
+    모듈 전역 Queue/spill 저장소를 그대로 쓰고, 커밋 시각은 insert_sensor_data_batch 를
+    감싸서 기록함 (spill 에서 재생된 행도 같은 키로 지연 시간이 잡힘).
+    '''
+    import smart_farm_sensors_queue_sqlalchemy as variant
+    from spill_queue import SpillQueue
+
+    variant.db_config.create_tables()
+    variant.spill_queue = SpillQueue(spill_dir)
+    recorder = LatencyRecorder()
+    insert_batch = variant.insert_sensor_data_batch
+
+    def insert_and_record(rows):
+        saved = insert_batch(rows)
+        if saved:
+            recorder.committed_rows(rows)
+        return saved
+
+    variant.insert_sensor_data_batch = insert_and_record
+
+    def producer(sensor):
+        for _ in range(rows_per_sensor):
+            row = _sensor_row(sensor)
+            recorder.enqueued(row)
+            put_start = time.perf_counter()
+            was_full = not variant.spill_queue.offer(variant.sensor_queue, row)
+            variant.pipeline_stats.record_put(time.perf_counter() - put_start, was_full)
+
+    samples = []
+    stop_sampling = threading.Event()
+
+    def backlog() -> Tuple[int, int]:
+        '''(메모리 Queue 길이, spill 파일에 기록됐지만 아직 재생되지 않은 행 수)'''
+        spilled = variant.spill_queue.rows_written - variant.pipeline_stats.replayed_rows
+        return variant.sensor_queue.qsize(), max(spilled, 0)
+
+    def sampler():
+        while not stop_sampling.is_set():
+            queued, spilled = backlog()
+            samples.append([round(time.perf_counter() - start, 3), queued, spilled])
+            stop_sampling.wait(QUEUE_SAMPLE_INTERVAL)
+
+    total = sensor_count * rows_per_sensor
+    sensors = [variant.FarmSensor(f'Farm-{i}') for i in range(1, sensor_count + 1)]
+    stop_consumer = threading.Event()
+    consumer = threading.Thread(target=variant.db_consumer,
+                                kwargs={'verbose': False, 'stop_evt': stop_consumer}, daemon=True)
+    start = time.perf_counter()
+    threading.Thread(target=sampler, daemon=True).start()
+    consumer.start()
+    _run_threads(producer, sensors)
+
+    deadline = time.monotonic() + DRAIN_TIMEOUT
+    while recorder.committed < total and time.monotonic() < deadline:
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - start
+    stop_sampling.set()
+    # consumer 가 재생 카운터까지 갱신하고 끝난 뒤에 통계를 읽음
+    stop_consumer.set()
+    consumer.join(timeout=DRAIN_TIMEOUT)
+
+    depths = [queued + spilled for _, queued, spilled in samples]
+    pipeline = variant.pipeline_stats.summary()
+    spilled_rows = variant.spill_queue.rows_written
+    return {
+        'elapsed': elapsed,
+        'recorder': recorder,
+        'failed_rows': total - recorder.committed,
+        'queue_depth': {
+            'max': max(depths, default=0),
+            'mean': round(float(np.mean(depths)), 1) if depths else 0,
+            'max_memory_queue': pipeline['max_queue_depth'],
+            'samples': samples,  # [경과 초, 메모리 Queue 길이, spill 미재생 행 수]
+        },
+        'spill': {
+            'rows': spilled_rows,
+            'replayed_rows': pipeline['replayed_rows'],
+            'ratio': round(spilled_rows / total, 3) if total else 0.0,
+        },
+        'pipeline': pipeline,
+    }
+
+
+def run_worker(variant: str, sensor_count: int, rows_per_sensor: int) -> Dict:
+    '''자식 프로세스: 변형 하나를 실행해 결과 dict 반환 (변형의 화면 출력은 버림)'''
+    with tempfile.TemporaryDirectory() as tmp_dir, open(os.devnull, 'w') as devnull, \
+            contextlib.redirect_stdout(devnull):
+        # database 모듈 import 전에 설정해야 전역 db_config 가 임시 SQLite 를 사용함
+        os.environ['SMART_FARM_DB_URL'] = f'sqlite:///{os.path.join(tmp_dir, "bench.db")}'
+        if variant == 'print_only':
+            run = bench_print_only(sensor_count, rows_per_sensor)
+        elif variant == 'direct':
+            run = bench_direct(sensor_count, rows_per_sensor)
+        elif variant == 'queue':
+            run = bench_queue(sensor_count, rows_per_sensor, os.path.join(tmp_dir, 'spill'))
+        else:
+            raise ValueError(f'알 수 없는 변형: {variant}')
+
+    recorder = run.pop('recorder')
+    elapsed = run.pop('elapsed')
+    return {
+        'variant': variant,
+        'sensors': sensor_count,
+        'rows_per_sensor': rows_per_sensor,
+        'rows': recorder.committed,
+        'elapsed_s': round(elapsed, 3),
+        'rows_per_s': round(recorder.committed / elapsed, 1) if elapsed else 0.0,
+        'latency_ms': recorder.summary(),
+        'peak_rss_mb': _peak_rss_mb(),
+        **run,
+    }
+
+
+def run_suite(sensor_counts=DEFAULT_SENSOR_COUNTS, rows_per_sensor: int = DEFAULT_ROWS_PER_SENSOR,
+              variants=VARIANTS) -> Dict:
+    '''(변형, 센서 수) 조합마다 별도 프로세스로 실행해 결과를 모음'''
+    results = []
+    for sensor_count in sensor_counts:
+        for variant in variants:
+            completed = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--worker', variant,
+                 str(sensor_count), str(rows_per_sensor)],
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                capture_output=True, text=True
+            )
+            if completed.returncode != 0:
+                print(f'{variant} ({sensor_count}개) 실행 실패:\n{completed.stderr}')
+                continue
+            result = json.loads(completed.stdout.strip().splitlines()[-1])
+            results.append(result)
+            latency = result['latency_ms']
+            depth = result['queue_depth']['max'] if result['queue_depth'] else '-'
+            spill = result.get('spill')
+            spill_text = f'  spill 경유 {spill["rows"]}행 ({spill["ratio"]:.0%})' if spill else ''
+            print(f'{variant:<10} 센서 {sensor_count:>5}개  {result["rows_per_s"]:>10,.1f} rows/s  '
+                  f'p50 {latency["p50"]} ms  p99 {latency["p99"]} ms  '
+                  f'적체 최대 {depth}{spill_text}  RSS {result["peak_rss_mb"]} MB')
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'rows_per_sensor': rows_per_sensor,
+        },
+        'results': results,
+    }
+
+
+def compare_with_baseline(report: Dict, baseline_path: str) -> None:
+    '''기준 JSON 과 같은 (변형, 센서 수) 의 rows/s 변화율 출력'''
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(r['variant'], r['sensors']): r for r in json.load(f)['results']}
+    for result in report['results']:
+        base = baseline.get((result['variant'], result['sensors']))
+        if not base or not base['rows_per_s']:
+            continue
+        change = (result['rows_per_s'] / base['rows_per_s'] - 1) * 100
+        print(f'{result["variant"]:<10} 센서 {result["sensors"]:>5}개  rows/s {change:+.1f}% '
+              f'(기준 {base["rows_per_s"]:,.1f})')
+
+
+def main() -> None:
+    sensor_counts = DEFAULT_SENSOR_COUNTS
+    if len(sys.argv) > 1:
+        sensor_counts = tuple(int(count) for count in sys.argv[1].split(','))
+    rows_per_sensor = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_ROWS_PER_SENSOR
+    output = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_OUTPUT
+
+    report = run_suite(sensor_counts, rows_per_sensor)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f'결과 저장: {output}')
+
+    if len(sys.argv) > 4:
+        compare_with_baseline(report, sys.argv[4])
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--worker':
+        print(json.dumps(run_worker(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))))
+    else:
+        main()
@@ -0,0 +1,332 @@
+'''
+parm_data 시간 파티셔닝 (일/월 단위)
+
+- MySQL: parm_data 를 RANGE COLUMNS(input_time) 파티션 테이블로 변환
+  (파티션 키가 모든 유니크 키에 포함되어야 하므로 PK 를 (data_id, input_time) 으로 변경).
+  범위 조건이 있는 조회는 MySQL 이 필요한 파티션만 읽음(partition pruning).
+- SQLite: 기간별 테이블 parm_data_pYYYYMMDD / parm_data_pYYYYMM 로 분리하고,
+  쓰기/읽기 대상 테이블을 파이썬에서 골라 줌.
+- 보존 기간이 지난 데이터는 행 DELETE 대신 파티션(테이블) 단위로 삭제.
+'''
+
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    inspect,
+    select,
+    text,
+)
+
+from database import ParmData, ParmHourlyRollup
+
+GRANULARITY_DAY = 'day'
+GRANULARITY_MONTH = 'month'
+FUTURE_PARTITIONS = 3  # 현재 기간 이후 미리 만들어 둘 파티션 수
+MYSQL_FUTURE_PARTITION = 'p_future'  # 범위를 벗어난 데이터를 받는 MAXVALUE 파티션
+
+
+class PartitionScheme:
+    '''기간 계산 (기간 시작 시각, 다음 기간, 이름 접미사)'''
+
+    def __init__(self, granularity: str = GRANULARITY_MONTH):
+        if granularity not in (GRANULARITY_DAY, GRANULARITY_MONTH):
+            raise ValueError(f'지원하지 않는 파티션 단위: {granularity}')
+        self.granularity = granularity
+
+    def period_start(self, moment: datetime) -> datetime:
+        if self.granularity == GRANULARITY_DAY:
+            return datetime(moment.year, moment.month, moment.day)
+        return datetime(moment.year, moment.month, 1)
+
+    def shift(self, start: datetime, periods: int) -> datetime:
+        '''기간 시작 시각을 periods 만큼 이동'''
+        if self.granularity == GRANULARITY_DAY:
+            return start + timedelta(days=periods)
+        month_index = start.year * 12 + start.month - 1 + periods
+        return datetime(month_index // 12, month_index % 12 + 1, 1)
+
+    def suffix(self, start: datetime) -> str:
+        return start.strftime('%Y%m%d' if self.granularity == GRANULARITY_DAY else '%Y%m')
+
+    def parse_suffix(self, suffix: str) -> datetime:
+        return datetime.strptime(suffix, '%Y%m%d' if self.granularity == GRANULARITY_DAY else '%Y%m')
+
+    def ordinal(self, start: datetime) -> int:
+        if self.granularity == GRANULARITY_DAY:
+            return start.toordinal()
+        return start.year * 12 + start.month - 1
+
+    def periods_between(self, start: datetime, end: datetime) -> List[datetime]:
+        '''start ~ end 를 포함하는 기간 시작 시각 목록'''
+        periods = []
+        current = self.period_start(start)
+        while current <= end:
+            periods.append(current)
+            current = self.shift(current, 1)
+        return periods
+
+
+class PartitionManager:
+    '''
+    파티션 생성/보존/라우팅 기본 클래스
+
+    Args:
+        retention_periods: 현재 기간 외에 보관할 과거 기간 수 (None 이면 삭제하지 않음)
+        future_periods: 미리 만들어 둘 미래 기간 수
+    '''
+
+    def __init__(self, engine, granularity: str = GRANULARITY_MONTH,
+                 retention_periods: Optional[int] = None, future_periods: int = FUTURE_PARTITIONS):
+        self.engine = engine
+        self.scheme = PartitionScheme(granularity)
+        self.retention_periods = retention_periods
+        self.future_periods = future_periods
+        self._lock = threading.Lock()
+
+    def setup(self) -> None:
+        '''최초 1회: 파티션 구조 준비 후 maintain()'''
+        self.maintain()
+
+    def maintain(self, now: Optional[datetime] = None) -> Dict[str, List[str]]:
+        '''미래 파티션 생성 + 보존 기간 지난 파티션 삭제'''
+        now = now or datetime.now()
+        created = self.ensure_future_partitions(now)
+        dropped = self.apply_retention(now) if self.retention_periods is not None else []
+        if created or dropped:
+            print(f'[Partition] 생성: {created}, 삭제: {dropped}')
+        return {'created': created, 'dropped': dropped}
+
+    def retention_cutoff(self, now: datetime) -> datetime:
+        '''이 시각 이전에 시작한 기간은 삭제 대상'''
+        return self.scheme.shift(self.scheme.period_start(now), -self.retention_periods)
+
+    def ensure_future_partitions(self, now: datetime) -> List[str]:
+        raise NotImplementedError
+
+    @staticmethod
+    def _delete_expired_rollup(conn, cutoff: datetime) -> int:
+        '''삭제한 기간의 시간별 롤업 행도 지움 (원본이 없는 집계가 조회되지 않도록)'''
+        rollup = ParmHourlyRollup.__table__
+        return conn.execute(rollup.delete().where(rollup.c.hour < cutoff)).rowcount
+
+    def apply_retention(self, now: datetime) -> List[str]:
+        raise NotImplementedError
+
+    def write_table(self, moment: datetime) -> Table:
+        '''moment 시각 데이터를 저장할 테이블'''
+        raise NotImplementedError
+
+    def read_tables(self, start: Optional[datetime] = None,
+                    end: Optional[datetime] = None) -> List[Table]:
+        '''start ~ end 범위 조회에 필요한 테이블 목록 (기간 순)'''
+        raise NotImplementedError
+
+    def drop_all(self) -> None:
+        pass
+
+
+class MySQLPartitionManager(PartitionManager):
+    '''parm_data 하나를 RANGE COLUMNS(input_time) 로 파티셔닝'''
+
+    def _partitions(self, conn) -> List[str]:
+        rows = conn.execute(text(
+            'SELECT PARTITION_NAME FROM information_schema.PARTITIONS '
+            'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL '
+            'ORDER BY PARTITION_ORDINAL_POSITION'
+        ), {'table': ParmData.__tablename__}).scalars().all()
+        return list(rows)
+
+    def _definition(self, start: datetime) -> str:
+        upper = self.scheme.shift(start, 1).strftime('%Y-%m-%d %H:%M:%S')
+        return f"PARTITION p{self.scheme.suffix(start)} VALUES LESS THAN ('{upper}')"
+
+    def setup(self) -> None:
+        '''파티션이 없는 기존 테이블이면 가장 오래된 데이터 기간부터 파티션 테이블로 변환'''
+        table = ParmData.__tablename__
+        with self._lock, self.engine.begin() as conn:
+            if not self._partitions(conn):
+                now = datetime.now()
+                oldest = conn.execute(select(func.min(ParmData.input_time))).scalar() or now
+                periods = self.scheme.periods_between(
+                    min(oldest, now), self.scheme.shift(self.scheme.period_start(now), self.future_periods))
+                definitions = [self._definition(start) for start in periods]
+                definitions.append(f'PARTITION {MYSQL_FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE)')
+                conn.execute(text(
+                    f'ALTER TABLE {table} DROP PRIMARY KEY, ADD PRIMARY KEY (data_id, input_time) '
+                    f'PARTITION BY RANGE COLUMNS(input_time) ({", ".join(definitions)})'
+                ))
+                print(f'[Partition] {table} 파티션 변환 완료 ({len(periods)}개)')
+        super().setup()
+
+    def ensure_future_partitions(self, now: datetime) -> List[str]:
+        '''p_future 를 쪼개 (REORGANIZE) 현재 ~ future_periods 기간 파티션 추가'''
+        with self._lock, self.engine.begin() as conn:
+            existing = set(self._partitions(conn))
+            last = self.scheme.shift(self.scheme.period_start(now), self.future_periods)
+            # 범위 파티션은 끝에만 추가 가능하므로 가장 늦은 기존 파티션 이후 기간만 생성
+            suffixes = [name[1:] for name in existing if name != MYSQL_FUTURE_PARTITION]
+            first = (self.scheme.shift(self.scheme.parse_suffix(max(suffixes)), 1)
+                     if suffixes else self.scheme.period_start(now))
+            missing = self.scheme.periods_between(first, last) if first <= last else []
+            if not missing:
+                return []
+            definitions = [self._definition(start) for start in missing]
+            definitions.append(f'PARTITION {MYSQL_FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE)')
+            conn.execute(text(
+                f'ALTER TABLE {ParmData.__tablename__} REORGANIZE PARTITION {MYSQL_FUTURE_PARTITION} '
+                f'INTO ({", ".join(definitions)})'
+            ))
+            return [f'p{self.scheme.suffix(start)}' for start in missing]
+
+    def apply_retention(self, now: datetime) -> List[str]:
+        '''보존 기간 이전 파티션을 DROP PARTITION 으로 삭제 (행 DELETE 없음)'''
+        cutoff = self.retention_cutoff(now)
+        with self._lock, self.engine.begin() as conn:
+            expired = [name for name in self._partitions(conn)
+                       if name != MYSQL_FUTURE_PARTITION and self.scheme.parse_suffix(name[1:]) < cutoff]
+            if expired:
+                conn.execute(text(f'ALTER TABLE {ParmData.__tablename__} DROP PARTITION {", ".join(expired)}'))
+                self._delete_expired_rollup(conn, cutoff)
+        return expired
+
+    def write_table(self, moment: datetime) -> Table:
+        return ParmData.__table__
+
+    def read_tables(self, start: Optional[datetime] = None,
+                    end: Optional[datetime] = None) -> List[Table]:
+        # input_time 범위 조건으로 MySQL 이 파티션을 골라 읽음
+        return [ParmData.__table__]
+
+
+class SQLitePartitionManager(PartitionManager):
+    '''
+    기간별 테이블 parm_data_p{접미사}
+
+    data_id 는 (기간 번호 << 32) 부터 시작하도록 sqlite_sequence 를 지정해
+    테이블이 달라도 겹치지 않고 기간 순으로 증가함.
+    '''
+    ID_SHIFT = 32
+
+    def __init__(self, engine, granularity: str = GRANULARITY_MONTH,
+                 retention_periods: Optional[int] = None, future_periods: int = FUTURE_PARTITIONS):
+        super().__init__(engine, granularity, retention_periods, future_periods)
+        self.metadata = MetaData()
+        self.prefix = f'{ParmData.__tablename__}_p'
+        self._tables: Dict[datetime, Table] = {}
+        for name in inspect(engine).get_table_names():
+            if name.startswith(self.prefix):
+                start = self.scheme.parse_suffix(name[len(self.prefix):])
+                self._tables[start] = self._define(start)
+
+    def _define(self, start: datetime) -> Table:
+        suffix = self.scheme.suffix(start)
+        return Table(
+            f'{self.prefix}{suffix}', self.metadata,
+            Column('data_id', Integer, primary_key=True),
+            Column('sensor_name', String(20), nullable=False),
+            Column('input_time', DateTime, nullable=False),
+            Column('temperature', Integer, nullable=False),
+            Column('illuminance', Integer, nullable=False),
+            Column('humidity', Integer, nullable=False),
+            Index(f'idx_sensor_time_p{suffix}', 'sensor_name', 'input_time'),
+            sqlite_autoincrement=True,
+            extend_existing=True,
+        )
+
+    def _ensure(self, start: datetime) -> Table:
+        table = self._tables.get(start)
+        if table is not None:
+            return table
+        with self._lock:
+            table = self._tables.get(start)
+            if table is None:
+                table = self._define(start)
+                with self.engine.begin() as conn:
+                    table.create(conn, checkfirst=True)
+                    seq = self.scheme.ordinal(start) << self.ID_SHIFT
+                    conn.execute(text('DELETE FROM sqlite_sequence WHERE name = :name'), {'name': table.name})
+                    conn.execute(text('INSERT INTO sqlite_sequence (name, seq) VALUES (:name, :seq)'),
+                                 {'name': table.name, 'seq': seq})
+                self._tables[start] = table
+        return table
+
+    def setup(self) -> None:
+        '''파티션 도입 이전에 parm_data 에 쌓인 행은 기간별 테이블로 옮김'''
+        source = ParmData.__table__
+        with self.engine.connect() as conn:
+            bounds = conn.execute(select(func.min(source.c.input_time), func.max(source.c.input_time))).one()
+        if bounds[0] is not None:
+            columns = [c.name for c in source.columns if c.name != 'data_id']
+            moved = 0
+            for start in self.scheme.periods_between(bounds[0], bounds[1]):
+                table = self._ensure(start)
+                condition = (source.c.input_time >= start) & (source.c.input_time < self.scheme.shift(start, 1))
+                with self.engine.begin() as conn:
+                    moved += conn.execute(table.insert().from_select(
+                        columns, select(*(source.c[name] for name in columns)).where(condition)
+                    )).rowcount
+                    conn.execute(source.delete().where(condition))
+            print(f'[Partition] 기존 {source.name} 데이터 {moved}건 기간별 테이블로 이동')
+        super().setup()
+
+    def ensure_future_partitions(self, now: datetime) -> List[str]:
+        start = self.scheme.period_start(now)
+        created = []
+        for period in self.scheme.periods_between(start, self.scheme.shift(start, self.future_periods)):
+            if period not in self._tables:
+                created.append(self._ensure(period).name)
+        return created
+
+    def apply_retention(self, now: datetime) -> List[str]:
+        '''보존 기간 이전 기간 테이블을 DROP TABLE 로 삭제하고 같은 트랜잭션에서 롤업 행도 정리'''
+        cutoff = self.retention_cutoff(now)
+        with self._lock:
+            expired = [start for start in sorted(self._tables) if start < cutoff]
+            if not expired:
+                return []
+            with self.engine.begin() as conn:
+                for start in expired:
+                    self._tables[start].drop(conn, checkfirst=True)
+                self._delete_expired_rollup(conn, cutoff)
+            dropped = []
+            for start in expired:
+                table = self._tables.pop(start)
+                self.metadata.remove(table)
+                dropped.append(table.name)
+        return dropped
+
+    def write_table(self, moment: datetime) -> Table:
+        return self._ensure(self.scheme.period_start(moment))
+
+    def read_tables(self, start: Optional[datetime] = None,
+                    end: Optional[datetime] = None) -> List[Table]:
+        first = self.scheme.period_start(start) if start else None
+        # writer 의 테이블 추가 / 보존 정리의 삭제와 겹치지 않도록 스냅샷을 lock 안에서 복사
+        with self._lock:
+            tables = sorted(self._tables.items())
+        return [table for period, table in tables
+                if (first is None or period >= first) and (end is None or period <= end)]
+
+    def drop_all(self) -> None:
+        with self._lock:
+            self.metadata.drop_all(self.engine)
+            self._tables.clear()
+
+
+def create_partition_manager(backend_name: str, engine, granularity: str,
+                             retention_periods: Optional[int] = None) -> PartitionManager:
+    if backend_name == 'mysql':
+        return MySQLPartitionManager(engine, granularity, retention_periods)
+    if backend_name == 'sqlite':
+        return SQLitePartitionManager(engine, granularity, retention_periods)
+    raise ValueError(f'파티셔닝을 지원하지 않는 DB 백엔드: {backend_name}')
@@ -0,0 +1,433 @@
+import asyncio
+import heapq
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from queue import Queue, Full
+from typing import Dict, List, Optional
+
+from sqlalchemy import create_engine, func, insert, select
+
+import smart_farm_sensors_queue_sqlalchemy as queue_pipeline
+from smart_farm_sensors_queue_sqlalchemy import (
+    FarmSensor,
+    PipelineStats,
+    aggregate_hourly,
+    plot_temperature_graph,
+    SENSOR_COUNT,
+    SENSOR_INTERVAL,
+    BATCH_MAX_LATENCY_MS,
+    SPILL_RETRY_INTERVAL,
+)
+from database import db_config, ParmData, DatabaseConfig
+from spill_queue import SpillQueue
+
+# ====== 전역 상수 ======
+ASYNC_QUEUE_MAX_SIZE = 20000  # 센서 수만 개 기준 한 주기 분량 정도
+ASYNC_BATCH_SIZE = 100  # 한 트랜잭션에 묶을 최대 행 수 (Queue 가 크므로 스레드 버전보다 크게)
+SCHEDULER_TICK = 0.01  # 스케줄러 최소 wakeup 간격 (초): 이 안에 도래한 센서는 한 번에 처리
+
+
+async def sensor_scheduler(sensors: List[FarmSensor], queue: asyncio.Queue,
+                           stats: PipelineStats, interval: float = SENSOR_INTERVAL,
+                           verbose: bool = False) -> None:
+    '''
+    모든 센서를 구동하는 단일 스케줄러 코루틴
+
+    센서마다 스레드(또는 태스크)를 두지 않고 (다음 측정 시각, 센서 번호) 힙 하나로 관리함.
+    시작 시각은 interval 안에 고르게 분산되고, 다음 시각은 '이전 예정 시각 + interval' 로
+    잡아 드리프트가 누적되지 않음. Queue 가 가득 차면 put 에서 대기(back-pressure).
+    '''
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    count = len(sensors)
+    # 예정 시각 순으로 만들었으므로 이미 힙 조건을 만족함
+    heap = [(start + interval * i / count, i) for i in range(count)]
+
+    while True:
+        now = loop.time()
+        due, _ = heap[0]
+        if due > now:
+            await asyncio.sleep(max(due - now, SCHEDULER_TICK))
+            continue
+
+        timestamp = datetime.now()
+        while heap[0][0] <= now:
+            due, idx = heap[0]
+            next_due = due + interval
+            if next_due <= now:
+                # 한 주기 이상 밀렸으면 밀린 측정은 건너뜀
+                next_due = now + interval
+            heapq.heapreplace(heap, (next_due, idx))
+
+            sensor = sensors[idx]
+            sensor.set_data()
+            temp, light, humi = sensor.get_data()
+            if verbose:
+                print(f'{timestamp:%Y-%m-%d %H:%M:%S} {sensor.sensor_name} -- '
+                      f'temp {temp:02d}, light {light:04d}, humi {humi:02d}')
+
+            sensor_data = {
+                'sensor_name': sensor.sensor_name,
+                'input_time': timestamp,
+                'temperature': temp,
+                'illuminance': light,
+                'humidity': humi
+            }
+            if queue.full():
+                put_start = time.perf_counter()
+                await queue.put(sensor_data)
+                stats.record_put(time.perf_counter() - put_start, True)
+                now = loop.time()
+            else:
+                queue.put_nowait(sensor_data)
+
+
+async def insert_sensor_data_batch_async(config: DatabaseConfig, rows: List[Dict]) -> int:
+    '''
+    async 엔진으로 배치 INSERT + 시간별 롤업 갱신 (한 트랜잭션)
+
+    Returns:
+        저장된 행 수 (실패 시 0)
+    '''
+    if not rows:
+        return 0
+    try:
+        # 파티션 테이블 결정/생성은 트랜잭션 시작 전에 (SQLite 새 기간 테이블 생성은 동기 DDL)
+        routed = config.route_rows(rows)
+        session_factory = config.get_async_session_factory()
+        async with session_factory() as session:
+            async with session.begin():
+                for table, table_rows in routed.items():
+                    await session.execute(insert(table), table_rows)
+                await session.execute(config.backend.rollup_upsert(), aggregate_hourly(rows))
+        return len(rows)
+
+    except Exception as e:
+        print(f'DB 일괄 삽입 오류 ({len(rows)}건): {e}')
+        return 0
+
+
+async def _drain_batch_async(queue: asyncio.Queue, first_item: Dict,
+                             batch_size: int, max_latency_ms: float) -> List[Dict]:
+    '''첫 항목 이후 batch_size 가 찰 때까지, 최대 max_latency_ms 동안 Queue 에서 추가로 꺼냄'''
+    loop = asyncio.get_running_loop()
+    batch = [first_item]
+    deadline = loop.time() + max_latency_ms / 1000
+    while len(batch) < batch_size:
+        try:
+            batch.append(queue.get_nowait())
+            continue
+        except asyncio.QueueEmpty:
+            pass
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), remaining))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+async def _replay_spill_async(config: DatabaseConfig, spill: SpillQueue, stats: PipelineStats,
+                              verbose: bool = True) -> bool:
+    '''
+    가장 오래된 spill 세그먼트 1개를 한 트랜잭션으로 재생
+
+    Returns:
+        False: DB 저장 실패 (세그먼트는 그대로 두고 나중에 재시도)
+    '''
+    path = spill.take_segment()
+    if path is None:
+        return True
+    rows = spill.read_segment(path)
+    if rows and not await insert_sensor_data_batch_async(config, rows):
+        return False
+    spill.remove_segment(path)
+    stats.replayed_rows += len(rows)
+    if verbose:
+        print(f'[DB Writer] Spill 세그먼트 {len(rows)}건 재생 완료 '
+              f'(남은 세그먼트: {spill.pending_segments()})')
+    return True
+
+
+async def async_db_consumer(config: DatabaseConfig, queue: asyncio.Queue, stats: PipelineStats,
+                            batch_size: int = ASYNC_BATCH_SIZE,
+                            max_latency_ms: float = BATCH_MAX_LATENCY_MS,
+                            verbose: bool = True, spill: Optional[SpillQueue] = None) -> None:
+    '''
+    배치 DB writer 코루틴 (종료는 Queue 를 비운 뒤 task 취소로)
+
+    저장에 실패한 배치는 스레드 버전과 같은 spill 저장소에 기록하고,
+    Queue 가 빈 뒤에 순서대로 재생함 (DB 장애 중에는 SPILL_RETRY_INTERVAL 마다 재시도).
+    '''
+    spill = spill or queue_pipeline.spill_queue
+    while True:
+        if spill.has_pending() and queue.empty():
+            if not await _replay_spill_async(config, spill, stats, verbose):
+                print(f'[DB Writer] Spill 재생 실패, {SPILL_RETRY_INTERVAL}초 후 재시도')
+                await asyncio.sleep(SPILL_RETRY_INTERVAL)
+            continue
+
+        first_item = await queue.get()
+        stats.max_queue_depth = max(stats.max_queue_depth, queue.qsize() + 1)
+
+        batch = await _drain_batch_async(queue, first_item, batch_size, max_latency_ms)
+        start = time.perf_counter()
+        saved = await insert_sensor_data_batch_async(config, batch)
+        stats.batches += 1
+        stats.commit_time_total += time.perf_counter() - start
+        if saved:
+            stats.rows += saved
+        else:
+            try:
+                stats.spilled_rows += spill.append(batch)
+            except OSError as e:
+                print(f'[DB Writer] Spill 파일 기록 실패: {e}')
+                stats.failed_rows += len(batch)
+        for _ in batch:
+            queue.task_done()
+
+        if verbose:
+            if saved:
+                print(f'[DB Writer] {saved}건 일괄 저장 완료 (Queue 남은 개수: {queue.qsize()})')
+            else:
+                print(f'[DB Writer] {len(batch)}건 DB 저장 실패, spill 파일로 이동')
+
+
+async def run_async_pipeline(config: DatabaseConfig, sensor_count: int = SENSOR_COUNT,
+                             interval: float = SENSOR_INTERVAL, duration: float | None = None,
+                             verbose: bool = True, batch_size: int = ASYNC_BATCH_SIZE,
+                             spill: Optional[SpillQueue] = None) -> PipelineStats:
+    '''
+    스케줄러 + async writer 실행 (Ctrl+C 또는 duration 경과 시 종료)
+
+    종료 시 스케줄러를 멈추고 Queue 에 남은 데이터와 spill 세그먼트를 모두 저장한 뒤 반환함.
+    (DB 가 계속 실패하면 남은 spill 세그먼트는 다음 실행에서 재생)
+    '''
+    spill = spill or queue_pipeline.spill_queue
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    try:
+        loop.add_signal_handler(signal.SIGINT, stop.set)
+    except (NotImplementedError, RuntimeError):
+        # Windows 기본 루프 등: KeyboardInterrupt 로 종료
+        pass
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=ASYNC_QUEUE_MAX_SIZE)
+    stats = PipelineStats()
+    sensors = [FarmSensor(f'Farm-{i}') for i in range(1, sensor_count + 1)]
+
+    consumer = asyncio.create_task(
+        async_db_consumer(config, queue, stats, batch_size, verbose=verbose, spill=spill),
+        name='Consumer-DBWriter')
+    scheduler = asyncio.create_task(
+        sensor_scheduler(sensors, queue, stats, interval, verbose=verbose and sensor_count <= SENSOR_COUNT),
+        name='SensorScheduler')
+
+    try:
+        try:
+            await asyncio.wait_for(stop.wait(), duration)
+        except asyncio.TimeoutError:
+            pass
+    finally:
+        scheduler.cancel()
+        await asyncio.gather(scheduler, return_exceptions=True)
+        print(f'[DB Writer] 남은 Queue 데이터 처리 중... ({queue.qsize()}건)')
+        await queue.join()
+        consumer.cancel()
+        await asyncio.gather(consumer, return_exceptions=True)
+        while spill.has_pending() and await _replay_spill_async(config, spill, stats, verbose):
+            pass
+        spill.close()
+        try:
+            loop.remove_signal_handler(signal.SIGINT)
+        except (NotImplementedError, RuntimeError):
+            pass
+    return stats
+
+
+# ====== 스레드 방식과 비교 벤치마크 ======
+def _cpu_seconds() -> float:
+    t = os.times()
+    return t.user + t.system
+
+
+def _count_rows(db_url: str) -> int:
+    engine = create_engine(db_url)
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(func.count()).select_from(ParmData)).scalar_one()
+    finally:
+        engine.dispose()
+
+
+def _threaded_producer(sensor: FarmSensor, sensor_queue: Queue, stop_evt: threading.Event,
+                       interval: float, stats: PipelineStats) -> None:
+    '''기존 sensor_producer 와 같은 루프 (출력 없음, stop_evt 로 종료 가능)'''
+    while not stop_evt.is_set():
+        sensor.set_data()
+        temp, light, humi = sensor.get_data()
+        sensor_data = {
+            'sensor_name': sensor.sensor_name,
+            'input_time': datetime.now(),
+            'temperature': temp,
+            'illuminance': light,
+            'humidity': humi
+        }
+        put_start = time.perf_counter()
+        was_full = sensor_queue.full()
+        try:
+            sensor_queue.put(sensor_data, block=True, timeout=5)
+        except Full:
+            pass
+        stats.record_put(time.perf_counter() - put_start, was_full)
+        stop_evt.wait(interval)
+
+
+def _bench_threaded(db_url: str, sensors: int, interval: float, duration: float) -> Dict:
+    '''센서당 스레드 1개 + 기존 db_consumer (Queue / spill 모듈 전역을 잠시 교체)'''
+    config = DatabaseConfig(db_url)
+    config.create_tables()
+    stats = PipelineStats()
+    bench_queue = Queue(maxsize=ASYNC_QUEUE_MAX_SIZE)
+    spill_dir = tempfile.TemporaryDirectory()
+    originals = (queue_pipeline.db_config, queue_pipeline.sensor_queue, queue_pipeline.pipeline_stats,
+                 queue_pipeline.spill_queue)
+    queue_pipeline.db_config, queue_pipeline.sensor_queue, queue_pipeline.pipeline_stats, \
+        queue_pipeline.spill_queue = config, bench_queue, stats, SpillQueue(spill_dir.name)
+
+    stop_evt = threading.Event()
+    consumer_stop = threading.Event()
+    consumer = threading.Thread(target=queue_pipeline.db_consumer,
+                                kwargs={'verbose': False, 'stop_evt': consumer_stop})
+    threads = []
+    cpu_start = _cpu_seconds()
+    start = time.perf_counter()
+    try:
+        consumer.start()
+        for i in range(1, sensors + 1):
+            thread = threading.Thread(
+                target=_threaded_producer,
+                args=(FarmSensor(f'Farm-{i}'), bench_queue, stop_evt, interval, stats),
+                daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+        startup = time.perf_counter() - start
+        peak_threads = threading.active_count()
+
+        time.sleep(max(duration - startup, 0))
+        stop_evt.set()
+        for thread in threads:
+            thread.join()
+        bench_queue.join()
+        elapsed = time.perf_counter() - start
+        cpu_used = _cpu_seconds() - cpu_start
+    finally:
+        # 전역을 되돌리고 엔진을 닫기 전에 consumer 를 끝까지 종료시킴
+        stop_evt.set()
+        consumer_stop.set()
+        if consumer.is_alive():
+            consumer.join()
+        queue_pipeline.db_config, queue_pipeline.sensor_queue, queue_pipeline.pipeline_stats, \
+            queue_pipeline.spill_queue = originals
+        config.dispose_engine()
+        spill_dir.cleanup()
+
+    return {'startup_s': startup, 'elapsed_s': elapsed, 'cpu_s': cpu_used,
+            'threads': peak_threads, 'rows': _count_rows(db_url), 'stats': stats}
+
+
+def _bench_async(db_url: str, sensors: int, interval: float, duration: float) -> Dict:
+    config = DatabaseConfig(db_url)
+    config.create_tables()
+
+    async def run():
+        try:
+            return await run_async_pipeline(config, sensors, interval, duration, verbose=False)
+        finally:
+            await config.dispose_async_engine()
+
+    cpu_start = _cpu_seconds()
+    start = time.perf_counter()
+    stats = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    cpu_used = _cpu_seconds() - cpu_start
+    config.dispose_engine()
+
+    return {'startup_s': 0.0, 'elapsed_s': elapsed, 'cpu_s': cpu_used,
+            'threads': threading.active_count(), 'rows': _count_rows(db_url), 'stats': stats}
+
+
+def benchmark_async_vs_threads(sensors: int = 10000, interval: float = 1.0,
+                               duration: float = 10.0) -> Dict[str, Dict]:
+    '''
+    같은 센서 수 / 주기로 스레드 방식과 asyncio 방식의 처리량, CPU, 스레드 수 비교
+
+    각 방식은 별도의 임시 SQLite 파일에 저장하며, 목표 처리량은 sensors / interval rows/s.
+    '''
+    results = {}
+    print(f'센서 {sensors}개, 주기 {interval}s, {duration}s 실행 (목표 {sensors / interval:,.0f} rows/s)')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, bench in (('thread', _bench_threaded), ('asyncio', _bench_async)):
+            db_url = f'sqlite:///{os.path.join(tmp_dir, name + ".db")}'
+            try:
+                result = bench(db_url, sensors, interval, duration)
+            except RuntimeError as e:
+                # 스레드 수 한도 초과 등
+                print(f'{name:<8} 실패: {e}')
+                continue
+            stats = result.pop('stats')
+            result['rows_per_s'] = result['rows'] / result['elapsed_s']
+            result['queue_full_count'] = stats.queue_full_count
+            results[name] = result
+            print(f'{name:<8} {result["rows_per_s"]:>10,.1f} rows/s, '
+                  f'CPU {result["cpu_s"]:.2f}s / wall {result["elapsed_s"]:.2f}s, '
+                  f'스레드 {result["threads"]}개, 시작 {result["startup_s"]:.2f}s, '
+                  f'Queue 가득 참 {result["queue_full_count"]}회')
+    return results
+
+
+def main(sensor_count: int = SENSOR_COUNT) -> None:
+    print('=== 스마트 팜 센서 모니터링 시스템 (asyncio + SQLAlchemy async) ===')
+
+    try:
+        db_config.create_tables()
+    except Exception as e:
+        print(f'테이블 생성 실패: {e}')
+        return
+
+    async def run():
+        try:
+            return await run_async_pipeline(db_config, sensor_count, SENSOR_INTERVAL)
+        finally:
+            await db_config.dispose_async_engine()
+
+    print(f'모니터링 시작 (센서: {sensor_count}개, Queue 크기: {ASYNC_QUEUE_MAX_SIZE})')
+    print('Ctrl+C로 종료\n')
+
+    try:
+        stats = asyncio.run(run())
+        print('\n\n모니터링 종료 요청')
+        print(f'[DB Writer] 통계: {stats.summary()}')
+
+        print('그래프 생성 중...')
+        plot_temperature_graph()
+
+    finally:
+        db_config.dispose_engine()
+        print('프로그램 종료')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        count = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+        benchmark_async_vs_threads(sensors=count)
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else SENSOR_COUNT)
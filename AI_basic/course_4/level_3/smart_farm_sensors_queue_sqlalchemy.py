@@ -1,16 +1,31 @@
+import os
+import sys
+import tempfile
 import threading
 import time
 import random
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from queue import Queue, Empty
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from contextlib import contextmanager
 
-from sqlalchemy import func
+import numpy as np
+from sqlalchemy import and_, delete, func, insert, or_, select, union_all
 import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 
-from database import db_config, ParmData
+from database import db_config, ParmData, ParmHourlyRollup, DatabaseConfig, ROLLUP_METRICS
+from spill_queue import SpillQueue
+from farm_plot import (
+    FIGSIZE,
+    SAVE_DPI,
+    DEFAULT_WIDTH_PX,
+    Series,
+    SeriesCache,
+    downsample_series,
+    draw_temperature_lines,
+    render_sensor_pngs,
+)
 
 import platform
 from matplotlib import font_manager, rc
@@ -20,9 +35,70 @@ SENSOR_COUNT = 5
 SENSOR_INTERVAL = 10  # 센서 데이터 생성 주기 (초)
 QUEUE_CHECK_INTERVAL = 1  # Queue 확인 주기 (초)
 QUEUE_MAX_SIZE = 50  # Queue 최대 크기 (메모리 제한)
+BATCH_SIZE = 50  # 한 트랜잭션에 묶을 최대 행 수 (Queue 에 쌓일 수 있는 행 수 이하여야 지연 한도 전에 배치가 참)
+BATCH_MAX_LATENCY_MS = 500  # 첫 항목을 꺼낸 뒤 배치를 채우며 기다리는 최대 시간
+SPILL_RETRY_INTERVAL = 5  # DB 장애 중 spill 재생 재시도 간격 (초)
+READ_CHUNK_SIZE = 1000  # 스트리밍 조회 시 한 번에 가져오는 행 수
+PARTITION_MAINTENANCE_INTERVAL = 3600  # 파티션 사용 시 미래 파티션 생성/보존 정리 주기 (초)
 
 # ====== 전역 Queue (FIFO) ======
 sensor_queue = Queue(maxsize=QUEUE_MAX_SIZE)
+# Queue 포화 / DB 장애 시 넘치는 데이터를 받는 디스크 세그먼트
+spill_queue = SpillQueue()
+
+
+@dataclass
+class PipelineStats:
+    '''
+    배치 writer 와 back-pressure 지표
+
+    Attributes:
+        batches / rows: 커밋된 배치 수와 행 수
+        failed_rows: 저장 실패 행 수
+        spilled_rows: DB 장애로 spill 파일에 옮긴 행 수 (생산자 spill 은 queue_full_count)
+        replayed_rows: spill 파일에서 재생해 저장한 행 수
+        max_queue_depth: 배치 시작 시점에 관측된 최대 Queue 길이
+        queue_full_count: 생산자 put 이 Queue 가득 참으로 대기한 횟수
+        put_wait_total: 생산자 put 대기 누적 시간 (초)
+        commit_time_total: 배치 INSERT + 커밋 누적 시간 (초)
+    '''
+    batches: int = 0
+    rows: int = 0
+    failed_rows: int = 0
+    spilled_rows: int = 0
+    replayed_rows: int = 0
+    max_queue_depth: int = 0
+    queue_full_count: int = 0
+    put_wait_total: float = 0.0
+    commit_time_total: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_put(self, waited: float, was_full: bool) -> None:
+        with self._lock:
+            self.put_wait_total += waited
+            if was_full:
+                self.queue_full_count += 1
+
+    def summary(self) -> Dict[str, float]:
+        avg_batch = self.rows / self.batches if self.batches else 0.0
+        avg_commit_ms = self.commit_time_total / self.batches * 1000 if self.batches else 0.0
+        return {
+            'batches': self.batches,
+            'rows': self.rows,
+            'failed_rows': self.failed_rows,
+            'spilled_rows': self.spilled_rows,
+            'replayed_rows': self.replayed_rows,
+            'avg_batch_size': round(avg_batch, 1),
+            'avg_commit_ms': round(avg_commit_ms, 2),
+            'max_queue_depth': self.max_queue_depth,
+            'queue_full_count': self.queue_full_count,
+            'put_wait_total_s': round(self.put_wait_total, 3),
+        }
+
+
+pipeline_stats = PipelineStats()
+# 다운샘플링된 그래프 시리즈 캐시
+series_cache = SeriesCache()
 
 
 def configure_korean_font():
@@ -73,6 +149,80 @@ class FarmSensor:
         return (self.temperature, self.illuminance, self.humidity)
 
 
+@dataclass
+class SensorBatch:
+    '''
+    한 tick 의 센서 측정값 묶음 (행마다 dict 를 만들지 않고 컬럼 배열로 전달)
+
+    Attributes:
+        sensor_names: fleet 전체 센서 이름 목록 (fleet 과 공유, 복사하지 않음)
+        indices: 이 묶음에 포함된 센서 번호
+        input_time: 측정 시각 (묶음 전체 공통)
+        temperature / illuminance / humidity: indices 순서의 측정값
+    '''
+    sensor_names: List[str]
+    indices: np.ndarray
+    input_time: datetime
+    temperature: np.ndarray
+    illuminance: np.ndarray
+    humidity: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def rows(self) -> Iterator[Tuple]:
+        '''(sensor_name, input_time, temperature, illuminance, humidity) 튜플'''
+        names = self.sensor_names
+        return zip((names[i] for i in self.indices.tolist()), [self.input_time] * len(self),
+                   self.temperature.tolist(), self.illuminance.tolist(), self.humidity.tolist())
+
+    def to_dicts(self) -> List[Dict]:
+        '''행 dict 목록 (spill 파일 기록 등 드문 경로용)'''
+        keys = ('sensor_name', 'input_time', 'temperature', 'illuminance', 'humidity')
+        return [dict(zip(keys, row)) for row in self.rows()]
+
+
+# Queue / writer 가 받는 항목: 센서 1건 dict 또는 SensorBatch
+QueueItem = Union[Dict, SensorBatch]
+
+
+def _item_rows(item: QueueItem) -> int:
+    return len(item) if isinstance(item, SensorBatch) else 1
+
+
+class FarmSensorFleet:
+    '''
+    센서 전체를 NumPy 배열(struct-of-arrays)로 보관하는 시뮬레이터
+
+    tick() 한 번으로 모든 센서 값을 생성하고, record_batch() 로 Queue 에 넣을 SensorBatch 를 만듦.
+    값 범위는 FarmSensor.set_data 와 같음.
+    '''
+
+    def __init__(self, sensor_count: int, seed: int | None = None):
+        self.sensor_count = sensor_count
+        self.sensor_names = [f'Farm-{i}' for i in range(1, sensor_count + 1)]
+        self._rng = np.random.default_rng(seed)
+        self._indices = np.arange(sensor_count)
+        self.temperature = np.zeros(sensor_count, dtype=np.int32)
+        self.illuminance = np.zeros(sensor_count, dtype=np.int32)
+        self.humidity = np.zeros(sensor_count, dtype=np.int32)
+
+    def tick(self) -> None:
+        '''모든 센서 값을 한 번에 갱신 (FarmSensor.set_data 의 벡터화 버전)'''
+        n = self.sensor_count
+        self.temperature = self._rng.integers(20, 31, size=n, dtype=np.int32)
+        self.illuminance = self._rng.integers(5000, 10001, size=n, dtype=np.int32)
+        self.humidity = self._rng.integers(40, 71, size=n, dtype=np.int32)
+
+    def get_data(self, index: int) -> Tuple[int, int, int]:
+        return (int(self.temperature[index]), int(self.illuminance[index]), int(self.humidity[index]))
+
+    def record_batch(self, input_time: datetime | None = None) -> SensorBatch:
+        '''현재 값으로 SensorBatch 생성 (tick() 이 배열을 새로 만들므로 복사 없이 공유)'''
+        return SensorBatch(self.sensor_names, self._indices, input_time or datetime.now(),
+                           self.temperature, self.illuminance, self.humidity)
+
+
 @contextmanager
 def get_db_session():
     session = db_config.get_session()
@@ -90,17 +240,24 @@ def insert_sensor_data(sensor_name: str, input_time: datetime,
                        temperature: int, illuminance: int,
                        humidity: int) -> int | None:
     try:
+        row = {
+            'sensor_name': sensor_name,
+            'input_time': input_time,
+            'temperature': temperature,
+            'illuminance': illuminance,
+            'humidity': humidity
+        }
+        # 파티션 테이블 생성이 필요하면 트랜잭션 시작 전에 처리
+        table = db_config.write_table(input_time)
         with get_db_session() as session:
-            sensor_data = ParmData(
-                sensor_name=sensor_name,
-                input_time=input_time,
-                temperature=temperature,
-                illuminance=illuminance,
-                humidity=humidity
-            )
-            session.add(sensor_data)
-            session.flush()
-            data_id = sensor_data.data_id
+            if table is ParmData.__table__:
+                sensor_data = ParmData(**row)
+                session.add(sensor_data)
+                session.flush()
+                data_id = sensor_data.data_id
+            else:
+                data_id = session.execute(insert(table).values(**row)).inserted_primary_key[0]
+            update_hourly_rollup(session, [row])
 
             return data_id
 
@@ -109,21 +266,199 @@ def insert_sensor_data(sensor_name: str, input_time: datetime,
         return None
 
 
+def insert_sensor_data_batch(rows: List[QueueItem]) -> int:
+    '''
+    여러 센서 데이터를 한 트랜잭션에서 일괄 INSERT
+
+    ORM 객체를 만들지 않고 Core insert 에 dict 목록을 넘겨 executemany 로 실행.
+    SensorBatch 항목은 dict 없이 튜플로 드라이버 executemany 에 바로 넘김.
+    시간별 롤업도 같은 트랜잭션에서 갱신하므로 원본과 집계가 어긋나지 않음.
+
+    Returns:
+        저장된 행 수 (실패 시 0)
+    '''
+    if not rows:
+        return 0
+    dict_rows = [row for row in rows if not isinstance(row, SensorBatch)]
+    record_batches = [row for row in rows if isinstance(row, SensorBatch)]
+    total = len(dict_rows) + sum(len(batch) for batch in record_batches)
+    try:
+        # 저장 테이블(파티션) 결정과 생성은 트랜잭션 시작 전에 처리
+        routed = db_config.route_rows(dict_rows) if dict_rows else {}
+        batch_tables = [db_config.write_table(batch.input_time).name for batch in record_batches]
+        with get_db_session() as session:
+            for table, table_rows in routed.items():
+                session.execute(insert(table), table_rows)
+            if dict_rows:
+                update_hourly_rollup(session, dict_rows)
+            if record_batches:
+                _insert_record_batches(session, record_batches, batch_tables)
+        return total
+
+    except Exception as e:
+        print(f'DB 일괄 삽입 오류 ({total}건): {e}')
+        return 0
+
+
+def _insert_record_batches(session, batches: List[SensorBatch], table_names: List[str]) -> None:
+    '''SensorBatch 를 드라이버 executemany (튜플 파라미터) 로 INSERT 하고 롤업을 갱신'''
+    connection = session.connection()
+    dialect = connection.dialect
+    placeholder = '?' if dialect.paramstyle == 'qmark' else '%s'
+    columns = ('sensor_name', 'input_time', 'temperature', 'illuminance', 'humidity')
+
+    # 시각은 묶음마다 하나이므로 DateTime 저장 형식 변환(SQLite 문자열 등)도 묶음당 한 번만
+    to_db = ParmData.__table__.c.input_time.type.bind_processor(dialect) or (lambda value: value)
+    params_by_table: Dict[str, List[Tuple]] = {}
+    for batch, table_name in zip(batches, table_names):
+        stored_time = to_db(batch.input_time)
+        params_by_table.setdefault(table_name, []).extend(
+            (name, stored_time, temp, light, humi) for name, _, temp, light, humi in batch.rows())
+    for table_name, params in params_by_table.items():
+        sql = (f'INSERT INTO {table_name} ({", ".join(columns)}) '
+               f'VALUES ({", ".join([placeholder] * len(columns))})')
+        connection.exec_driver_sql(sql, params)
+
+    hourly = aggregate_hourly_batches(batches)
+    if hourly:
+        session.execute(db_config.backend.rollup_upsert(), hourly)
+
+
+def _hour_start(moment: datetime) -> datetime:
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def aggregate_hourly(rows: List[Dict]) -> List[Dict]:
+    '''센서 데이터 dict 목록을 (센서, 정시) 별 count/sum/min/max 부분 집계 행으로 변환'''
+    buckets: Dict[Tuple[str, datetime], Dict] = {}
+    for row in rows:
+        key = (row['sensor_name'], _hour_start(row['input_time']))
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = {'sensor_name': key[0], 'hour': key[1], 'sample_count': 0}
+            for metric in ROLLUP_METRICS:
+                bucket[f'{metric}_sum'] = 0
+                bucket[f'{metric}_min'] = row[metric]
+                bucket[f'{metric}_max'] = row[metric]
+            buckets[key] = bucket
+        bucket['sample_count'] += 1
+        for metric in ROLLUP_METRICS:
+            value = row[metric]
+            bucket[f'{metric}_sum'] += value
+            if value < bucket[f'{metric}_min']:
+                bucket[f'{metric}_min'] = value
+            if value > bucket[f'{metric}_max']:
+                bucket[f'{metric}_max'] = value
+    return list(buckets.values())
+
+
+def aggregate_hourly_batches(batches: List[SensorBatch]) -> List[Dict]:
+    '''SensorBatch 목록을 NumPy 로 (센서, 정시) 별 부분 집계 (dict 는 집계 결과 행만 생성)'''
+    groups: Dict[Tuple[int, datetime], List[SensorBatch]] = {}
+    for batch in batches:
+        groups.setdefault((id(batch.sensor_names), _hour_start(batch.input_time)), []).append(batch)
+
+    hourly = []
+    for (_, hour), group in groups.items():
+        names = group[0].sensor_names
+        indices = np.concatenate([batch.indices for batch in group])
+        order = np.argsort(indices, kind='stable')
+        sorted_indices = indices[order]
+        starts = np.flatnonzero(np.r_[True, sorted_indices[1:] != sorted_indices[:-1]])
+        counts = np.diff(np.r_[starts, len(sorted_indices)])
+        columns = {'sample_count': counts.tolist()}
+        for metric in ROLLUP_METRICS:
+            values = np.concatenate([getattr(batch, metric) for batch in group]).astype(np.int64)[order]
+            columns[f'{metric}_sum'] = np.add.reduceat(values, starts).tolist()
+            columns[f'{metric}_min'] = np.minimum.reduceat(values, starts).tolist()
+            columns[f'{metric}_max'] = np.maximum.reduceat(values, starts).tolist()
+
+        keys = list(columns)
+        for row_values, sensor_index in zip(zip(*columns.values()), sorted_indices[starts].tolist()):
+            row = dict(zip(keys, row_values))
+            row['sensor_name'] = names[sensor_index]
+            row['hour'] = hour
+            hourly.append(row)
+    return hourly
+
+
+def update_hourly_rollup(session, rows: List[Dict]) -> None:
+    '''배치를 파이썬에서 먼저 집계한 뒤 (센서, 정시) 당 한 행씩 롤업 테이블에 UPSERT'''
+    hourly = aggregate_hourly(rows)
+    if hourly:
+        session.execute(db_config.backend.rollup_upsert(), hourly)
+
+
+def rebuild_hourly_rollup() -> int:
+    '''
+    원본 parm_data 전체로 롤업 테이블을 다시 계산 (롤업 도입 이전 데이터 백필용)
+
+    Returns:
+        생성된 롤업 행 수 (실패 시 0)
+    '''
+    try:
+        with get_db_session() as session:
+            results = []
+            # 파티션 경계는 정시와 맞으므로 테이블별 집계를 그대로 이어 붙이면 됨
+            for table in db_config.read_tables():
+                hour_bucket = db_config.backend.hour_bucket(table.c.input_time)
+                columns = [func.count().label('sample_count')]
+                for metric in ROLLUP_METRICS:
+                    column = table.c[metric]
+                    columns += [func.sum(column).label(f'{metric}_sum'),
+                                func.min(column).label(f'{metric}_min'),
+                                func.max(column).label(f'{metric}_max')]
+                results += session.execute(
+                    select(table.c.sensor_name, hour_bucket.label('hour'), *columns)
+                    .group_by(table.c.sensor_name, hour_bucket)
+                ).all()
+
+            hourly = []
+            for result in results:
+                row = result._asdict()
+                row['hour'] = datetime.strptime(row['hour'], '%Y-%m-%d %H:%M:%S')
+                row['sample_count'] = int(row['sample_count'])
+                for metric in ROLLUP_METRICS:
+                    row[f'{metric}_sum'] = int(row[f'{metric}_sum'])
+                hourly.append(row)
+
+            session.execute(delete(ParmHourlyRollup))
+            if hourly:
+                session.execute(insert(ParmHourlyRollup), hourly)
+        print(f'시간별 롤업 재계산 완료: {len(hourly)}행')
+        return len(hourly)
+
+    except Exception as e:
+        print(f'시간별 롤업 재계산 오류: {e}')
+        return 0
+
+
 def get_sensor_data(sensor_name: str | None = None,
                     start_time: datetime | None = None,
                     end_time: datetime | None = None) -> List[ParmData]:
     try:
+        tables = db_config.read_tables(start_time, end_time)
         with get_db_session() as session:
-            query = session.query(ParmData)
-
-            if sensor_name:
-                query = query.filter(ParmData.sensor_name == sensor_name)
-            if start_time:
-                query = query.filter(ParmData.input_time >= start_time)
-            if end_time:
-                query = query.filter(ParmData.input_time <= end_time)
-
-            results = query.order_by(ParmData.input_time.asc()).all()
+            if tables == [ParmData.__table__]:
+                query = session.query(ParmData)
+
+                if sensor_name:
+                    query = query.filter(ParmData.sensor_name == sensor_name)
+                if start_time:
+                    query = query.filter(ParmData.input_time >= start_time)
+                if end_time:
+                    query = query.filter(ParmData.input_time <= end_time)
+
+                results = query.order_by(ParmData.input_time.asc()).all()
+            elif tables:
+                # 파티션 테이블: 범위에 걸치는 기간 테이블만 UNION ALL 후 ParmData 객체로 매핑
+                stmt = _union_select(
+                    [select(table).where(*_sensor_filters(table, sensor_name, start_time, end_time))
+                     for table in tables])
+                stmt = stmt.order_by(stmt.selected_columns.input_time.asc())
+                results = session.execute(select(ParmData).from_statement(stmt)).scalars().all()
+            else:
+                results = []
 
             for result in results:
                 session.expunge(result)
@@ -135,34 +470,187 @@ def get_sensor_data(sensor_name: str | None = None,
         return []
 
 
-def get_hourly_average_temperature() -> Dict[str, Dict[datetime, float]]:
+# 스트리밍 조회 컬럼 (ORM 객체 대신 튜플로 반환)
+SENSOR_COLUMNS = ('data_id', 'sensor_name', 'input_time', 'temperature', 'illuminance', 'humidity')
+# idx_sensor_time(sensor_name, input_time) 순서 + data_id 로 동일 시각 구분
+SENSOR_ORDER = ('sensor_name', 'input_time', 'data_id')
+
+
+def _sensor_filters(table, sensor_name: str | None, start_time: datetime | None,
+                    end_time: datetime | None) -> List:
+    filters = []
+    if sensor_name:
+        filters.append(table.c.sensor_name == sensor_name)
+    if start_time:
+        filters.append(table.c.input_time >= start_time)
+    if end_time:
+        filters.append(table.c.input_time <= end_time)
+    return filters
+
+
+def _union_select(selects: List):
+    '''테이블(파티션)별 SELECT 가 여러 개면 UNION ALL 로 합침'''
+    return selects[0] if len(selects) == 1 else union_all(*selects)
+
+
+def _after_key(table, key: Tuple[str, datetime, int]):
+    '''(sensor_name, input_time, data_id) 가 key 보다 뒤인 행 조건 (keyset pagination)'''
+    sensor_name, input_time, data_id = key
+    return or_(
+        table.c.sensor_name > sensor_name,
+        and_(
+            table.c.sensor_name == sensor_name,
+            or_(
+                table.c.input_time > input_time,
+                and_(table.c.input_time == input_time, table.c.data_id > data_id)
+            )
+        )
+    )
+
+
+def iter_sensor_data(sensor_name: str | None = None,
+                     start_time: datetime | None = None,
+                     end_time: datetime | None = None,
+                     chunk_size: int = READ_CHUNK_SIZE,
+                     keyset: bool = True,
+                     after: Tuple[str, datetime, int] | None = None) -> Iterator[List[Tuple]]:
+    '''
+    센서 데이터를 chunk_size 행씩 (data_id, sensor_name, input_time, temperature,
+    illuminance, humidity) 튜플 목록으로 반환하는 제너레이터
+
+    정렬은 (sensor_name, input_time, data_id) 로 idx_sensor_time 순서를 그대로 따름.
+    조회 범위와 관계없이 메모리에는 chunk 하나만 올라옴.
+    파티션 사용 시 범위에 걸치는 기간 테이블만 UNION ALL 로 읽음.
+
+    Args:
+        keyset: True 면 chunk 마다 '마지막 키 이후 LIMIT n' 쿼리를 새로 실행 (트랜잭션이 짧고,
+                after 로 중단 지점부터 재개 가능).
+                False 면 쿼리 하나를 yield_per 로 스트리밍 (MySQL 은 서버 측 커서 사용).
+        after: 이 키 (sensor_name, input_time, data_id) 이후부터 조회 (keyset 모드)
+    '''
+    def build(last_key):
+        selects = []
+        for table in tables:
+            filters = _sensor_filters(table, sensor_name, start_time, end_time)
+            if last_key is not None:
+                filters.append(_after_key(table, last_key))
+            selects.append(select(*(table.c[name] for name in SENSOR_COLUMNS)).where(*filters))
+        stmt = _union_select(selects)
+        return stmt.order_by(*(stmt.selected_columns[name] for name in SENSOR_ORDER))
+
+    try:
+        tables = db_config.read_tables(start_time, end_time)
+        if not tables:
+            return
+        stmt = build(after)
+
+        if not keyset:
+            with get_db_session() as session:
+                result = session.execute(stmt.execution_options(yield_per=chunk_size))
+                for rows in result.partitions():
+                    yield rows
+            return
+
+        while True:
+            with get_db_session() as session:
+                rows = session.execute(stmt.limit(chunk_size)).all()
+            if not rows:
+                return
+            yield rows
+            if len(rows) < chunk_size:
+                return
+            last = rows[-1]
+            stmt = build((last.sensor_name, last.input_time, last.data_id))
+
+    except Exception as e:
+        print(f'데이터 스트리밍 조회 오류: {e}')
+
+
+def iter_sensor_arrays(sensor_name: str | None = None,
+                       start_time: datetime | None = None,
+                       end_time: datetime | None = None,
+                       chunk_size: int = READ_CHUNK_SIZE,
+                       keyset: bool = True) -> Iterator[Dict[str, np.ndarray]]:
+    '''iter_sensor_data 의 chunk 를 컬럼별 NumPy 배열 dict 로 변환해 반환'''
+    for rows in iter_sensor_data(sensor_name, start_time, end_time, chunk_size, keyset):
+        data_ids, names, times, temps, lights, humis = zip(*rows)
+        yield {
+            'data_id': np.array(data_ids, dtype=np.int64),
+            'sensor_name': np.array(names),
+            'input_time': np.array(times, dtype='datetime64[us]'),
+            'temperature': np.array(temps, dtype=np.int32),
+            'illuminance': np.array(lights, dtype=np.int32),
+            'humidity': np.array(humis, dtype=np.int32),
+        }
+
+
+def get_hourly_average_temperature(sensor_names: List[str] | None = None,
+                                   start_time: datetime | None = None,
+                                   end_time: datetime | None = None) -> Dict[str, Dict[datetime, float]]:
+    '''
+    센서별 시간별 평균 온도
+
+    현재 시간대 외에는 롤업 테이블(parm_data_hourly)의 sum / count 로 계산하고,
+    원본 parm_data 는 아직 끝나지 않은 현재 시간대만 조회함.
+
+    Args:
+        sensor_names: 조회할 센서 목록 (None 이면 전체)
+        start_time / end_time: 시간 구간 시작(정시) 기준 조회 범위
+    '''
     try:
         with get_db_session() as session:
-            # MariaDB의 DATE_FORMAT 함수로 시간별 그룹화
-            query = session.query(
-                ParmData.sensor_name,
-                func.date_format(
-                    ParmData.input_time,
-                    '%Y-%m-%d %H:00:00'
-                ).label('hour'),
-                func.avg(ParmData.temperature).label('avg_temp')
-            ).group_by(
-                ParmData.sensor_name,
-                func.date_format(ParmData.input_time, '%Y-%m-%d %H:00:00')
-            ).order_by(
-                ParmData.sensor_name,
-                'hour'
+            current_hour = _hour_start(datetime.now())
+
+            rollup_query = session.query(
+                ParmHourlyRollup.sensor_name,
+                ParmHourlyRollup.hour,
+                ParmHourlyRollup.temperature_sum,
+                ParmHourlyRollup.sample_count
+            ).filter(
+                ParmHourlyRollup.hour != current_hour
             )
-
-            results = query.all()
+            if sensor_names:
+                rollup_query = rollup_query.filter(ParmHourlyRollup.sensor_name.in_(sensor_names))
+            if start_time:
+                rollup_query = rollup_query.filter(ParmHourlyRollup.hour >= start_time)
+            if end_time:
+                rollup_query = rollup_query.filter(ParmHourlyRollup.hour <= end_time)
+            rollups = rollup_query.order_by(
+                ParmHourlyRollup.sensor_name,
+                ParmHourlyRollup.hour
+            ).all()
+
+            partial: Dict[str, List[int]] = {}  # 센서 → [온도 합계, 건수]
+            if (start_time is None or start_time <= current_hour) and \
+                    (end_time is None or current_hour <= end_time):
+                next_hour = current_hour + timedelta(hours=1)
+                for table in db_config.read_tables(current_hour, next_hour):
+                    partial_query = select(
+                        table.c.sensor_name,
+                        func.sum(table.c.temperature),
+                        func.count()
+                    ).where(
+                        table.c.input_time >= current_hour,
+                        table.c.input_time < next_hour
+                    )
+                    if sensor_names:
+                        partial_query = partial_query.where(table.c.sensor_name.in_(sensor_names))
+                    for sensor_name, temp_sum, count in session.execute(
+                            partial_query.group_by(table.c.sensor_name)):
+                        totals = partial.setdefault(sensor_name, [0, 0])
+                        totals[0] += temp_sum
+                        totals[1] += count
 
             data_dict = {}
-            for sensor_name, hour_str, avg_temp in results:
+            for sensor_name, hour_dt, temp_sum, sample_count in rollups:
                 if sensor_name not in data_dict:
                     data_dict[sensor_name] = {}
+                data_dict[sensor_name][hour_dt] = temp_sum / sample_count
 
-                hour_dt = datetime.strptime(hour_str, '%Y-%m-%d %H:%M:%S')
-                data_dict[sensor_name][hour_dt] = float(avg_temp)
+            for sensor_name, (temp_sum, count) in partial.items():
+                if sensor_name not in data_dict:
+                    data_dict[sensor_name] = {}
+                data_dict[sensor_name][current_hour] = temp_sum / count
 
             return data_dict
 
@@ -171,44 +659,87 @@ def get_hourly_average_temperature() -> Dict[str, Dict[datetime, float]]:
         return {}
 
 
-def plot_temperature_graph(save_path: str = 'temperature_graph.png') -> None:
-    configure_korean_font()  # 한글 폰트 설정 호출
+def get_last_data_id() -> int:
+    '''
+    가장 최근 data_id (그래프 캐시 무효화 기준, 데이터가 없으면 0)
 
-    # 데이터 조회
-    data_dict = get_hourly_average_temperature()
+    파티션 테이블을 쓰면 테이블별 최대 data_id 의 합을 반환하므로,
+    지난 기간 테이블에 늦게 들어온 데이터도 값 변화로 감지됨.
+    '''
+    with get_db_session() as session:
+        return sum(session.execute(select(func.max(table.c.data_id))).scalar() or 0
+                   for table in db_config.read_tables())
 
-    if not data_dict:
-        print('그래프 생성 실패: 데이터가 없습니다')
-        return
 
-    plt.figure(figsize=(14, 7))
+def load_temperature_series(sensor_names: List[str] | None = None,
+                            start_time: datetime | None = None,
+                            end_time: datetime | None = None,
+                            width_px: int = DEFAULT_WIDTH_PX) -> Series:
+    '''
+    그래프용 센서별 시간별 평균 온도 시리즈 (width_px 점 이하로 LTTB 다운샘플링)
+
+    (센서 집합, 기간, 폭, 마지막 data_id) 가 같으면 DB 를 다시 조회하지 않고 캐시를 반환함.
+    '''
+    try:
+        key = (tuple(sorted(sensor_names)) if sensor_names else None,
+               start_time, end_time, width_px, get_last_data_id())
+    except Exception as e:
+        print(f'그래프 데이터 조회 오류: {e}')
+        return {}
 
-    for sensor_name, hour_temps in data_dict.items():
-        hours = sorted(hour_temps.keys())
-        temps = [hour_temps[h] for h in hours]
+    series = series_cache.get(key)
+    if series is None:
+        series = downsample_series(
+            get_hourly_average_temperature(sensor_names, start_time, end_time), width_px)
+        if series:
+            series_cache.put(key, series)
+    return series
 
-        plt.plot(hours, temps, marker='o', label=sensor_name, linewidth=2)
 
-    plt.title('센서별 시간별 평균 온도', fontsize=16, fontweight='bold')
-    plt.xlabel('시간 (시)', fontsize=12)
-    plt.ylabel('평균 온도 (°C)', fontsize=12)
-    plt.legend(loc='best', fontsize=10)
-    plt.grid(True, alpha=0.3)
+def plot_temperature_graph(save_path: str = 'temperature_graph.png',
+                           sensor_names: List[str] | None = None,
+                           start_time: datetime | None = None,
+                           end_time: datetime | None = None,
+                           show: bool = True) -> None:
+    configure_korean_font()  # 한글 폰트 설정 호출
 
-    ax = plt.gca()
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
-    plt.xticks(rotation=45, ha='right')
+    # 데이터 조회 (캐시 적중 시 DB 집계 조회 생략)
+    series = load_temperature_series(sensor_names, start_time, end_time)
 
-    plt.ylim(19, 31)
+    if not series:
+        print('그래프 생성 실패: 데이터가 없습니다')
+        return
 
-    plt.tight_layout()
+    fig = plt.figure(figsize=FIGSIZE)
+    ax = fig.add_subplot()
+    draw_temperature_lines(ax, series, '센서별 시간별 평균 온도')
+    fig.tight_layout()
 
-    plt.savefig(save_path, dpi=150, bbox_inches='tight')
+    fig.savefig(save_path, dpi=SAVE_DPI, bbox_inches='tight')
     print(f'그래프 저장 완료: {save_path}')
 
-    plt.show()
+    if show:
+        plt.show()
+
+    plt.close(fig)
 
-    plt.close()
+
+def render_temperature_pngs(output_dir: str = 'temperature_graphs',
+                            sensor_names: List[str] | None = None,
+                            start_time: datetime | None = None,
+                            end_time: datetime | None = None,
+                            processes: int | None = None) -> List[str]:
+    '''헤드리스 배치 모드: 센서별 온도 그래프 PNG 를 프로세스 풀에서 병렬 저장'''
+    configure_korean_font()
+    series = load_temperature_series(sensor_names, start_time, end_time)
+    if not series:
+        print('그래프 생성 실패: 데이터가 없습니다')
+        return []
+
+    rc_params = {key: plt.rcParams[key] for key in ('font.family', 'axes.unicode_minus')}
+    paths = render_sensor_pngs(series, output_dir, processes, rc_params)
+    print(f'센서별 그래프 {len(paths)}개 저장 완료: {output_dir}')
+    return paths
 
 
 def sensor_producer(sensor: FarmSensor) -> None:
@@ -231,12 +762,19 @@ def sensor_producer(sensor: FarmSensor) -> None:
                 'humidity': humi
             }
 
+            put_start = time.perf_counter()
+            was_full = True
             try:
-                # Queue가 가득 차면 최대 5초 대기
-                sensor_queue.put(sensor_data, block=True, timeout=5)
-                print(f'  → Queue 저장 완료 (크기: {sensor_queue.qsize()})')
+                # Queue가 가득 찼거나 spill 재생 중이면 대기 없이 디스크 세그먼트에 기록
+                was_full = not spill_queue.offer(sensor_queue, sensor_data)
+                if was_full:
+                    print(f'  → Spill 파일 저장 (대기 세그먼트: {spill_queue.pending_segments()})')
+                else:
+                    print(f'  → Queue 저장 완료 (크기: {sensor_queue.qsize()})')
             except Exception as e:
                 print(f'  → Queue 저장 실패: {e}')
+            finally:
+                pipeline_stats.record_put(time.perf_counter() - put_start, was_full)
 
             time.sleep(SENSOR_INTERVAL)
 
@@ -246,55 +784,387 @@ def sensor_producer(sensor: FarmSensor) -> None:
         db_config.remove_session()
 
 
-def db_consumer() -> None:
+def fleet_producer(fleet: FarmSensorFleet, interval: float = SENSOR_INTERVAL,
+                   stop_evt: threading.Event | None = None, verbose: bool = True) -> None:
+    '''
+    FarmSensorFleet 생산자: interval 마다 전체 센서를 한 번에 갱신해 SensorBatch 1개를 Queue 에 넣음
+
+    Queue 가 가득 찼거나 spill 재생 중이면 sensor_producer 와 같이 spill 파일에 기록함.
+    '''
+    next_time = time.monotonic()
     try:
-        while True:
+        while stop_evt is None or not stop_evt.is_set():
+            fleet.tick()
+            batch = fleet.record_batch()
+
+            put_start = time.perf_counter()
+            was_full = True
             try:
-                # Queue에서 데이터 가져오기 (타임아웃 1초)
-                sensor_data = sensor_queue.get(block=True, timeout=QUEUE_CHECK_INTERVAL)
-
-                # DB에 저장
-                data_id = insert_sensor_data(
-                    sensor_name=sensor_data['sensor_name'],
-                    input_time=sensor_data['input_time'],
-                    temperature=sensor_data['temperature'],
-                    illuminance=sensor_data['illuminance'],
-                    humidity=sensor_data['humidity']
-                )
-
-                if data_id:
-                    print(f'[DB Writer] {sensor_data["sensor_name"]} 데이터 '
-                          f'DB 저장 완료 (ID: {data_id}, Queue 남은 개수: {sensor_queue.qsize()})')
-                else:
-                    print(f'[DB Writer] {sensor_data["sensor_name"]} DB 저장 실패')
+                was_full = not spill_queue.offer(sensor_queue, batch)
+                if verbose:
+                    target = 'Spill 파일' if was_full else f'Queue (크기: {sensor_queue.qsize()})'
+                    print(f'{batch.input_time:%Y-%m-%d %H:%M:%S} Fleet -- {len(batch)}건 → {target}')
+            except Exception as e:
+                print(f'  → Queue 저장 실패: {e}')
+            finally:
+                pipeline_stats.record_put(time.perf_counter() - put_start, was_full)
+
+            next_time += interval
+            delay = next_time - time.monotonic()
+            if delay < 0:
+                next_time = time.monotonic()
+                delay = 0
+            if stop_evt is not None:
+                stop_evt.wait(delay)
+            else:
+                time.sleep(delay)
+
+    except KeyboardInterrupt:
+        pass
+    finally:
+        db_config.remove_session()
+
+
+def _drain_batch(first_item: QueueItem, batch_size: int, max_latency_ms: float) -> List[QueueItem]:
+    '''
+    첫 항목 이후 batch_size 행이 찰 때까지, 최대 max_latency_ms 동안 Queue 에서 추가로 꺼냄
+
+    SensorBatch 항목은 포함된 행 수만큼 센다.
+    '''
+    batch = [first_item]
+    row_count = _item_rows(first_item)
+    deadline = time.monotonic() + max_latency_ms / 1000
+    while row_count < batch_size:
+        # 이미 쌓여 있는 항목은 대기 없이 꺼냄
+        try:
+            item = sensor_queue.get_nowait()
+        except Empty:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = sensor_queue.get(block=True, timeout=remaining)
+            except Empty:
+                break
+        batch.append(item)
+        row_count += _item_rows(item)
+    return batch
+
+
+def _batch_row_limit(first_item: QueueItem, batch_size: int) -> int:
+    '''
+    batch_size(행 수)를 Queue 에 동시에 쌓일 수 있는 행 수(maxsize x 항목당 행 수)로 제한
 
-                sensor_queue.task_done()
+    그보다 크면 batch_size 행이 모일 수 없어 배치마다 max_latency_ms 를 다 기다리게 됨.
+    SensorBatch 항목은 1개에 여러 행이 들어 있으므로 항목 수가 아니라 행 수로 비교함.
+    '''
+    if sensor_queue.maxsize <= 0:
+        return batch_size
+    return min(batch_size, sensor_queue.maxsize * _item_rows(first_item))
+
+
+def _write_batch(batch: List[QueueItem]) -> int:
+    '''
+    배치 저장 후 통계 갱신, Queue task_done 처리
+
+    저장에 실패하면 배치와 Queue 에 남은 데이터를 spill 세그먼트 맨 앞에 기록하므로 버리지 않음.
+    '''
+    start = time.perf_counter()
+    saved = insert_sensor_data_batch(batch)
+    elapsed = time.perf_counter() - start
+
+    pipeline_stats.batches += 1
+    pipeline_stats.commit_time_total += elapsed
+    if saved:
+        pipeline_stats.rows += saved
+    else:
+        try:
+            pipeline_stats.spilled_rows += spill_queue.spill_front(sensor_queue, batch)
+        except OSError as e:
+            print(f'[DB Writer] Spill 파일 기록 실패: {e}')
+            pipeline_stats.failed_rows += sum(_item_rows(item) for item in batch)
+
+    for _ in batch:
+        sensor_queue.task_done()
+    return saved
+
+
+_last_partition_maintenance = time.monotonic()
+
+
+def _maybe_maintain_partitions() -> None:
+    '''파티션 사용 시 PARTITION_MAINTENANCE_INTERVAL 마다 미래 파티션 생성 / 보존 기간 정리'''
+    global _last_partition_maintenance
+    if db_config.partitions is None:
+        return
+    now = time.monotonic()
+    if now - _last_partition_maintenance < PARTITION_MAINTENANCE_INTERVAL:
+        return
+    _last_partition_maintenance = now
+    try:
+        db_config.partitions.maintain()
+    except Exception as e:
+        print(f'[Partition] 파티션 관리 오류: {e}')
+
+
+def _replay_spill(verbose: bool = True) -> bool:
+    '''
+    가장 오래된 spill 세그먼트 1개를 한 트랜잭션으로 재생
+
+    Returns:
+        False: DB 저장 실패 (세그먼트는 그대로 두고 나중에 재시도)
+    '''
+    path = spill_queue.take_segment()
+    if path is None:
+        return True
+    rows = spill_queue.read_segment(path)
+    if rows and not insert_sensor_data_batch(rows):
+        return False
+    spill_queue.remove_segment(path)
+    pipeline_stats.replayed_rows += len(rows)
+    if verbose:
+        print(f'[DB Writer] Spill 세그먼트 {len(rows)}건 재생 완료 '
+              f'(남은 세그먼트: {spill_queue.pending_segments()})')
+    return True
+
+
+def db_consumer(batch_size: int = BATCH_SIZE,
+                max_latency_ms: float = BATCH_MAX_LATENCY_MS,
+                verbose: bool = True,
+                stop_evt: Optional[threading.Event] = None) -> None:
+    '''
+    배치 DB writer
+
+    최대 batch_size 건 또는 max_latency_ms 중 먼저 도달하는 조건으로 배치를 만들어
+    한 번의 트랜잭션으로 저장함. spill 세그먼트는 메모리 Queue 가 빈 뒤에 순서대로 재생함.
+    stop_evt 가 설정되면 남은 Queue / spill 데이터를 모두 저장한 뒤 반환함 (없으면 Ctrl+C 까지 실행).
+    '''
+    capped_rows = None
+    try:
+        while stop_evt is None or not stop_evt.is_set():
+            _maybe_maintain_partitions()
+            if spill_queue.has_pending() and sensor_queue.empty():
+                if not _replay_spill(verbose):
+                    print(f'[DB Writer] Spill 재생 실패, {SPILL_RETRY_INTERVAL}초 후 재시도')
+                    time.sleep(SPILL_RETRY_INTERVAL)
+                continue
 
+            try:
+                # Queue에서 첫 데이터 가져오기 (타임아웃 1초)
+                first_item = sensor_queue.get(block=True, timeout=QUEUE_CHECK_INTERVAL)
             except Empty:
-                pass
+                continue
+
+            depth = sensor_queue.qsize() + 1
+            pipeline_stats.max_queue_depth = max(pipeline_stats.max_queue_depth, depth)
+
+            row_limit = _batch_row_limit(first_item, batch_size)
+            if row_limit < batch_size and row_limit != capped_rows:
+                capped_rows = row_limit
+                print(f'[DB Writer] 배치 크기({batch_size}행)가 Queue 에 쌓일 수 있는 행 수'
+                      f'({row_limit}행)보다 커서 {row_limit}행으로 조정합니다.')
+            batch = _drain_batch(first_item, row_limit, max_latency_ms)
+            saved = _write_batch(batch)
+
+            if verbose:
+                if saved:
+                    print(f'[DB Writer] {saved}건 일괄 저장 완료 '
+                          f'(Queue 남은 개수: {sensor_queue.qsize()})')
+                else:
+                    print(f'[DB Writer] {len(batch)}건 DB 저장 실패')
 
     except KeyboardInterrupt:
         pass
     finally:
         print('\n[DB Writer] 남은 Queue 데이터 처리 중...')
-        while not sensor_queue.empty():
+        while True:
             try:
-                sensor_data = sensor_queue.get_nowait()
-                insert_sensor_data(
-                    sensor_name=sensor_data['sensor_name'],
-                    input_time=sensor_data['input_time'],
-                    temperature=sensor_data['temperature'],
-                    illuminance=sensor_data['illuminance'],
-                    humidity=sensor_data['humidity']
-                )
-                sensor_queue.task_done()
+                first_item = sensor_queue.get_nowait()
             except Empty:
                 break
+            _write_batch(_drain_batch(first_item, batch_size, 0))
+        while spill_queue.has_pending() and _replay_spill(verbose):
+            pass
+        spill_queue.close()
 
         print('[DB Writer] Queue 처리 완료')
+        print(f'[DB Writer] 통계: {pipeline_stats.summary()}')
         db_config.remove_session()
 
 
+def benchmark_batch_writer(rows: int = 5000, batch_size: int = BATCH_SIZE) -> Dict[str, float]:
+    '''
+    로컬 SQLite 로 행 단위 저장과 배치 저장의 처리량(rows/s) 비교
+
+    MariaDB 대신 임시 SQLite 파일을 사용하도록 전역 db_config 를 잠시 교체함.
+    '''
+    global db_config
+    original_config = db_config
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_config = DatabaseConfig(f'sqlite:///{os.path.join(tmp_dir, "bench.db")}')
+        try:
+            db_config.create_tables()
+            now = datetime.now()
+            readings = [
+                {
+                    'sensor_name': f'Farm-{i % SENSOR_COUNT + 1}',
+                    'input_time': now + timedelta(seconds=i),
+                    'temperature': random.randint(20, 30),
+                    'illuminance': random.randint(5000, 10000),
+                    'humidity': random.randint(40, 70)
+                }
+                for i in range(rows)
+            ]
+
+            # 1) 기존 방식: 행마다 세션 + ORM 객체 + 커밋
+            start = time.perf_counter()
+            for reading in readings:
+                insert_sensor_data(**reading)
+            results['row_by_row'] = rows / (time.perf_counter() - start)
+
+            # 2) 배치 방식: Queue + 배치 consumer 스레드
+            consumer = threading.Thread(
+                target=db_consumer,
+                kwargs={'batch_size': batch_size, 'max_latency_ms': 50, 'verbose': False},
+                daemon=True
+            )
+            consumer.start()
+            start = time.perf_counter()
+            for reading in readings:
+                sensor_queue.put(reading)
+            sensor_queue.join()
+            results['batched'] = rows / (time.perf_counter() - start)
+        finally:
+            db_config.dispose_engine()
+            db_config = original_config
+
+    for name, rate in results.items():
+        print(f'{name:<12} {rate:>12,.1f} rows/s')
+    print(f'배치 통계: {pipeline_stats.summary()}')
+    return results
+
+
+def benchmark_reader(rows: int = 100000) -> Dict[str, Dict[str, float]]:
+    '''
+    로컬 SQLite 로 get_sensor_data(.all()) 와 스트리밍 조회의 시간과 최대 메모리(tracemalloc) 비교
+
+    시간은 tracemalloc 추적 오버헤드가 포함된 값이므로 방식 간 상대 비교용.
+    '''
+    import tracemalloc
+
+    global db_config
+    original_config = db_config
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_config = DatabaseConfig(f'sqlite:///{os.path.join(tmp_dir, "bench.db")}')
+        try:
+            db_config.create_tables()
+            now = datetime.now()
+            readings = [
+                {
+                    'sensor_name': f'Farm-{i % SENSOR_COUNT + 1}',
+                    'input_time': now + timedelta(seconds=i),
+                    'temperature': random.randint(20, 30),
+                    'illuminance': random.randint(5000, 10000),
+                    'humidity': random.randint(40, 70)
+                }
+                for i in range(rows)
+            ]
+            for i in range(0, rows, 5000):
+                insert_sensor_data_batch(readings[i:i + 5000])
+            del readings
+
+            def read_all():
+                return sum(r.temperature for r in get_sensor_data())
+
+            def read_rows(keyset):
+                return lambda: sum(row.temperature for rows in iter_sensor_data(keyset=keyset) for row in rows)
+
+            def read_arrays():
+                return int(sum(chunk['temperature'].sum() for chunk in iter_sensor_arrays()))
+
+            for name, reader in (('orm_all', read_all), ('yield_per', read_rows(False)),
+                                 ('keyset', read_rows(True)), ('numpy_chunks', read_arrays)):
+                tracemalloc.start()
+                start = time.perf_counter()
+                total = reader()
+                elapsed = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                results[name] = {'seconds': elapsed, 'peak_mb': peak / 1024 / 1024, 'checksum': total}
+        finally:
+            db_config.dispose_engine()
+            db_config = original_config
+
+    for name, result in results.items():
+        print(f'{name:<14} {result["seconds"]:>7.2f}s  peak {result["peak_mb"]:>8.2f} MB  '
+              f'(checksum {result["checksum"]})')
+    return results
+
+
+def benchmark_fleet(sensors: int = 10000, ticks: int = 10) -> Dict[str, Dict[str, float]]:
+    '''
+    로컬 SQLite 로 FarmSensor + dict 방식과 FarmSensorFleet + SensorBatch 방식의
+    tick 당 생성 시간과 저장 처리량 비교
+    '''
+    global db_config
+    original_config = db_config
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_config = DatabaseConfig(f'sqlite:///{os.path.join(tmp_dir, "bench.db")}')
+        try:
+            db_config.create_tables()
+            base = datetime.now()
+
+            farm_sensors = [FarmSensor(f'Farm-{i}') for i in range(1, sensors + 1)]
+            fleet = FarmSensorFleet(sensors, seed=7)
+
+            def object_tick(tick):
+                rows = []
+                for sensor in farm_sensors:
+                    sensor.set_data()
+                    temp, light, humi = sensor.get_data()
+                    rows.append({
+                        'sensor_name': sensor.sensor_name,
+                        'input_time': base + timedelta(seconds=tick),
+                        'temperature': temp,
+                        'illuminance': light,
+                        'humidity': humi
+                    })
+                return rows
+
+            def fleet_tick(tick):
+                fleet.tick()
+                return [fleet.record_batch(base + timedelta(seconds=tick))]
+
+            for name, make_rows in (('objects_dicts', object_tick), ('fleet_batches', fleet_tick)):
+                gen_time = write_time = 0.0
+                saved = 0
+                for tick in range(ticks):
+                    start = time.perf_counter()
+                    rows = make_rows(tick)
+                    gen_time += time.perf_counter() - start
+                    start = time.perf_counter()
+                    saved += insert_sensor_data_batch(rows)
+                    write_time += time.perf_counter() - start
+                results[name] = {
+                    'gen_ms_per_tick': gen_time / ticks * 1000,
+                    'write_rows_per_s': saved / write_time if write_time else 0.0,
+                }
+        finally:
+            db_config.dispose_engine()
+            db_config = original_config
+
+    for name, result in results.items():
+        print(f'{name:<14} 생성 {result["gen_ms_per_tick"]:>8.2f} ms/tick  '
+              f'저장 {result["write_rows_per_s"]:>10,.1f} rows/s')
+    return results
+
+
 def main() -> None:
     print('=== 스마트 팜 센서 모니터링 시스템 (Queue + SQLAlchemy) ===')
 
@@ -347,4 +1217,16 @@ def main() -> None:
 
 
 if __name__ == '__main__':
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        benchmark_batch_writer()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'bench-read':
+        benchmark_reader()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'bench-fleet':
+        benchmark_fleet(int(sys.argv[2]) if len(sys.argv) > 2 else 10000)
+    elif len(sys.argv) > 1 and sys.argv[1] == 'render':
+        render_temperature_pngs()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'rebuild-rollup':
+        db_config.create_tables()
+        rebuild_hourly_rollup()
+    else:
+        main()
@@ -0,0 +1,196 @@
+'''
+메모리 Queue 포화 / DB 장애 시 센서 데이터를 로컬 세그먼트 파일로 넘기는 spill 저장소
+
+- 세그먼트: spill_{번호}.jsonl, 한 줄에 센서 데이터 1건, 추가 쓰기만 함
+  (to_dicts() 가 있는 묶음 항목은 행 단위로 펼쳐서 기록)
+- spill 모드가 켜지면 모든 생산자가 파일에만 기록하고, 메모리 Queue 를 모두 비운 뒤
+  consumer 가 번호 순으로 세그먼트를 재생하므로 센서별 순서가 유지됨
+- 메모리에는 Queue 최대 크기 + 재생 중인 세그먼트 1개(segment_rows 행)만 올라옴
+'''
+
+import json
+import os
+import threading
+from datetime import datetime
+from queue import Queue, Empty
+from typing import Dict, List, Optional
+
+SPILL_DIR = 'sensor_spill'
+SPILL_SEGMENT_ROWS = 5000  # 세그먼트 1개(= 재생 트랜잭션 1개)의 최대 행 수
+_FIRST_SEQ = 1_000_000_000  # 앞쪽 세그먼트(spill_front)용 번호 여유
+
+
+class SpillQueue:
+    '''
+    메모리 Queue 앞단의 write-ahead spill 저장소
+
+    생산자는 offer(), consumer 는 spill_front() / take_segment() / remove_segment() 사용.
+    Queue 투입 여부 판단과 파일 기록을 같은 lock 안에서 처리하므로 모드 전환 중에도
+    한 센서의 데이터가 메모리와 파일 사이에서 순서가 뒤바뀌지 않음.
+    '''
+
+    def __init__(self, spill_dir: str = SPILL_DIR, segment_rows: int = SPILL_SEGMENT_ROWS):
+        self.spill_dir = spill_dir
+        self.segment_rows = segment_rows
+        self._lock = threading.Lock()
+        self._segments: List[int] = []  # 닫힌(재생 대기) 세그먼트 번호, 오름차순
+        self._current_seq: Optional[int] = None
+        self._current_file = None
+        self._current_rows = 0
+        self.rows_written = 0  # 이번 실행에서 spill 파일에 기록한 누적 행 수 (생산자 + spill_front)
+
+        # 이전 실행에서 남은 세그먼트가 있으면 그것부터 재생
+        if os.path.isdir(spill_dir):
+            for name in os.listdir(spill_dir):
+                if name.startswith('spill_') and name.endswith('.jsonl'):
+                    self._segments.append(int(name[6:-6]))
+            self._segments.sort()
+        self._next_seq = self._segments[-1] + 1 if self._segments else _FIRST_SEQ
+        self.active = bool(self._segments)
+
+    def _path(self, seq: int) -> str:
+        return os.path.join(self.spill_dir, f'spill_{seq:010d}.jsonl')
+
+    @staticmethod
+    def _records(item) -> List[Dict]:
+        '''Queue 항목을 센서 데이터 dict 목록으로 (묶음 항목은 to_dicts() 로 펼침)'''
+        return item.to_dicts() if hasattr(item, 'to_dicts') else [item]
+
+    @staticmethod
+    def _encode(item: Dict) -> str:
+        record = dict(item)
+        record['input_time'] = record['input_time'].isoformat()
+        return json.dumps(record, ensure_ascii=False) + '\n'
+
+    def _append(self, item) -> None:
+        '''현재 세그먼트에 Queue 항목 1개 추가 (lock 보유 상태에서 호출)'''
+        if self._current_file is None:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            self._current_seq = self._next_seq
+            self._next_seq += 1
+            self._current_file = open(self._path(self._current_seq), 'a', encoding='utf-8')
+        records = self._records(item)
+        self._current_file.writelines(self._encode(record) for record in records)
+        self._current_file.flush()
+        self._current_rows += len(records)
+        self.rows_written += len(records)
+        if self._current_rows >= self.segment_rows:
+            self._close_current()
+
+    def _close_current(self) -> None:
+        if self._current_file is None:
+            return
+        self._current_file.close()
+        self._segments.append(self._current_seq)
+        self._current_file = None
+        self._current_seq = None
+        self._current_rows = 0
+
+    def offer(self, queue: Queue, item) -> bool:
+        '''
+        생산자용: Queue 에 여유가 있고 spill 모드가 아니면 Queue 에, 아니면 파일에 저장 (대기 없음)
+
+        Returns:
+            True: 메모리 Queue 에 저장, False: spill 파일에 저장
+        '''
+        with self._lock:
+            if not self.active and not queue.full():
+                queue.put_nowait(item)
+                return True
+            self.active = True
+            self._append(item)
+            return False
+
+    def spill_front(self, queue: Queue, items: List) -> int:
+        '''
+        consumer 용: 저장 실패한 배치와 Queue 에 남은 데이터를 기존 세그먼트보다 앞에 기록
+
+        DB 장애 시 호출되며, 이후 생산자는 모두 파일로 기록함 (Queue 에서 꺼낸 항목은 task_done 처리).
+
+        Returns:
+            기록한 행 수
+        '''
+        with self._lock:
+            self.active = True
+            drained = []
+            while True:
+                try:
+                    drained.append(queue.get_nowait())
+                except Empty:
+                    break
+            rows = [record for item in list(items) + drained for record in self._records(item)]
+            if rows:
+                os.makedirs(self.spill_dir, exist_ok=True)
+                known = self._segments + ([self._current_seq] if self._current_seq is not None else [])
+                seq = (min(known) if known else self._next_seq) - 1
+                with open(self._path(seq), 'w', encoding='utf-8') as f:
+                    f.writelines(self._encode(item) for item in rows)
+                self._segments.insert(0, seq)
+                self.rows_written += len(rows)
+            for _ in drained:
+                queue.task_done()
+            return len(rows)
+
+    def append(self, items: List) -> int:
+        '''
+        consumer 용: 저장 실패한 배치를 기존 세그먼트 뒤에 기록 (Queue 를 건드리지 않음)
+
+        실패한 배치를 도착 순서대로 이어 붙이므로 여러 번 실패해도 재생 순서가 유지됨.
+
+        Returns:
+            기록한 행 수
+        '''
+        with self._lock:
+            self.active = True
+            before = self.rows_written
+            for item in items:
+                self._append(item)
+            return self.rows_written - before
+
+    def has_pending(self) -> bool:
+        return self.active
+
+    def take_segment(self) -> Optional[str]:
+        '''
+        consumer 용: 재생할 가장 오래된 세그먼트 경로 (없으면 spill 모드 해제 후 None)
+
+        닫힌 세그먼트가 없으면 기록 중인 세그먼트를 닫아서 넘김.
+        반환된 세그먼트는 remove_segment() 전까지 계속 가장 앞에 남아 있으므로 실패 시 재시도 가능.
+        '''
+        with self._lock:
+            if not self._segments:
+                if self._current_rows == 0:
+                    self.active = False
+                    return None
+                self._close_current()
+            return self._path(self._segments[0])
+
+    @staticmethod
+    def read_segment(path: str) -> List[Dict]:
+        '''세그먼트 파일을 센서 데이터 dict 목록으로 읽음 (비정상 종료로 잘린 마지막 줄은 무시)'''
+        rows = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    print(f'[Spill] 손상된 줄 건너뜀: {path}')
+                    continue
+                record['input_time'] = datetime.fromisoformat(record['input_time'])
+                rows.append(record)
+        return rows
+
+    def remove_segment(self, path: str) -> None:
+        '''재생(커밋) 완료된 세그먼트 삭제'''
+        with self._lock:
+            self._segments.remove(int(os.path.basename(path)[6:-6]))
+        os.remove(path)
+
+    def pending_segments(self) -> int:
+        with self._lock:
+            return len(self._segments) + (1 if self._current_rows else 0)
+
+    def close(self) -> None:
+        '''기록 중인 세그먼트 닫기 (남은 데이터는 다음 실행에서 재생)'''
+        with self._lock:
+            self._close_current()
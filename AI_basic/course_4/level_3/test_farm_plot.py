@@ -0,0 +1,92 @@
+'''farm_plot 의 LTTB 다운샘플링과 시리즈 캐시 확인'''
+
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from farm_plot import SeriesCache, downsample_series, lttb_downsample
+
+
+def _reference_lttb(x, y, threshold):
+    '''원 논문(Steinarsson, 2013) 의사 코드를 그대로 옮긴 반복문 구현'''
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+    every = (n - 2) / (threshold - 2)
+    selected = [0]
+    a = 0
+    for i in range(threshold - 2):
+        avg_start = math.floor((i + 1) * every) + 1
+        avg_end = min(math.floor((i + 2) * every) + 1, n)
+        avg_x = sum(x[avg_start:avg_end]) / (avg_end - avg_start)
+        avg_y = sum(y[avg_start:avg_end]) / (avg_end - avg_start)
+
+        best, best_area = None, -1.0
+        for j in range(math.floor(i * every) + 1, math.floor((i + 1) * every) + 1):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a])) * 0.5
+            if area > best_area:
+                best, best_area = j, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return selected
+
+
+@pytest.mark.parametrize('n, threshold', [(10, 3), (100, 7), (1000, 100), (2101, 2100), (5000, 333)])
+def test_lttb_matches_reference(n, threshold):
+    rng = np.random.default_rng(n + threshold)
+    x = np.cumsum(rng.uniform(0.5, 2.0, size=n))
+    y = np.cumsum(rng.normal(0, 1, size=n))
+
+    sx, sy = lttb_downsample(x, y, threshold)
+    indices = _reference_lttb(x.tolist(), y.tolist(), threshold)
+    np.testing.assert_array_equal(sx, x[indices])
+    np.testing.assert_array_equal(sy, y[indices])
+
+
+def test_lttb_keeps_endpoints_order_and_spikes():
+    x = np.arange(10000, dtype=np.float64)
+    y = np.sin(x / 500)
+    y[4321] = 50.0  # 단일 피크
+    y[8765] = -50.0
+
+    sx, sy = lttb_downsample(x, y, 200)
+    assert len(sx) == 200
+    assert sx[0] == x[0] and sx[-1] == x[-1]
+    assert np.all(np.diff(sx) > 0)
+    assert 4321 in sx and 8765 in sx
+
+
+@pytest.mark.parametrize('threshold', [0, 2, 50, 80])
+def test_lttb_returns_input_when_nothing_to_reduce(threshold):
+    x = np.arange(50, dtype=np.float64)
+    y = x * 2
+    sx, sy = lttb_downsample(x, y, threshold)
+    assert sx is x and sy is y
+
+
+def test_downsample_series_sorts_hours_and_limits_points():
+    start = datetime(2025, 3, 1)
+    hours = [start + timedelta(hours=h) for h in range(500)]
+    data = {'Farm-1': {hour: float(i % 24) for i, hour in reversed(list(enumerate(hours)))},
+            'Farm-2': {start: 21.0}}
+
+    series = downsample_series(data, width_px=50)
+    x, y = series['Farm-1']
+    assert len(x) == 50 and np.all(np.diff(x) > 0)
+    assert y[0] == 0.0 and y[-1] == float(499 % 24)
+    assert len(series['Farm-2'][0]) == 1
+
+
+def test_series_cache_is_lru():
+    cache = SeriesCache(max_entries=2)
+    cache.put('a', {'Farm-1': 1})
+    cache.put('b', {'Farm-1': 2})
+    assert cache.get('a') == {'Farm-1': 1}  # a 가 최근 사용으로 이동
+    cache.put('c', {'Farm-1': 3})
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert (cache.hits, cache.misses) == (3, 1)
@@ -0,0 +1,108 @@
+'''시간별 롤업(parm_data_hourly)이 원본 parm_data GROUP BY 결과와 같은지 확인'''
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+import smart_farm_sensors_queue_sqlalchemy as queue_pipeline
+from database import ROLLUP_METRICS, ParmData, ParmHourlyRollup
+
+BASE_TIME = datetime(2025, 3, 1, 8, 0, 0)
+
+
+def _random_rows(count: int, seed: int, start: datetime = BASE_TIME, span_minutes: int = 300):
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        rows.append({
+            'sensor_name': f'Farm-{rng.randint(1, 3)}',
+            'input_time': start + timedelta(seconds=rng.randrange(span_minutes * 60)),
+            'temperature': rng.randint(20, 30),
+            'illuminance': rng.randint(5000, 10000),
+            'humidity': rng.randint(40, 70),
+        })
+    return rows
+
+
+def _raw_group_by(config):
+    '''원본 테이블을 (센서, 정시) 로 GROUP BY 한 결과'''
+    table = ParmData.__table__
+    hour = config.backend.hour_bucket(table.c.input_time)
+    columns = [func.count()]
+    for metric in ROLLUP_METRICS:
+        columns += [func.sum(table.c[metric]), func.min(table.c[metric]), func.max(table.c[metric])]
+    with config.engine.connect() as conn:
+        result = conn.execute(select(table.c.sensor_name, hour, *columns)
+                              .group_by(table.c.sensor_name, hour))
+        return {(name, datetime.strptime(hour_text, '%Y-%m-%d %H:%M:%S')): tuple(values)
+                for name, hour_text, *values in result}
+
+
+def _rollup(config):
+    rollup = ParmHourlyRollup.__table__
+    columns = [rollup.c.sample_count]
+    for metric in ROLLUP_METRICS:
+        columns += [rollup.c[f'{metric}_sum'], rollup.c[f'{metric}_min'], rollup.c[f'{metric}_max']]
+    with config.engine.connect() as conn:
+        result = conn.execute(select(rollup.c.sensor_name, rollup.c.hour, *columns))
+        return {(name, hour): tuple(values) for name, hour, *values in result}
+
+
+def test_rollup_matches_raw_group_by(farm_db):
+    config = farm_db()
+    rows = _random_rows(600, seed=1)
+    # 같은 (센서, 정시) 가 여러 배치에 나뉘어 들어가도 UPSERT 로 합쳐져야 함
+    for i in range(0, 500, 70):
+        assert queue_pipeline.insert_sensor_data_batch(rows[i:i + 70]) == len(rows[i:i + 70])
+    for row in rows[500:]:
+        assert queue_pipeline.insert_sensor_data(**row) is not None
+
+    # 벡터화 fleet 경로(SensorBatch)도 같은 롤업을 갱신
+    fleet = queue_pipeline.FarmSensorFleet(3, seed=2)
+    batches = []
+    for minute in range(0, 240, 7):
+        fleet.tick()
+        batches.append(fleet.record_batch(BASE_TIME + timedelta(minutes=minute, seconds=30)))
+    assert queue_pipeline.insert_sensor_data_batch(batches) == 3 * len(batches)
+
+    raw = _raw_group_by(config)
+    assert len(raw) == 15  # 센서 3개 x 5시간
+    assert _rollup(config) == raw
+
+
+def test_rebuild_reproduces_incremental_rollup(farm_db):
+    config = farm_db()
+    assert queue_pipeline.insert_sensor_data_batch(_random_rows(400, seed=3)) == 400
+    incremental = _rollup(config)
+
+    assert queue_pipeline.rebuild_hourly_rollup() == len(incremental)
+    assert _rollup(config) == incremental == _raw_group_by(config)
+
+
+def test_hourly_average_combines_rollup_and_current_hour(farm_db):
+    config = farm_db()
+    past = _random_rows(300, seed=4)
+    current_hour = datetime.now().replace(minute=0, second=0, microsecond=0)
+    # 아직 끝나지 않은 현재 시간대는 원본에서 직접 집계
+    current = _random_rows(20, seed=5, start=current_hour, span_minutes=1)
+    assert queue_pipeline.insert_sensor_data_batch(past + current) == 320
+
+    averages = queue_pipeline.get_hourly_average_temperature()
+    raw = _raw_group_by(config)
+    expected = {}
+    for (name, hour), values in raw.items():
+        count, temp_sum = values[0], values[1]
+        expected.setdefault(name, {})[hour] = temp_sum / count
+    assert averages.keys() == expected.keys()
+    for name in expected:
+        assert averages[name] == pytest.approx(expected[name])
+    assert any(current_hour in hours for hours in averages.values())
+
+    # 센서 / 기간 필터
+    start, end = BASE_TIME + timedelta(hours=1), BASE_TIME + timedelta(hours=3)
+    filtered = queue_pipeline.get_hourly_average_temperature(['Farm-2'], start, end)
+    assert list(filtered) == ['Farm-2']
+    assert filtered['Farm-2'] == pytest.approx(
+        {hour: avg for hour, avg in expected['Farm-2'].items() if start <= hour <= end})
@@ -0,0 +1,151 @@
+'''SQLite 기간별 테이블 파티셔닝의 라우팅 / 조회 / 보존 정리 확인'''
+
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+
+import smart_farm_sensors_queue_sqlalchemy as queue_pipeline
+from database import ParmData, ParmHourlyRollup
+
+DAYS = 10
+
+
+def _today() -> datetime:
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _rows_over_days(days: int = DAYS, per_day: int = 6):
+    '''오늘 포함 최근 days 일, 하루 per_day 건 (센서 2개, 10시부터 2시간 간격)'''
+    rows = []
+    for day in range(days - 1, -1, -1):
+        start = _today() - timedelta(days=day) + timedelta(hours=10)
+        for i in range(per_day):
+            rows.append({
+                'sensor_name': f'Farm-{i % 2 + 1}',
+                'input_time': start + timedelta(hours=2 * (i // 2)),
+                'temperature': 20 + day,
+                'illuminance': 5000 + i,
+                'humidity': 50,
+            })
+    return rows
+
+
+def _period_bounds(config):
+    '''테이블별 (기간 시작, 최소/최대 input_time, 행 수)'''
+    manager = config.partitions
+    bounds = {}
+    with config.engine.connect() as conn:
+        for table in config.read_tables():
+            start = manager.scheme.parse_suffix(table.name[len(manager.prefix):])
+            bounds[start] = conn.execute(select(func.min(table.c.input_time), func.max(table.c.input_time),
+                                                func.count())).one()
+    return bounds
+
+
+def test_rows_are_routed_to_their_period_tables(farm_db):
+    config = farm_db(partitioning='day')
+    rows = _rows_over_days()
+    assert queue_pipeline.insert_sensor_data_batch(rows[:30]) == 30
+    for row in rows[30:40]:
+        assert queue_pipeline.insert_sensor_data(**row) is not None
+    fleet = queue_pipeline.FarmSensorFleet(2, seed=1)
+    fleet.tick()
+    batch_time = _today() - timedelta(days=2) + timedelta(hours=23, minutes=59)
+    assert queue_pipeline.insert_sensor_data_batch([fleet.record_batch(batch_time)] + rows[40:]) == 22
+
+    for start, (first, last, count) in _period_bounds(config).items():
+        if count:
+            assert start <= first and last < start + timedelta(days=1)
+    assert sum(count for *_, count in _period_bounds(config).values()) == len(rows) + 2
+    with config.engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(ParmData.__table__)).scalar() == 0
+
+    # 기간 번호 << 32 부터 시작하는 data_id 는 테이블이 달라도 겹치지 않고 기간 순으로 증가
+    data = queue_pipeline.get_sensor_data()
+    assert len(data) == len(rows) + 2
+    assert [d.input_time for d in data] == sorted(d.input_time for d in data)
+    by_time = sorted(data, key=lambda d: (d.input_time.date(), d.data_id))
+    assert [d.data_id for d in by_time] == sorted(d.data_id for d in data)
+
+
+def test_reads_only_touch_overlapping_periods(farm_db):
+    config = farm_db(partitioning='day')
+    rows = _rows_over_days()
+    queue_pipeline.insert_sensor_data_batch(rows)
+
+    start = _today() - timedelta(days=4) + timedelta(hours=11)
+    end = _today() - timedelta(days=2) + timedelta(hours=13)
+    tables = config.read_tables(start, end)
+    assert [t.name for t in tables] == [
+        f'{config.partitions.prefix}{(_today() - timedelta(days=d)):%Y%m%d}' for d in (4, 3, 2)]
+
+    expected = sorted((r['sensor_name'], r['input_time']) for r in rows
+                      if start <= r['input_time'] <= end and r['sensor_name'] == 'Farm-1')
+    streamed = [(row.sensor_name, row.input_time)
+                for chunk in queue_pipeline.iter_sensor_data('Farm-1', start, end, chunk_size=2)
+                for row in chunk]
+    assert streamed == expected
+    assert [(d.sensor_name, d.input_time) for d in queue_pipeline.get_sensor_data('Farm-1', start, end)] \
+        == expected
+
+
+def test_retention_drops_old_tables_and_their_rollup(farm_db):
+    config = farm_db(partitioning='day', retention_periods=3)
+    rows = _rows_over_days()
+    queue_pipeline.insert_sensor_data_batch(rows)
+    assert len(queue_pipeline.get_hourly_average_temperature()['Farm-1']) == DAYS * 3
+
+    result = config.partitions.maintain(datetime.now())
+    cutoff = _today() - timedelta(days=3)
+    assert len(result['dropped']) == DAYS - 4
+
+    kept = [r for r in rows if r['input_time'] >= cutoff]
+    assert len(queue_pipeline.get_sensor_data()) == len(kept)
+    with config.engine.connect() as conn:
+        oldest_hour = conn.execute(select(func.min(ParmHourlyRollup.hour))).scalar()
+        rollup_count = conn.execute(select(func.sum(ParmHourlyRollup.sample_count))).scalar()
+    assert oldest_hour >= cutoff
+    assert rollup_count == len(kept)
+    averages = queue_pipeline.get_hourly_average_temperature()
+    assert all(hour >= cutoff for hours in averages.values() for hour in hours)
+
+
+def test_existing_rows_move_into_period_tables(farm_db):
+    farm_db()
+    rows = _rows_over_days(days=3)
+    queue_pipeline.insert_sensor_data_batch(rows)
+
+    config = farm_db(partitioning='day')
+    with config.engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(ParmData.__table__)).scalar() == 0
+    assert sorted(d.input_time for d in queue_pipeline.get_sensor_data()) == \
+        sorted(r['input_time'] for r in rows)
+
+
+def test_read_tables_is_safe_while_tables_change(farm_db):
+    config = farm_db(partitioning='day', retention_periods=2)
+    manager = config.partitions
+    errors = []
+    stop = threading.Event()
+
+    def reader():
+        try:
+            while not stop.is_set():
+                config.read_tables()
+        except Exception as e:  # 반복 중 dict 크기 변경 등
+            errors.append(e)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    try:
+        for day in range(60, 0, -1):
+            manager.write_table(_today() - timedelta(days=day))
+            if day % 10 == 0:
+                manager.apply_retention(datetime.now())
+    finally:
+        stop.set()
+        thread.join()
+    assert errors == []
+    manager.apply_retention(datetime.now())
+    assert config.read_tables()[0].name == f'{manager.prefix}{(_today() - timedelta(days=2)):%Y%m%d}'
@@ -0,0 +1,90 @@
+'''Queue 기반 생산자 / 배치 writer 경로 확인'''
+
+import threading
+import time
+from datetime import datetime
+from queue import Queue
+
+import pytest
+
+import smart_farm_sensors_queue_sqlalchemy as queue_pipeline
+from spill_queue import SpillQueue
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    '''모듈 전역 Queue / spill / 통계를 테스트용으로 교체하는 팩토리 (인자는 Queue 최대 크기)'''
+    def make(maxsize: int) -> Queue:
+        sensor_queue = Queue(maxsize=maxsize)
+        monkeypatch.setattr(queue_pipeline, 'sensor_queue', sensor_queue)
+        monkeypatch.setattr(queue_pipeline, 'spill_queue', SpillQueue(str(tmp_path / 'spill')))
+        monkeypatch.setattr(queue_pipeline, 'pipeline_stats', queue_pipeline.PipelineStats())
+        return sensor_queue
+
+    return make
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_batch_row_limit_counts_rows_per_item(pipeline):
+    pipeline(maxsize=3)
+    fleet = queue_pipeline.FarmSensorFleet(30, seed=1)
+    reading = {'sensor_name': 'Farm-1', 'input_time': datetime.now(),
+               'temperature': 25, 'illuminance': 7000, 'humidity': 50}
+
+    # dict 항목은 Queue 에 최대 3행만 쌓이므로 3행으로 제한
+    assert queue_pipeline._batch_row_limit(reading, 50) == 3
+    # SensorBatch 항목은 3 x 30 = 90행까지 쌓일 수 있으므로 batch_size 그대로
+    assert queue_pipeline._batch_row_limit(fleet.record_batch(), 50) == 50
+    assert queue_pipeline._batch_row_limit(fleet.record_batch(), 100) == 90
+
+
+def test_db_consumer_does_not_shrink_sensor_batches(farm_db, pipeline):
+    farm_db()
+    sensor_queue = pipeline(maxsize=2)
+    fleet = queue_pipeline.FarmSensorFleet(30, seed=2)
+    for _ in range(2):
+        fleet.tick()
+        sensor_queue.put(fleet.record_batch())
+
+    stop_evt = threading.Event()
+    consumer = threading.Thread(target=queue_pipeline.db_consumer,
+                                kwargs={'batch_size': 50, 'max_latency_ms': 1000,
+                                        'verbose': False, 'stop_evt': stop_evt})
+    consumer.start()
+    try:
+        assert _wait_for(lambda: queue_pipeline.pipeline_stats.rows == 60)
+    finally:
+        stop_evt.set()
+        consumer.join()
+    # Queue 최대 크기(항목 2개)로 잘리지 않고 SensorBatch 2개가 한 배치로 저장됨
+    assert queue_pipeline.pipeline_stats.batches == 1
+    assert len(queue_pipeline.get_sensor_data()) == 60
+
+
+def test_fleet_producer_puts_sensor_batches(pipeline):
+    sensor_queue = pipeline(maxsize=10)
+    fleet = queue_pipeline.FarmSensorFleet(8, seed=3)
+    stop_evt = threading.Event()
+    producer = threading.Thread(target=queue_pipeline.fleet_producer,
+                                args=(fleet, 0.05, stop_evt, False))
+    producer.start()
+    try:
+        assert _wait_for(lambda: sensor_queue.qsize() >= 2)
+    finally:
+        stop_evt.set()
+        producer.join(timeout=5)
+    assert not producer.is_alive()
+
+    batch = sensor_queue.get_nowait()
+    assert isinstance(batch, queue_pipeline.SensorBatch)
+    assert len(batch) == 8
+    assert [row[0] for row in batch.rows()] == fleet.sensor_names
+    assert queue_pipeline.pipeline_stats.queue_full_count == 0
@@ -0,0 +1,185 @@
+# alert_engine.py
+import json
+import os
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from sensor_simulator import ENV_KEYS
+
+# setting.txt 와 같은 result 폴더에 둠
+DEFAULT_RULES_PATH = os.path.join('result', 'alert_rules.txt')
+
+# 기본 한계값은 DummySensor 정상 범위(내부 온도 18~30, 습도 50~60, CO2 0.02~0.1, 산소 4~7) 밖에 둠.
+# 정상 범위 안에 두면 매 tick 마다 발생/해제가 반복되어 중복 제거가 의미 없어짐.
+DEFAULT_RULES = {
+    'thresholds': [
+        {'metric': 'mars_base_internal_temperature', 'min': 16, 'max': 32, 'hysteresis': 1.0},
+        {'metric': 'mars_base_internal_humidity', 'min': 45, 'max': 65, 'hysteresis': 1.0},
+        {'metric': 'mars_base_internal_co2', 'max': 0.12, 'hysteresis': 0.01},
+        {'metric': 'mars_base_internal_oxygen', 'min': 3.5, 'hysteresis': 0.2},
+    ],
+    'rates': [
+        # 초당 변화량 기준 - 5초 주기에서 정상 범위 끝에서 끝으로 바뀌는 변화량(온도 2.4, CO2 0.016)보다 크게
+        {'metric': 'mars_base_internal_temperature', 'max_per_sec': 3.0, 'hysteresis': 0.5},
+        {'metric': 'mars_base_internal_co2', 'max_per_sec': 0.02, 'hysteresis': 0.004},
+    ]
+}
+
+
+@dataclass
+class Alert:
+    """상태가 바뀐 순간에만 생성되는 알림 (중복 제거)"""
+    sensor_index: int
+    rule: str  # 예: 'mars_base_internal_co2>max'
+    metric: str
+    value: float
+    state: str  # 'raised' | 'cleared'
+    timestamp: float
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def load_rules(path: str = DEFAULT_RULES_PATH) -> Dict:
+    """규칙 설정 로드 (없으면 기본 규칙 파일 생성)"""
+    try:
+        if not os.path.exists(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(DEFAULT_RULES, f, indent=2, ensure_ascii=False)
+            return DEFAULT_RULES
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (IOError, ValueError) as e:
+        print(f'알림 규칙 파일 처리 실패: {e}, 기본 규칙 사용')
+        return DEFAULT_RULES
+
+
+class AlertEngine:
+    """
+    임계값/변화율 알림 엔진
+
+    규칙은 생성 시 (지표 열 번호, 한계값, 히스테리시스) 배열로 미리 컴파일되고,
+    센서별 알림 상태는 (센서 수, 규칙 수) bool 배열로 유지됨.
+    새 측정값마다 규칙 수만큼의 벡터 연산만 수행하며, 상태가 바뀐 경우에만 Alert 를 만듦.
+    """
+
+    def __init__(self, rules: Dict, n_sensors: int = 1):
+        self.n_sensors = n_sensors
+        thresholds = rules.get('thresholds', [])
+        rates = rules.get('rates', [])
+
+        # 임계값 규칙: 상한/하한을 각각 하나의 규칙 열로 펼침
+        cols, limits, hyst, upper, names = [], [], [], [], []
+        for rule in thresholds:
+            col = ENV_KEYS.index(rule['metric'])
+            for bound, is_upper in (('max', True), ('min', False)):
+                if rule.get(bound) is None:
+                    continue
+                cols.append(col)
+                limits.append(float(rule[bound]))
+                hyst.append(float(rule.get('hysteresis', 0.0)))
+                upper.append(is_upper)
+                names.append(f'{rule["metric"]}{">" if is_upper else "<"}{bound}')
+        self._t_cols = np.array(cols, dtype=np.intp)
+        self._t_limits = np.array(limits, dtype=np.float64)
+        self._t_hyst = np.array(hyst, dtype=np.float64)
+        # 상한 규칙은 부호를 뒤집지 않고, 하한 규칙은 -1 을 곱해 모두 '값 > 한계' 형태로 통일
+        self._t_sign = np.where(np.array(upper, dtype=bool), 1.0, -1.0)
+        self._t_names = names
+        self._t_state = np.zeros((n_sensors, len(cols)), dtype=bool)
+
+        self._r_cols = np.array([ENV_KEYS.index(r['metric']) for r in rates], dtype=np.intp)
+        self._r_limits = np.array([float(r['max_per_sec']) for r in rates], dtype=np.float64)
+        self._r_hyst = np.array([float(r.get('hysteresis', 0.0)) for r in rates], dtype=np.float64)
+        self._r_names = [f'{r["metric"]}:rate' for r in rates]
+        self._r_state = np.zeros((n_sensors, len(rates)), dtype=bool)
+        self._prev_values: Optional[np.ndarray] = None
+        self._prev_ts: Optional[float] = None
+
+        self.rule_count = len(cols) + len(rates)
+
+    @classmethod
+    def from_config(cls, path: str = DEFAULT_RULES_PATH, n_sensors: int = 1) -> 'AlertEngine':
+        return cls(load_rules(path), n_sensors)
+
+    def evaluate(self, env_values: Dict[str, float], timestamp: Optional[float] = None) -> List[Alert]:
+        """단일 센서 측정값 평가"""
+        row = np.array([[env_values.get(key, np.nan) for key in ENV_KEYS]], dtype=np.float64)
+        return self.evaluate_batch(row, timestamp)
+
+    def evaluate_batch(self, values: np.ndarray, timestamp: Optional[float] = None) -> List[Alert]:
+        """(n_sensors, 6) 측정값 배열 평가, 상태가 바뀐 알림만 반환"""
+        now = time.time() if timestamp is None else timestamp
+        alerts: List[Alert] = []
+
+        if len(self._t_cols):
+            signed = values[:, self._t_cols] * self._t_sign
+            limits = self._t_limits * self._t_sign
+            # 발생: 한계 초과 / 해제: 한계에서 히스테리시스만큼 안쪽으로 돌아옴
+            over = signed > limits
+            back = signed < limits - self._t_hyst
+            new_state = over | (self._t_state & ~back)
+            alerts += self._collect(new_state, self._t_state, values, self._t_cols, self._t_names, now)
+            self._t_state = new_state
+
+        if len(self._r_cols):
+            current = values[:, self._r_cols]
+            if self._prev_values is not None and now > self._prev_ts:
+                rate = np.abs(current - self._prev_values) / (now - self._prev_ts)
+                over = rate > self._r_limits
+                back = rate < self._r_limits - self._r_hyst
+                new_state = over | (self._r_state & ~back)
+                alerts += self._collect(new_state, self._r_state, values, self._r_cols, self._r_names, now)
+                self._r_state = new_state
+            self._prev_values = current.copy()
+            self._prev_ts = now
+
+        return alerts
+
+    @staticmethod
+    def _collect(new_state: np.ndarray, old_state: np.ndarray, values: np.ndarray,
+                 cols: np.ndarray, names: List[str], now: float) -> List[Alert]:
+        changed = new_state != old_state
+        if not changed.any():
+            return []
+        alerts = []
+        for sensor_idx, rule_idx in zip(*np.nonzero(changed)):
+            col = cols[rule_idx]
+            alerts.append(Alert(
+                sensor_index=int(sensor_idx),
+                rule=names[rule_idx],
+                metric=ENV_KEYS[col],
+                value=float(values[sensor_idx, col]),
+                state='raised' if new_state[sensor_idx, rule_idx] else 'cleared',
+                timestamp=now
+            ))
+        return alerts
+
+    def active_count(self) -> int:
+        """현재 발생 중인 알림 수"""
+        return int(self._t_state.sum() + self._r_state.sum())
+
+
+def benchmark_alert_engine(n_sensors: int = 10000, ticks: int = 50) -> Dict[str, float]:
+    """시뮬레이터 다수 센서에 대한 tick 당 평가 시간 측정"""
+    from sensor_simulator import BatchSensorSimulator
+
+    sim = BatchSensorSimulator(n_sensors, seed=3, drift=0.02)
+    engine = AlertEngine(DEFAULT_RULES, n_sensors)
+    total_alerts = 0
+    start = time.perf_counter()
+    for tick in range(ticks):
+        total_alerts += len(engine.evaluate_batch(sim.tick(), timestamp=float(tick)))
+    elapsed = time.perf_counter() - start
+    per_tick_ms = elapsed / ticks * 1000
+    print(f'센서 {n_sensors}개 x 규칙 {engine.rule_count}개: tick 당 {per_tick_ms:.2f} ms, '
+          f'알림 {total_alerts}건 (현재 활성 {engine.active_count()}건)')
+    return {'per_tick_ms': per_tick_ms, 'alerts': total_alerts}
+
+
+if __name__ == '__main__':
+    print('=== 알림 엔진 벤치마크 ===')
+    benchmark_alert_engine()
@@ -0,0 +1,220 @@
+# async_runtime.py
+import asyncio
+import inspect
+import json
+import multiprocessing
+import os
+import random
+import signal
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from sensor_simulator import ENV_METRICS
+
+
+@dataclass
+class CollectorStats:
+    """주기 실행 통계"""
+    name: str
+    interval: float
+    ticks: int = 0
+    overruns: int = 0  # 처리 지연으로 건너뛴 주기 수
+    max_lag: float = 0.0  # 예정 시각 대비 최대 지연 (초)
+
+
+async def run_periodic(fn: Callable, interval: float, stats: CollectorStats,
+                       start_delay: float = 0.0) -> None:
+    """
+    드리프트 보정 주기 실행
+
+    다음 실행 시각을 '이전 예정 시각 + interval' 로 계산하므로
+    fn 실행 시간이 누적되어 주기가 밀리지 않음. 한 주기 이상 늦으면 밀린 주기는 건너뜀.
+    """
+    loop = asyncio.get_running_loop()
+    next_time = loop.time() + start_delay
+    if start_delay:
+        await asyncio.sleep(start_delay)
+
+    while True:
+        stats.max_lag = max(stats.max_lag, loop.time() - next_time)
+        try:
+            result = fn()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            print(f'[ASYNC-{stats.name}] 수집 중 오류: {e}')
+        stats.ticks += 1
+
+        next_time += interval
+        now = loop.time()
+        if now > next_time:
+            missed = int((now - next_time) // interval) + 1
+            stats.overruns += missed
+            next_time += missed * interval
+        await asyncio.sleep(next_time - now)
+
+
+class AsyncRuntime:
+    """단일 이벤트 루프에서 여러 수집기 코루틴을 실행하는 런타임"""
+
+    def __init__(self, handle_stdin: bool = True):
+        self.handle_stdin = handle_stdin
+        self._collectors: List[tuple] = []
+        self.stats: Dict[str, CollectorStats] = {}
+        self._stop: Optional[asyncio.Event] = None
+
+    def add_collector(self, name: str, interval: float, fn: Callable, stagger: bool = False) -> None:
+        """
+        수집기 등록 (fn 은 일반 함수 또는 코루틴 함수)
+
+        stagger=True 이면 같은 interval 수집기들의 시작 시점을 고르게 분산
+        (순간 부하는 줄지만 루프 wakeup 횟수가 수집기 수만큼 늘어남)
+        """
+        if name in self.stats:
+            raise ValueError(f'이미 등록된 수집기 이름: {name}')
+        self.stats[name] = CollectorStats(name, interval)
+        self._collectors.append((name, interval, fn, stagger))
+
+    def stop(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+
+    def _on_stdin(self) -> None:
+        """stdin reader 콜백: q 입력 시 종료"""
+        line = sys.stdin.readline()
+        if not line or line.strip().lower() == 'q':
+            print('System stopped....')
+            self.stop()
+
+    async def run(self, duration: Optional[float] = None) -> Dict[str, CollectorStats]:
+        """모든 수집기 실행 (stop() 호출, q 입력, Ctrl+C 또는 duration 경과 시 종료)"""
+        loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+
+        stdin_attached = False
+        if self.handle_stdin:
+            try:
+                loop.add_reader(sys.stdin.fileno(), self._on_stdin)
+                stdin_attached = True
+            except (NotImplementedError, ValueError, OSError):
+                # Windows 기본 루프 등 add_reader 미지원 환경: Ctrl+C 로만 종료
+                pass
+        try:
+            loop.add_signal_handler(signal.SIGINT, self.stop)
+        except (NotImplementedError, RuntimeError):
+            pass
+
+        groups: Dict[float, int] = {}
+        for _, interval, _, stagger in self._collectors:
+            if stagger:
+                groups[interval] = groups.get(interval, 0) + 1
+        offsets: Dict[float, int] = {}
+
+        tasks = []
+        for name, interval, fn, stagger in self._collectors:
+            delay = 0.0
+            if stagger:
+                idx = offsets.get(interval, 0)
+                offsets[interval] = idx + 1
+                delay = interval * idx / groups[interval]
+            tasks.append(asyncio.create_task(
+                run_periodic(fn, interval, self.stats[name], delay), name=name))
+
+        try:
+            if duration is None:
+                await self._stop.wait()
+            else:
+                try:
+                    await asyncio.wait_for(self._stop.wait(), duration)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if stdin_attached:
+                loop.remove_reader(sys.stdin.fileno())
+            try:
+                loop.remove_signal_handler(signal.SIGINT)
+            except (NotImplementedError, RuntimeError):
+                pass
+        return self.stats
+
+
+# ====== 실행 모드별 CPU 오버헤드 벤치마크 ======
+def _benchmark_work() -> None:
+    """센서 1회 수집과 비슷한 작업량 (값 생성 + 직렬화)"""
+    env = {key: round(random.uniform(low, high), decimals) for key, low, high, decimals in ENV_METRICS}
+    json.dumps(env, ensure_ascii=False)
+
+
+def _polling_loop(stop_evt, interval: float) -> None:
+    """기존 스레드/프로세스 워커와 같은 0.1초 폴링 루프"""
+    while not stop_evt.is_set():
+        _benchmark_work()
+        for _ in range(max(int(interval / 0.1), 1)):
+            if stop_evt.is_set():
+                return
+            time.sleep(0.1)
+
+
+def _cpu_seconds() -> float:
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def _bench_threads(collectors: int, interval: float, duration: float) -> None:
+    stop_evt = threading.Event()
+    threads = [threading.Thread(target=_polling_loop, args=(stop_evt, interval), daemon=True)
+               for _ in range(collectors)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop_evt.set()
+    for thread in threads:
+        thread.join()
+
+
+def _bench_processes(collectors: int, interval: float, duration: float) -> None:
+    stop_evt = multiprocessing.Event()
+    processes = [multiprocessing.Process(target=_polling_loop, args=(stop_evt, interval))
+                 for _ in range(collectors)]
+    for process in processes:
+        process.start()
+    time.sleep(duration)
+    stop_evt.set()
+    for process in processes:
+        process.join()
+
+
+def _bench_asyncio(collectors: int, interval: float, duration: float) -> None:
+    runtime = AsyncRuntime(handle_stdin=False)
+    for i in range(collectors):
+        runtime.add_collector(f'bench-{i}', interval, _benchmark_work)
+    asyncio.run(runtime.run(duration))
+
+
+def benchmark_runtime_modes(collectors: int = 100, interval: float = 0.5,
+                            duration: float = 5.0) -> Dict[str, float]:
+    """thread / process / asyncio 모드의 CPU 사용 시간(초) 비교"""
+    results = {}
+    for name, bench in (('thread', _bench_threads), ('process', _bench_processes),
+                        ('asyncio', _bench_asyncio)):
+        cpu_start = _cpu_seconds()
+        wall_start = time.perf_counter()
+        bench(collectors, interval, duration)
+        cpu_used = _cpu_seconds() - cpu_start
+        wall = time.perf_counter() - wall_start
+        results[name] = round(cpu_used, 3)
+        print(f'{name:<8} 수집기 {collectors}개: CPU {cpu_used:.3f}s / wall {wall:.2f}s '
+              f'({cpu_used / wall * 100:.1f}% of one core)')
+    return results
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    print('=== 실행 모드별 CPU 오버헤드 비교 ===')
+    benchmark_runtime_modes(collectors=count)
@@ -0,0 +1,97 @@
+# console_reporter.py
+import sys
+import threading
+import time
+from typing import Dict, Optional, TextIO, Union
+
+from sensor_log_sink import LOG_FORMAT_JSONL, LOG_FORMAT_PRETTY, SerializedRecord
+
+MODE_PRETTY = 'pretty'  # 기존 출력: 제목 + indent=2 JSON
+MODE_COMPACT = 'compact'  # 한 줄 출력: 제목 + 압축 JSON
+MODE_DASHBOARD = 'dashboard'  # 채널별 최신값을 초당 최대 N회 다시 그림
+MODE_SILENT = 'silent'  # 출력 없음
+MODES = (MODE_PRETTY, MODE_COMPACT, MODE_DASHBOARD, MODE_SILENT)
+
+_CLEAR_SCREEN = '\x1b[H\x1b[2J'
+
+
+class ConsoleReporter:
+    """
+    수집기 콘솔 출력기
+
+    - 직렬화는 SerializedRecord 에 캐시되므로 로그 싱크와 같은 tick 을 공유하면 한 번만 수행
+    - 출력은 한 번의 write 로 모아서 내보냄
+    - 여러 스레드에서 호출해도 줄이 섞이지 않도록 lock 사용
+    """
+
+    def __init__(self, mode: str = MODE_PRETTY, max_fps: float = 2.0, stream: Optional[TextIO] = None):
+        if mode not in MODES:
+            raise ValueError(f'지원하지 않는 출력 모드: {mode}')
+        self.mode = mode
+        self.min_redraw_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+        self._channels: Dict[str, str] = {}
+        self._last_redraw = 0.0
+        self.skipped_redraws = 0
+
+    @property
+    def verbose(self) -> bool:
+        """부가 디버그 출력 여부 (pretty 모드에서만)"""
+        return self.mode == MODE_PRETTY
+
+    def report(self, title: str, record: Union[SerializedRecord, Dict], footer: bool = False) -> None:
+        """수집 결과 1건 출력 (title 은 채널 이름으로도 사용)"""
+        if self.mode == MODE_SILENT:
+            return
+        if not isinstance(record, SerializedRecord):
+            record = SerializedRecord(record)
+
+        if self.mode == MODE_PRETTY:
+            text = f'{title}\n{record.text(LOG_FORMAT_PRETTY)}\n'
+            if footer:
+                text += '-' * 50 + '\n'
+            self._write(text)
+        elif self.mode == MODE_COMPACT:
+            self._write(f'{title.strip()} {record.text(LOG_FORMAT_JSONL)}\n')
+        else:
+            self._update_dashboard(title.strip(), record.text(LOG_FORMAT_JSONL))
+
+    def message(self, text: str) -> None:
+        """부가 안내 문구 출력 (pretty 모드에서만)"""
+        if self.verbose:
+            self._write(text + '\n')
+
+    def _write(self, text: str) -> None:
+        with self._lock:
+            self.stream.write(text)
+            self.stream.flush()
+
+    def _update_dashboard(self, channel: str, text: str) -> None:
+        """최신값만 갱신하고, 다시 그리기는 min_redraw_interval 마다 한 번"""
+        with self._lock:
+            self._channels[channel] = text
+            now = time.monotonic()
+            if now - self._last_redraw < self.min_redraw_interval:
+                self.skipped_redraws += 1
+                return
+            self._last_redraw = now
+            lines = [_CLEAR_SCREEN, '=== 화성 미션 컴퓨터 대시보드 ===',
+                     f'갱신: {time.strftime("%Y-%m-%d %H:%M:%S")}']
+            for name, value in self._channels.items():
+                lines.append(f'{name}: {value}')
+            self.stream.write('\n'.join(lines) + '\n')
+            self.stream.flush()
+
+
+# 프로세스 기본 리포터 (실행 시 모드 선택으로 교체)
+_default_reporter = ConsoleReporter()
+
+
+def get_default_reporter() -> ConsoleReporter:
+    return _default_reporter
+
+
+def set_default_reporter(reporter: ConsoleReporter) -> None:
+    global _default_reporter
+    _default_reporter = reporter
@@ -10,9 +10,28 @@ import sys
 import os
 import select
 import subprocess
+import atexit
+import asyncio
 from datetime import datetime
 from typing import Dict, Optional
 
+from alert_engine import DEFAULT_RULES_PATH, AlertEngine, load_rules
+from async_runtime import AsyncRuntime
+from console_reporter import MODES, ConsoleReporter, get_default_reporter, set_default_reporter
+from rolling_window import RollingWindowAggregator
+from sensor_log_sink import LogSink, SerializedRecord, create_log_sink
+from sensor_simulator import BatchSensorSimulator
+from system_sampler import get_system_sampler
+from telemetry_archive import DEFAULT_ARCHIVE_DIR, TelemetryArchiveWriter
+from telemetry_bus import (
+    KIND_INFO,
+    KIND_LOAD,
+    KIND_SENSOR,
+    VALUE_FIELDS,
+    TelemetryAggregator,
+    TelemetryBus,
+)
+
 # 전역 종료 이벤트
 stop_event = multiprocessing.Event()
 
@@ -23,11 +42,42 @@ def signal_handler(signum, frame):
 
 signal.signal(signal.SIGINT, signal_handler)
 
+# 프로세스당 한 번만 수집하는 정적 호스트 정보
+_static_host_info: Optional[Dict] = None
+
+# 프로세스별 공유 로그 싱크 (지연 생성, 종료 시 flush, fork 후에는 자식에서 새로 생성)
+_default_log_sink: Optional[LogSink] = None
+_default_log_sink_pid: Optional[int] = None
+_default_log_sink_lock = threading.Lock()
+
+
+def get_default_log_sink() -> LogSink:
+    """현재 프로세스의 기본 버퍼 로그 싱크 반환"""
+    global _default_log_sink, _default_log_sink_pid
+    with _default_log_sink_lock:
+        if _default_log_sink is None or _default_log_sink_pid != os.getpid():
+            # fork 로 물려받은 싱크는 flush 타이머 스레드가 없고 부모의 버퍼 사본을 가지고 있으므로
+            # 닫지 않고 버림 (부모 버퍼는 부모가 기록)
+            if _default_log_sink_pid is None:
+                atexit.register(close_default_log_sink)
+            _default_log_sink = create_log_sink('buffered')
+            _default_log_sink_pid = os.getpid()
+        return _default_log_sink
+
+
+def close_default_log_sink() -> None:
+    """기본 로그 싱크의 남은 버퍼를 기록하고 닫음"""
+    global _default_log_sink
+    with _default_log_sink_lock:
+        if _default_log_sink is not None and _default_log_sink_pid == os.getpid():
+            _default_log_sink.close()
+        _default_log_sink = None
+
 
 class DummySensor:
     """더미 센서: 화성 기지 환경 데이터 시뮬레이션"""
 
-    def __init__(self):
+    def __init__(self, log_sink: Optional[LogSink] = None):
         self.env_values: Dict[str, float] = {
             'mars_base_internal_temperature': 0.0,
             'mars_base_external_temperature': 0.0,
@@ -36,6 +86,15 @@ class DummySensor:
             'mars_base_internal_co2': 0.0,
             'mars_base_internal_oxygen': 0.0
         }
+        # None 이면 프로세스 공유 버퍼 싱크 사용 (create_log_sink('direct') 로 기존 방식 선택 가능)
+        self._log_sink = log_sink
+        # 마지막 get_env 레코드 (콘솔 출력이 로그와 같은 직렬화 결과를 재사용)
+        self.last_record: Optional[SerializedRecord] = None
+
+    @property
+    def log_sink(self) -> LogSink:
+        """지정된 싱크, 없으면 현재 프로세스의 기본 싱크 (fork 된 자식에서도 자식 싱크를 사용)"""
+        return self._log_sink or get_default_log_sink()
 
     def set_env(self) -> None:
         """지정된 범위에서 랜덤 환경값 설정"""
@@ -48,26 +107,40 @@ class DummySensor:
 
     def get_env(self) -> Dict[str, float]:
         """환경값 반환 및 로그 파일 기록"""
-        log_data = {
+        self.last_record = SerializedRecord({
             'datetime': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             **self.env_values
-        }
+        })
         try:
-            log_file_path = os.path.join('result', 'mars_base_env_log.txt')
-            with open(log_file_path, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(log_data, ensure_ascii=False, indent=2) + '\n')
-        except IOError as e:
-            print(f'로그 파일 기록 실패: {e}')
+            self.log_sink.write(self.last_record)
         except Exception as e:
             print(f'Unexpected Error: {e}')
         return self.env_values.copy()
 
 
+class SimulatedSensor(DummySensor):
+    """BatchSensorSimulator 의 한 행을 DummySensor 처럼 사용하는 뷰"""
+
+    def __init__(self, simulator: BatchSensorSimulator, index: int,
+                 log_sink: Optional[LogSink] = None):
+        super().__init__(log_sink)
+        if not 0 <= index < simulator.n_sensors:
+            raise IndexError(f'센서 인덱스 범위 초과: {index}')
+        self.simulator = simulator
+        self.index = index
+
+    def set_env(self) -> None:
+        """시뮬레이터의 최신 tick 에서 자신의 행을 읽어옴 (tick 은 외부에서 일괄 진행)"""
+        if self.simulator.tick_count == 0:
+            self.simulator.tick()
+        self.env_values.update(self.simulator.row(self.index))
+
 
 class MissionComputer:
     """미션 컴퓨터: 센서 데이터 수집 및 관리"""
 
-    def __init__(self):
+    def __init__(self, archive_dir: Optional[str] = DEFAULT_ARCHIVE_DIR,
+                 reporter: Optional[ConsoleReporter] = None):
         self.env_values: Dict[str, float] = {
             'mars_base_internal_temperature': 0.0,
             'mars_base_external_temperature': 0.0,
@@ -77,9 +150,24 @@ class MissionComputer:
             'mars_base_internal_oxygen': 0.0
         }
         self.ds = DummySensor()
-        self.data_history = []
+        self.reporter = reporter or get_default_reporter()
+        # 센서 번호별 이력 바이너리 아카이브 (None 이면 기록 안 함, 첫 기록 시 생성)
+        self.archive_dir = archive_dir
+        self.archives: Dict[int, TelemetryArchiveWriter] = {}
+        # 센서 번호별 환경값 알림 엔진 (첫 평가 시 result/alert_rules.txt 로드)
+        self._alert_rules: Optional[Dict] = None
+        self.alert_engines: Dict[int, AlertEngine] = {}
+        # 최근 5분 샘플만 유지하는 롤링 집계기 (히스토리 전체 재계산 불필요)
+        self.rolling = RollingWindowAggregator(300, self.env_values.keys())
         self.last_average_time = time.time() - 300
 
+        # setting.txt 변경 감지용 (mtime_ns, inode, size) 서명과 버전
+        self._settings_signature = None
+        self._settings = None
+        self._settings_version = 0
+        # (설정 버전, 필터링된 정보 SerializedRecord)
+        self._info_cache = None
+
     def get_sensor_data(self):
         """센서 데이터를 5초마다 수집하여 JSON으로 출력"""
         print('=== 센서 데이터 수집 시작 ===')
@@ -89,28 +177,28 @@ class MissionComputer:
             try:
                 self.ds.set_env()
                 self.env_values = self.ds.get_env()
-                self.data_history.append(self.env_values.copy())
+                self.rolling.add(self.env_values)
+                self.archive_env(self.env_values)
+                self.check_alerts(self.env_values)
 
-                print('=== 화성 기지 환경 정보 ===')
-                print(json.dumps(self.env_values, indent=2, ensure_ascii=False))
-                print(f'업데이트 시간: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
+                self.reporter.report('=== 화성 기지 환경 정보 ===', self.ds.last_record)
 
-                # 5분(300초)마다 평균 계산 - 디버깅 출력을 조건문 밖으로 이동
+                # 5분(300초)마다 평균 계산 - 디버깅 출력은 pretty 모드에서만
                 now = time.time()
                 time_diff = now - self.last_average_time
-                print(f'시간 체크: 경과시간 {time_diff:.1f}초 (5분={300}초)')
-                print(f'데이터 히스토리 개수: {len(self.data_history)}개')
+                self.reporter.message(f'시간 체크: 경과시간 {time_diff:.1f}초 (5분={300}초)\n'
+                                      f'5분 윈도우 샘플 개수: {len(self.rolling)}개')
 
                 if time_diff >= 300:  # 5분 = 300초
-                    print('>>> 5분 경과! 평균 계산 시작')
+                    self.reporter.message('>>> 5분 경과! 평균 계산 시작')
                     self._calculate_5min_average()
                     self.last_average_time = now
-                    print('>>> 평균 계산 완료')
+                    self.reporter.message('>>> 평균 계산 완료')
                 else:
                     remaining = 300 - time_diff
-                    print(f'>>> 5분까지 {remaining:.1f}초 남음')
+                    self.reporter.message(f'>>> 5분까지 {remaining:.1f}초 남음')
 
-                print('-' * 50)
+                self.reporter.message('-' * 50)
 
                 # 5초 대기하며 q 입력 감지
                 start_time = time.time()
@@ -120,49 +208,83 @@ class MissionComputer:
                         user_input = sys.stdin.readline().strip().lower()
                         if user_input == 'q':
                             print('System stopped....')
+                            self.close_archive()
                             return
 
             except Exception as e:
                 print(f'센서 데이터 수집 중 오류: {e}')
                 time.sleep(5)
 
+    def archive_env(self, env_values: Dict[str, float], sensor_index: int = 0) -> None:
+        """
+        환경값을 바이너리 아카이브에 추가 (센서 번호마다 writer 는 하나)
+
+        0번 센서는 archive_dir 에, 나머지는 archive_dir/sensor_{번호} 에 기록함.
+        """
+        if self.archive_dir is None:
+            return
+        try:
+            archive = self.archives.get(sensor_index)
+            if archive is None:
+                base_dir = self.archive_dir
+                if sensor_index:
+                    base_dir = os.path.join(base_dir, f'sensor_{sensor_index}')
+                archive = self.archives[sensor_index] = TelemetryArchiveWriter(base_dir)
+            archive.append(time.time(), env_values)
+        except Exception as e:
+            print(f'아카이브 기록 실패: {e}')
+
+    def check_alerts(self, env_values: Dict[str, float], sensor_index: int = 0) -> None:
+        """알림 규칙 평가 후 상태가 바뀐 알림만 출력 (센서 번호별로 알림/변화율 상태를 따로 유지)"""
+        try:
+            engine = self.alert_engines.get(sensor_index)
+            if engine is None:
+                if self._alert_rules is None:
+                    self._alert_rules = load_rules(DEFAULT_RULES_PATH)
+                engine = self.alert_engines[sensor_index] = AlertEngine(self._alert_rules)
+            for alert in engine.evaluate(env_values):
+                alert.sensor_index = sensor_index
+                self.reporter.report(f'[ALERT] {alert.rule} {alert.state}', alert.to_dict())
+        except Exception as e:
+            print(f'알림 평가 실패: {e}')
+
+    def close_archive(self) -> None:
+        for archive in self.archives.values():
+            archive.close()
+        self.archives.clear()
+
     def _calculate_5min_average(self):
         """5분 평균값 계산 및 출력"""
-        if not self.data_history:
+        snapshot = self.rolling.snapshot(time.time())
+        if not len(self.rolling):
             return
 
         avg_data = {}
-        for key in self.env_values.keys():
-            values = [data[key] for data in self.data_history if key in data]
-            if values:
-                avg_data[f'{key}_5min_avg'] = round(sum(values) / len(values), 2)
-
-        print('\n=== 5분 평균 환경 정보 ===')
-        print(json.dumps(avg_data, indent=2, ensure_ascii=False))
-        print(f'평균 계산 시간: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
-        print('-' * 50)
+        for key, stats in snapshot.items():
+            if stats['count']:
+                avg_data[f'{key}_5min_avg'] = round(stats['mean'], 2)
+                avg_data[f'{key}_5min_min'] = stats['min']
+                avg_data[f'{key}_5min_max'] = stats['max']
+                avg_data[f'{key}_5min_stddev'] = round(stats['stddev'], 4)
 
-        self.data_history = self.data_history[-50:]
+        avg_data['calculated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.reporter.report('\n=== 5분 평균 환경 정보 ===', avg_data, footer=True)
 
     def get_mission_computer_info(self) -> Dict:
         """시스템 정보 수집 및 JSON 출력"""
         try:
-            info = {
-                'operating_system': platform.system(),
-                'os_version': platform.version(),
-                'cpu_type': platform.processor(),
-                'cpu_cores': self._get_cpu_cores(),
-                'memory_total_gb': self._get_memory_info()
-            }
-
             settings = self._load_settings()
-            if settings:
-                info = self._filter_info_by_settings(info, settings)
 
-            print('=== 미션 컴퓨터 시스템 정보 ===')
-            print(json.dumps(info, indent=2, ensure_ascii=False))
-            print('-' * 50)
-            return info
+            # 설정이 바뀌지 않았으면 이전 필터링 결과와 직렬화 문자열을 그대로 사용
+            if self._info_cache is None or self._info_cache[0] != self._settings_version:
+                info = self._get_static_info()
+                if settings:
+                    info = self._filter_info_by_settings(info, settings)
+                self._info_cache = (self._settings_version, SerializedRecord(info))
+            record = self._info_cache[1]
+
+            self.reporter.report('=== 미션 컴퓨터 시스템 정보 ===', record, footer=True)
+            return dict(record.data)
 
         except Exception as e:
             print(f'시스템 정보 수집 중 오류: {e}')
@@ -176,16 +298,30 @@ class MissionComputer:
                 'cpu_usage_percent': self._get_cpu_usage(),
                 'memory_usage_percent': self._get_memory_usage()
             }
+            per_core = self._get_per_core_usage()
+            if per_core:
+                load_info['cpu_per_core_percent'] = per_core
 
-            print('=== 미션 컴퓨터 부하 정보 ===')
-            print(json.dumps(load_info, indent=2, ensure_ascii=False))
-            print('-' * 50)
+            self.reporter.report('=== 미션 컴퓨터 부하 정보 ===', load_info, footer=True)
             return load_info
 
         except Exception as e:
             print(f'시스템 부하 정보 수집 중 오류: {e}')
             return {}
 
+    def _get_static_info(self) -> Dict:
+        """프로세스 수명 동안 변하지 않는 호스트 정보 (프로세스당 한 번만 수집)"""
+        global _static_host_info
+        if _static_host_info is None:
+            _static_host_info = {
+                'operating_system': platform.system(),
+                'os_version': platform.version(),
+                'cpu_type': platform.processor(),
+                'cpu_cores': self._get_cpu_cores(),
+                'memory_total_gb': self._get_memory_info()
+            }
+        return dict(_static_host_info)
+
     def _get_cpu_cores(self):
         """CPU 코어 수 반환"""
         try:
@@ -216,20 +352,11 @@ class MissionComputer:
         try:
             system = platform.system()
             if system == 'Linux':
-                with open('/proc/meminfo', 'r') as f:
-                    mem_info = {}
-                    for line in f:
-                        parts = line.split(':')
-                        if len(parts) == 2:
-                            key = parts[0].strip()
-                            value = int(parts[1].strip().split())
-                            mem_info[key] = value
-
-                total = mem_info.get('MemTotal', 0)
-                available = mem_info.get('MemAvailable', 0)
-                if total > 0:
-                    used_percent = round((total - available) / total * 100, 1)
-                    return used_percent
+                # 백그라운드 샘플러가 interval 마다 파싱해 둔 값을 읽기만 함
+                sampler = get_system_sampler()
+                sample = sampler.latest if sampler else None
+                if sample and sample.memory_percent is not None:
+                    return sample.memory_percent
 
             elif system == 'Darwin':
                 result = subprocess.check_output(['vm_stat'], text=True)
@@ -280,25 +407,11 @@ class MissionComputer:
         try:
             system = platform.system()
             if system == 'Linux':
-                with open('/proc/stat', 'r') as f:
-                    cpu_line = f.readline()
-                    cpu_times1 = list(map(int, cpu_line.split()[1:]))
-
-                time.sleep(0.1)
-
-                with open('/proc/stat', 'r') as f:
-                    cpu_line = f.readline()
-                    cpu_times2 = list(map(int, cpu_line.split()[1:]))
-
-                idle1, idle2 = cpu_times1[3], cpu_times2[2]
-                total1, total2 = sum(cpu_times1), sum(cpu_times2)
-
-                idle_delta = idle2 - idle1
-                total_delta = total2 - total1
-
-                if total_delta > 0:
-                    cpu_usage = round((1 - idle_delta / total_delta) * 100, 1)
-                    return cpu_usage
+                # 직전 샘플 대비 구간 사용률 (sleep 없음)
+                sampler = get_system_sampler()
+                sample = sampler.latest if sampler else None
+                if sample and sample.cpu_percent is not None:
+                    return sample.cpu_percent
 
             elif system == 'Darwin':
                 result = subprocess.check_output(['top', '-l', '1', '-n', '0'], text=True)
@@ -323,17 +436,33 @@ class MissionComputer:
             print(f'CPU 사용률 수집 오류: {e}')
         return 'N/A'
 
+    def _get_per_core_usage(self):
+        """코어별 CPU 사용률 목록 반환 (Linux 샘플러 사용 시에만)"""
+        sampler = get_system_sampler() if platform.system() == 'Linux' else None
+        sample = sampler.latest if sampler else None
+        return list(sample.per_core_percent) if sample else []
+
     def _load_settings(self):
-        """setting.txt 파일 로드"""
+        """setting.txt 파일 로드 (mtime/inode/size 가 바뀐 경우에만 다시 읽음)"""
 
         try:
             setting_file_path = os.path.join('result', 'setting.txt')
 
-            if not os.path.exists(setting_file_path):
+            try:
+                stat = os.stat(setting_file_path)
+            except FileNotFoundError:
                 self._create_default_settings()
+                stat = os.stat(setting_file_path)
+
+            signature = (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+            if signature == self._settings_signature:
+                return self._settings
 
             with open(setting_file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                self._settings = json.load(f)
+            self._settings_signature = signature
+            self._settings_version += 1
+            return self._settings
         except IOError as e:
             print(f'설정 파일 읽기 실패: {e}')
         except Exception as e:
@@ -380,42 +509,70 @@ class MissionComputer:
 
 
 # 멀티프로세스용 전역 함수들
-def process_info_worker(stop_evt):
+def process_info_worker(stop_evt, bus_name: Optional[str] = None, bus_capacity: int = 1024,
+                        console_mode: Optional[str] = None):
     """시스템 정보 수집 프로세스 (runComputer1)"""
+    if console_mode:
+        # spawn 방식에서는 부모의 출력 모드가 상속되지 않으므로 인자로 전달
+        set_default_reporter(ConsoleReporter(console_mode))
     computer = MissionComputer()
-    while not stop_evt.is_set():
-        print('\n[PROCESS-INFO] 시스템 정보 업데이트')
-        computer.get_mission_computer_info()
-        for _ in range(200):  # 20초
-            if stop_evt.is_set():
-                return
-            time.sleep(0.1)
+    bus = TelemetryBus.attach(bus_name, bus_capacity) if bus_name else None
+    try:
+        while not stop_evt.is_set():
+            computer.reporter.message('\n[PROCESS-INFO] 시스템 정보 업데이트')
+            info = computer.get_mission_computer_info()
+            if bus:
+                bus.publish(KIND_INFO, [info.get(key) for key in VALUE_FIELDS[KIND_INFO]])
+            stop_evt.wait(20)
+    finally:
+        if bus:
+            bus.close()
 
 
-def process_load_worker(stop_evt):
+def process_load_worker(stop_evt, bus_name: Optional[str] = None, bus_capacity: int = 1024,
+                        console_mode: Optional[str] = None):
     """부하 정보 수집 프로세스 (runComputer2)"""
+    if console_mode:
+        # spawn 방식에서는 부모의 출력 모드가 상속되지 않으므로 인자로 전달
+        set_default_reporter(ConsoleReporter(console_mode))
     computer = MissionComputer()
-    while not stop_evt.is_set():
-        print('\n[PROCESS-LOAD] 부하 정보 업데이트')
-        computer.get_mission_computer_load()
-        for _ in range(200):  # 20초
-            if stop_evt.is_set():
-                return
-            time.sleep(0.1)
+    bus = TelemetryBus.attach(bus_name, bus_capacity) if bus_name else None
+    try:
+        while not stop_evt.is_set():
+            computer.reporter.message('\n[PROCESS-LOAD] 부하 정보 업데이트')
+            load_info = computer.get_mission_computer_load()
+            if bus:
+                bus.publish(KIND_LOAD, [load_info.get(key) for key in VALUE_FIELDS[KIND_LOAD]])
+            stop_evt.wait(20)
+    finally:
+        if bus:
+            bus.close()
 
 
-def process_sensor_worker(stop_evt):
+def process_sensor_worker(stop_evt, bus_name: Optional[str] = None, bus_capacity: int = 1024,
+                          console_mode: Optional[str] = None):
     """센서 데이터 수집 프로세스 (runComputer3)"""
+    if console_mode:
+        # spawn 방식에서는 부모의 출력 모드가 상속되지 않으므로 인자로 전달
+        set_default_reporter(ConsoleReporter(console_mode))
     computer = MissionComputer()
-    while not stop_evt.is_set():
-        computer.ds.set_env()
-        computer.env_values = computer.ds.get_env()
-        print('\n[PROCESS-SENSOR] 센서 데이터 업데이트')
-        print(json.dumps(computer.env_values, indent=2, ensure_ascii=False))
-        for _ in range(50):  # 5초
-            if stop_evt.is_set():
-                return
-            time.sleep(0.1)
+    bus = TelemetryBus.attach(bus_name, bus_capacity) if bus_name else None
+    try:
+        while not stop_evt.is_set():
+            computer.ds.set_env()
+            computer.env_values = computer.ds.get_env()
+            computer.archive_env(computer.env_values)
+            computer.check_alerts(computer.env_values)
+            computer.reporter.report('\n[PROCESS-SENSOR] 센서 데이터 업데이트', computer.ds.last_record)
+            if bus:
+                bus.publish(KIND_SENSOR, [computer.env_values[key] for key in VALUE_FIELDS[KIND_SENSOR]])
+            stop_evt.wait(5)
+    finally:
+        # 자식 프로세스는 atexit 가 실행되지 않으므로 직접 flush
+        close_default_log_sink()
+        computer.close_archive()
+        if bus:
+            bus.close()
 
 
 def run_multithreaded():
@@ -428,7 +585,7 @@ def run_multithreaded():
     def info_thread():
         runComputer = MissionComputer()
         while not stop_evt.is_set():
-            print('\n[THREAD-INFO] 시스템 정보 업데이트')
+            runComputer.reporter.message('\n[THREAD-INFO] 시스템 정보 업데이트')
             runComputer.get_mission_computer_info()
             for _ in range(200):  # 20초
                 if stop_evt.is_set():
@@ -438,7 +595,7 @@ def run_multithreaded():
     def load_thread():
         runComputer = MissionComputer()
         while not stop_evt.is_set():
-            print('\n[THREAD-LOAD] 부하 정보 업데이트')
+            runComputer.reporter.message('\n[THREAD-LOAD] 부하 정보 업데이트')
             runComputer.get_mission_computer_load()
             for _ in range(200):  # 20초
                 if stop_evt.is_set():
@@ -447,15 +604,20 @@ def run_multithreaded():
 
     def sensor_thread():
         runComputer = MissionComputer()
-        while not stop_evt.is_set():
-            runComputer.ds.set_env()
-            runComputer.env_values = runComputer.ds.get_env()
-            print('\n[THREAD-SENSOR] 센서 데이터 업데이트')
-            print(json.dumps(runComputer.env_values, indent=2, ensure_ascii=False))
-            for _ in range(50):  # 5초
-                if stop_evt.is_set():
-                    return
-                time.sleep(0.1)
+        try:
+            while not stop_evt.is_set():
+                runComputer.ds.set_env()
+                runComputer.env_values = runComputer.ds.get_env()
+                runComputer.archive_env(runComputer.env_values)
+                runComputer.check_alerts(runComputer.env_values)
+                runComputer.reporter.report('\n[THREAD-SENSOR] 센서 데이터 업데이트',
+                                            runComputer.ds.last_record)
+                for _ in range(50):  # 5초
+                    if stop_evt.is_set():
+                        return
+                    time.sleep(0.1)
+        finally:
+            runComputer.close_archive()
 
     threads = [
         threading.Thread(target=info_thread, daemon=True),
@@ -488,13 +650,16 @@ def run_multiprocessing():
     print('=== 멀티프로세스 모드 ===')
     print('종료하려면 q를 입력하세요.')
 
-    manager = multiprocessing.Manager()
-    stop_evt = manager.Event()
+    # Manager 프록시 대신 공유 세마포어 기반 Event (is_set 마다 IPC 왕복 없음)
+    stop_evt = multiprocessing.Event()
+    bus = TelemetryBus.create(capacity=1024)
+    aggregator = TelemetryAggregator(bus)
+    bus_args = (stop_evt, bus.name, bus.capacity, get_default_reporter().mode)
 
     processes = [
-        multiprocessing.Process(target=process_info_worker, args=(stop_evt,), name='runComputer1'),
-        multiprocessing.Process(target=process_load_worker, args=(stop_evt,), name='runComputer2'),
-        multiprocessing.Process(target=process_sensor_worker, args=(stop_evt,), name='runComputer3')
+        multiprocessing.Process(target=process_info_worker, args=bus_args, name='runComputer1'),
+        multiprocessing.Process(target=process_load_worker, args=bus_args, name='runComputer2'),
+        multiprocessing.Process(target=process_sensor_worker, args=bus_args, name='runComputer3')
     ]
 
     for process in processes:
@@ -504,6 +669,7 @@ def run_multiprocessing():
     try:
         while True:
             ready, _, _ = select.select([sys.stdin], [], [], 0.1)
+            aggregator.poll()
             if ready:
                 user_input = sys.stdin.readline().strip().lower()
                 if user_input == 'q':
@@ -518,9 +684,61 @@ def run_multiprocessing():
             if process.is_alive():
                 process.terminate()
                 process.join()
+        aggregator.poll()
+        print('=== 텔레메트리 집계 결과 ===')
+        print(json.dumps(aggregator.summary(), indent=2, ensure_ascii=False))
+        bus.close()
         print('[PROCESS] 멀티프로세스 종료 완료')
 
 
+def run_asyncio(virtual_sensors: int = 1):
+    """asyncio 모드 실행: 모든 수집기를 단일 이벤트 루프의 코루틴으로 실행"""
+    print('=== asyncio 모드 ===')
+    print('종료하려면 q를 입력하세요.')
+
+    runtime = AsyncRuntime()
+    computer = MissionComputer()
+
+    reporter = computer.reporter
+
+    def info_collector():
+        reporter.message('\n[ASYNC-INFO] 시스템 정보 업데이트')
+        computer.get_mission_computer_info()
+
+    def load_collector():
+        reporter.message('\n[ASYNC-LOAD] 부하 정보 업데이트')
+        computer.get_mission_computer_load()
+
+    def make_sensor_collector(index: int):
+        sensor = DummySensor()
+
+        def sensor_collector():
+            sensor.set_env()
+            env_values = sensor.get_env()
+            computer.archive_env(env_values, index)
+            computer.check_alerts(env_values, index)
+            reporter.report(f'\n[ASYNC-SENSOR-{index}] 센서 데이터 업데이트', sensor.last_record)
+        return sensor_collector
+
+    runtime.add_collector('info', 20, info_collector)
+    runtime.add_collector('load', 20, load_collector)
+    for i in range(virtual_sensors):
+        runtime.add_collector(f'sensor-{i}', 5, make_sensor_collector(i))
+
+    try:
+        stats = asyncio.run(runtime.run())
+        total_ticks = sum(s.ticks for s in stats.values())
+        total_overruns = sum(s.overruns for s in stats.values())
+        max_lag = max((s.max_lag for s in stats.values()), default=0.0)
+        print(f'[ASYNC] 수집 {total_ticks}회, 건너뛴 주기 {total_overruns}회, '
+              f'최대 지연 {max_lag * 1000:.1f}ms')
+    except KeyboardInterrupt:
+        pass
+    finally:
+        computer.close_archive()
+        print('[ASYNC] asyncio 종료 완료')
+
+
 if __name__ == '__main__':
     print('=== 화성 미션 컴퓨터 시뮬레이션 ===')
 
@@ -538,13 +756,20 @@ if __name__ == '__main__':
     runComputer.get_mission_computer_info()
     runComputer.get_mission_computer_load()
 
+    console_mode = input(f'출력 모드 선택 ({"/".join(MODES)}, 기본 pretty): ').strip() or 'pretty'
+    if console_mode in MODES:
+        set_default_reporter(ConsoleReporter(console_mode))
+    else:
+        print(f'알 수 없는 출력 모드({console_mode}), pretty 로 실행합니다.')
+
     print('\n실행 모드 선택:')
     print('1: 기본 모드 (센서 데이터 수집)')
     print('2: 멀티스레드 모드 (q 종료 가능)')
     print('3: 멀티프로세스 모드 (q 종료 가능)')
+    print('4: asyncio 모드 (q 종료 가능)')
 
     try:
-        choice = input('모드 선택 (1-3): ').strip()
+        choice = input('모드 선택 (1-4): ').strip()
 
         if choice == '1':
             # 문제 2: RunComputer 인스턴스의 get_sensor_data() 호출
@@ -554,6 +779,9 @@ if __name__ == '__main__':
             run_multithreaded()
         elif choice == '3':
             run_multiprocessing()
+        elif choice == '4':
+            count = input('가상 센서 수 (기본 1): ').strip()
+            run_asyncio(int(count) if count else 1)
         else:
             print('잘못된 선택입니다.')
 
@@ -0,0 +1,114 @@
+# rolling_window.py
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Tuple
+
+
+class _MetricWindow:
+    """단일 지표의 누적 합/제곱합 + 최소/최대용 단조 deque"""
+
+    __slots__ = ('total', 'total_sq', 'count', 'min_q', 'max_q')
+
+    def __init__(self):
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.count = 0
+        # (seq, value) 쌍. min_q 는 값 오름차순, max_q 는 값 내림차순 유지
+        self.min_q: Deque[Tuple[int, float]] = deque()
+        self.max_q: Deque[Tuple[int, float]] = deque()
+
+    def push(self, seq: int, value: float) -> None:
+        self.total += value
+        self.total_sq += value * value
+        self.count += 1
+        while self.min_q and self.min_q[-1][1] >= value:
+            self.min_q.pop()
+        self.min_q.append((seq, value))
+        while self.max_q and self.max_q[-1][1] <= value:
+            self.max_q.pop()
+        self.max_q.append((seq, value))
+
+    def pop(self, seq: int, value: float) -> None:
+        self.total -= value
+        self.total_sq -= value * value
+        self.count -= 1
+        if self.min_q and self.min_q[0][0] == seq:
+            self.min_q.popleft()
+        if self.max_q and self.max_q[0][0] == seq:
+            self.max_q.popleft()
+        if self.count == 0:
+            # 부동소수 누적 오차 초기화
+            self.total = 0.0
+            self.total_sq = 0.0
+
+
+class RollingWindowAggregator:
+    """
+    시간 기반 롤링 윈도우 집계기
+
+    - 새 값 추가/만료 제거 모두 지표당 O(1) (min/max 는 상각 O(1))
+    - 윈도우 밖 데이터는 타임스탬프 기준으로 deque 에서 제거되므로
+      메모리는 윈도우 길이 안의 샘플 수에만 비례
+    """
+
+    def __init__(self, window_seconds: float = 300, keys: Optional[Iterable[str]] = None):
+        if window_seconds <= 0:
+            raise ValueError('window_seconds 는 0보다 커야 합니다.')
+        self.window_seconds = window_seconds
+        self._entries: Deque[Tuple[int, float, Dict[str, float]]] = deque()
+        self._metrics: Dict[str, _MetricWindow] = {}
+        self._seq = 0
+        for key in keys or ():
+            self._metrics[key] = _MetricWindow()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, values: Dict[str, float], timestamp: Optional[float] = None) -> None:
+        """새 샘플 추가 (timestamp 미지정 시 현재 시각)"""
+        now = time.time() if timestamp is None else timestamp
+        self._seq += 1
+        sample = {}
+        for key, value in values.items():
+            if not isinstance(value, (int, float)):
+                continue
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = self._metrics[key] = _MetricWindow()
+            metric.push(self._seq, value)
+            sample[key] = value
+        self._entries.append((self._seq, now, sample))
+        self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """윈도우를 벗어난 샘플 제거"""
+        cutoff = now - self.window_seconds
+        entries = self._entries
+        while entries and entries[0][1] <= cutoff:
+            seq, _, sample = entries.popleft()
+            for key, value in sample.items():
+                self._metrics[key].pop(seq, value)
+
+    def stats(self, key: str, now: Optional[float] = None) -> Dict[str, float]:
+        """단일 지표의 현재 윈도우 통계 (count/mean/min/max/stddev)"""
+        if now is not None:
+            self._evict(now)
+        metric = self._metrics.get(key)
+        if metric is None or metric.count == 0:
+            return {'count': 0}
+        mean = metric.total / metric.count
+        variance = max(metric.total_sq / metric.count - mean * mean, 0.0)
+        return {
+            'count': metric.count,
+            'mean': mean,
+            'min': metric.min_q[0][1],
+            'max': metric.max_q[0][1],
+            'stddev': math.sqrt(variance)
+        }
+
+    def snapshot(self, now: Optional[float] = None) -> Dict[str, Dict[str, float]]:
+        """모든 지표의 현재 윈도우 통계"""
+        if now is not None:
+            self._evict(now)
+        return {key: self.stats(key) for key in self._metrics}
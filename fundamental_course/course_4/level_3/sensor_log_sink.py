@@ -0,0 +1,231 @@
+# sensor_log_sink.py
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+LOG_FORMAT_PRETTY = 'pretty'  # 기존 형식: indent=2 JSON 블록
+LOG_FORMAT_JSONL = 'jsonl'  # 한 줄에 레코드 하나 (JSON-Lines)
+
+DEFAULT_LOG_PATH = os.path.join('result', 'mars_base_env_log.txt')
+
+
+class SerializedRecord:
+    """
+    tick 당 한 번만 직렬화하도록 형식별 문자열을 캐시하는 레코드
+
+    로그 싱크와 콘솔 리포터가 같은 객체를 공유하면 json.dumps 가 형식당 1회로 줄어듦
+    """
+
+    __slots__ = ('data', '_texts')
+
+    def __init__(self, data: Dict):
+        self.data = data
+        self._texts: Dict[str, str] = {}
+
+    def text(self, log_format: str = LOG_FORMAT_PRETTY) -> str:
+        """개행 없는 직렬화 문자열 (형식별 최초 1회만 json.dumps)"""
+        text = self._texts.get(log_format)
+        if text is None:
+            if log_format == LOG_FORMAT_JSONL:
+                text = json.dumps(self.data, ensure_ascii=False, separators=(',', ':'))
+            else:
+                text = json.dumps(self.data, ensure_ascii=False, indent=2)
+            self._texts[log_format] = text
+        return text
+
+
+def serialize_record(record, log_format: str = LOG_FORMAT_PRETTY) -> str:
+    """로그 레코드(dict 또는 SerializedRecord)를 한 건의 문자열(개행 포함)로 직렬화"""
+    if not isinstance(record, SerializedRecord):
+        record = SerializedRecord(record)
+    return record.text(log_format) + '\n'
+
+
+class LogSink:
+    """센서 로그 싱크 기본 클래스"""
+
+    def write(self, record) -> None:
+        """record: dict 또는 SerializedRecord"""
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class DirectFileLogSink(LogSink):
+    """기존 방식: 매 호출마다 파일 open → write → close"""
+
+    def __init__(self, path: str = DEFAULT_LOG_PATH, log_format: str = LOG_FORMAT_PRETTY):
+        self.path = path
+        self.log_format = log_format
+
+    def write(self, record) -> None:
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(serialize_record(record, self.log_format))
+        except IOError as e:
+            print(f'로그 파일 기록 실패: {e}')
+
+
+class BufferedLogSink(LogSink):
+    """
+    링 버퍼 기반 배치 로그 싱크
+
+    - capacity 건이 쌓이면 즉시 flush (크기 기준)
+    - flush_interval 초가 지나면 flush (시간 기준, 백그라운드 타이머)
+    - 파일 핸들은 열어둔 채 재사용하여 레코드당 open/close 를 없앰
+    - 여러 센서 워커가 공유할 수 있도록 lock 으로 보호
+    """
+
+    def __init__(self, path: str = DEFAULT_LOG_PATH, log_format: str = LOG_FORMAT_PRETTY,
+                 capacity: int = 64, flush_interval: Optional[float] = 1.0):
+        if capacity <= 0:
+            raise ValueError('capacity 는 1 이상이어야 합니다.')
+        self.path = path
+        self.log_format = log_format
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+
+        # 고정 크기 링 버퍼 (미리 할당 후 인덱스만 이동)
+        self._ring: List[Optional[object]] = [None] * capacity
+        self._head = 0
+        self._count = 0
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._closed = False
+        self._last_flush = time.monotonic()
+
+        self.records_written = 0
+        self.flush_count = 0
+
+        self._stop_evt = threading.Event()
+        self._timer: Optional[threading.Thread] = None
+        if flush_interval:
+            self._timer = threading.Thread(target=self._flush_loop, name='LogSink-Flusher', daemon=True)
+            self._timer.start()
+
+    def write(self, record) -> None:
+        with self._lock:
+            if self._closed:
+                raise ValueError('이미 종료된 로그 싱크입니다.')
+            self._ring[(self._head + self._count) % self.capacity] = record
+            self._count += 1
+            if self._count >= self.capacity:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """남은 버퍼를 모두 기록하고 파일과 타이머를 정리"""
+        self._stop_evt.set()
+        if self._timer is not None and self._timer is not threading.current_thread():
+            self._timer.join(timeout=1)
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._closed = True
+
+    def pending(self) -> int:
+        """아직 파일에 기록되지 않은 레코드 수"""
+        with self._lock:
+            return self._count
+
+    def _flush_loop(self) -> None:
+        """flush_interval 마다 버퍼를 비우는 백그라운드 루프"""
+        while not self._stop_evt.wait(self.flush_interval):
+            with self._lock:
+                if self._count and time.monotonic() - self._last_flush >= self.flush_interval:
+                    self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """lock 을 잡은 상태에서 호출: 버퍼 내용을 한 번의 write 로 기록"""
+        self._last_flush = time.monotonic()
+        if not self._count:
+            return
+
+        chunks = []
+        for i in range(self._count):
+            idx = (self._head + i) % self.capacity
+            chunks.append(serialize_record(self._ring[idx], self.log_format))
+            self._ring[idx] = None
+
+        try:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(''.join(chunks))
+            self._file.flush()
+            self.records_written += self._count
+            self.flush_count += 1
+        except IOError as e:
+            print(f'로그 파일 기록 실패: {e}')
+        finally:
+            # 기록 실패 시에도 버퍼를 비워 메모리가 무한히 늘지 않도록 함
+            self._head = (self._head + self._count) % self.capacity
+            self._count = 0
+
+
+def create_log_sink(mode: str = 'buffered', path: str = DEFAULT_LOG_PATH,
+                    log_format: str = LOG_FORMAT_PRETTY, **kwargs) -> LogSink:
+    """모드 이름으로 로그 싱크 생성 ('direct' | 'buffered')"""
+    if mode == 'direct':
+        return DirectFileLogSink(path, log_format)
+    if mode == 'buffered':
+        return BufferedLogSink(path, log_format, **kwargs)
+    raise ValueError(f'지원하지 않는 로그 싱크 모드: {mode}')
+
+
+def benchmark_log_sinks(records: int = 20000) -> Dict[str, float]:
+    """기존 방식(매 호출 open/close)과 버퍼 싱크의 처리량(records/s) 비교"""
+    sample = {
+        'datetime': '2025-01-01 00:00:00',
+        'mars_base_internal_temperature': 24.51,
+        'mars_base_external_temperature': 10.02,
+        'mars_base_internal_humidity': 55.5,
+        'mars_base_external_illuminance': 612.3,
+        'mars_base_internal_co2': 0.0512,
+        'mars_base_internal_oxygen': 5.21
+    }
+    cases = [
+        ('direct-pretty', lambda p: DirectFileLogSink(p, LOG_FORMAT_PRETTY)),
+        ('buffered-pretty', lambda p: BufferedLogSink(p, LOG_FORMAT_PRETTY, capacity=256, flush_interval=None)),
+        ('buffered-jsonl', lambda p: BufferedLogSink(p, LOG_FORMAT_JSONL, capacity=256, flush_interval=None)),
+    ]
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, factory in cases:
+            path = os.path.join(tmp_dir, f'{name}.txt')
+            sink = factory(path)
+            start = time.perf_counter()
+            for _ in range(records):
+                sink.write(sample)
+            sink.close()
+            elapsed = time.perf_counter() - start
+            results[name] = round(records / elapsed, 1)
+            print(f'{name:<16} {results[name]:>12,.1f} records/s '
+                  f'({os.path.getsize(path) / 1024:,.1f} KB)')
+    return results
+
+
+if __name__ == '__main__':
+    print('=== 로그 싱크 처리량 비교 ===')
+    benchmark_log_sinks()
@@ -0,0 +1,116 @@
+# sensor_simulator.py
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# (지표 이름, 최소값, 최대값, 소수점 자릿수) - DummySensor.set_env 와 동일한 범위
+ENV_METRICS = [
+    ('mars_base_internal_temperature', 18, 30, 2),
+    ('mars_base_external_temperature', 0, 21, 2),
+    ('mars_base_internal_humidity', 50, 60, 2),
+    ('mars_base_external_illuminance', 500, 715, 2),
+    ('mars_base_internal_co2', 0.02, 0.1, 4),
+    ('mars_base_internal_oxygen', 4, 7, 2),
+]
+ENV_KEYS: List[str] = [m[0] for m in ENV_METRICS]
+
+_LOW = np.array([m[1] for m in ENV_METRICS], dtype=np.float64)
+_HIGH = np.array([m[2] for m in ENV_METRICS], dtype=np.float64)
+_DECIMALS = [m[3] for m in ENV_METRICS]
+
+# 드리프트 지표 간 상관관계 (내부 온도↔습도/CO2 양의 상관, CO2↔산소 음의 상관 등)
+DEFAULT_DRIFT_CORRELATION = np.array([
+    [1.0, 0.3, 0.4, 0.0, 0.3, -0.2],
+    [0.3, 1.0, 0.0, 0.5, 0.0, 0.0],
+    [0.4, 0.0, 1.0, 0.0, 0.2, -0.1],
+    [0.0, 0.5, 0.0, 1.0, 0.0, 0.0],
+    [0.3, 0.0, 0.2, 0.0, 1.0, -0.6],
+    [-0.2, 0.0, -0.1, 0.0, -0.6, 1.0],
+])
+
+
+class BatchSensorSimulator:
+    """
+    다수 기지/센서 환경값을 한 번에 생성하는 벡터화 시뮬레이터
+
+    - tick() 한 번에 (N, 6) 배열 생성 (열 순서는 ENV_KEYS)
+    - seed 지정 시 재현 가능
+    - drift > 0 이면 상관된 랜덤 워크로 센서별 값이 서서히 이동
+      (drift 는 각 지표 범위 대비 tick 당 표준편차 비율)
+    """
+
+    def __init__(self, n_sensors: int, seed: Optional[int] = None, drift: float = 0.0,
+                 correlation: Optional[np.ndarray] = None):
+        if n_sensors <= 0:
+            raise ValueError('n_sensors 는 1 이상이어야 합니다.')
+        self.n_sensors = n_sensors
+        self.drift = drift
+        self.rng = np.random.default_rng(seed)
+        self.values = np.empty((n_sensors, len(ENV_METRICS)), dtype=np.float64)
+        self.tick_count = 0
+
+        corr = DEFAULT_DRIFT_CORRELATION if correlation is None else np.asarray(correlation, dtype=np.float64)
+        self._chol = np.linalg.cholesky(corr)
+        self._span = _HIGH - _LOW
+        # 드리프트 모드: 범위 중앙 근처에서 출발하는 정규화 상태 [0, 1]
+        self._state = self.rng.uniform(0.25, 0.75, size=self.values.shape) if drift > 0 else None
+
+    def tick(self) -> np.ndarray:
+        """전체 센서의 다음 측정값 생성 후 (N, 6) 배열 반환 (내부 버퍼 재사용)"""
+        if self._state is None:
+            unit = self.rng.random(self.values.shape)
+        else:
+            noise = self.rng.standard_normal(self.values.shape) @ self._chol.T
+            self._state += noise * self.drift
+            # 범위 경계에서 반사시켜 [0, 1] 유지
+            np.abs(self._state, out=self._state)
+            np.subtract(1.0, np.abs(1.0 - self._state), out=self._state)
+            np.clip(self._state, 0.0, 1.0, out=self._state)
+            unit = self._state
+
+        np.multiply(unit, self._span, out=self.values)
+        self.values += _LOW
+        for col, decimals in enumerate(_DECIMALS):
+            np.round(self.values[:, col], decimals, out=self.values[:, col])
+        self.tick_count += 1
+        return self.values
+
+    def row(self, index: int) -> Dict[str, float]:
+        """단일 센서의 최신 값을 DummySensor.env_values 형식 dict 로 반환"""
+        return dict(zip(ENV_KEYS, self.values[index].tolist()))
+
+
+def benchmark_simulator(n_sensors: int = 5000, ticks: int = 20) -> Dict[str, float]:
+    """DummySensor.set_env 와 같은 스칼라 생성 방식과 벡터화 tick 의 초당 샘플 수 비교"""
+    import random
+
+    def scalar_tick():
+        env = {}
+        for key, low, high, decimals in ENV_METRICS:
+            env[key] = round(random.uniform(low, high), decimals)
+        return env
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for _ in range(n_sensors):
+            scalar_tick()
+    scalar_elapsed = time.perf_counter() - start
+
+    results = {'scalar': round(n_sensors * ticks / scalar_elapsed, 1)}
+    for drift in (0.0, 0.02):
+        sim = BatchSensorSimulator(n_sensors, seed=42, drift=drift)
+        start = time.perf_counter()
+        for _ in range(ticks):
+            sim.tick()
+        elapsed = time.perf_counter() - start
+        results[f'vectorized(drift={drift})'] = round(n_sensors * ticks / elapsed, 1)
+
+    for name, rate in results.items():
+        print(f'{name:<24} {rate:>14,.1f} samples/s')
+    return results
+
+
+if __name__ == '__main__':
+    print('=== 센서 시뮬레이터 처리량 비교 ===')
+    benchmark_simulator()
@@ -0,0 +1,164 @@
+# system_sampler.py
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+PROC_STAT_PATH = '/proc/stat'
+PROC_MEMINFO_PATH = '/proc/meminfo'
+MIN_CPU_WINDOW = 0.1  # 첫 CPU 사용률을 계산할 최소 구간 (초)
+
+
+@dataclass(frozen=True)
+class SystemSample:
+    """한 주기의 시스템 부하 스냅샷 (불변 객체라 락 없이 공유 가능)"""
+    timestamp: float
+    cpu_percent: Optional[float]
+    per_core_percent: Tuple[float, ...]
+    mem_total_kb: int
+    mem_available_kb: int
+
+    @property
+    def memory_percent(self) -> Optional[float]:
+        if self.mem_total_kb <= 0:
+            return None
+        return round((self.mem_total_kb - self.mem_available_kb) / self.mem_total_kb * 100, 1)
+
+
+def _read_cpu_times(path: str = PROC_STAT_PATH) -> Dict[str, Tuple[int, int]]:
+    """/proc/stat 의 cpu 라인들을 {이름: (idle, total)} 로 파싱"""
+    times = {}
+    with open(path, 'r') as f:
+        for line in f:
+            if not line.startswith('cpu'):
+                break
+            parts = line.split()
+            values = list(map(int, parts[1:]))
+            # idle + iowait 를 유휴 시간으로 간주
+            idle = values[3] + (values[4] if len(values) > 4 else 0)
+            times[parts[0]] = (idle, sum(values))
+    return times
+
+
+def _read_meminfo(path: str = PROC_MEMINFO_PATH) -> Dict[str, int]:
+    """/proc/meminfo 를 {키: kB 값} 으로 파싱"""
+    mem_info = {}
+    with open(path, 'r') as f:
+        for line in f:
+            key, _, rest = line.partition(':')
+            fields = rest.split()
+            if fields:
+                mem_info[key.strip()] = int(fields[0])
+    return mem_info
+
+
+def _usage_percent(prev: Tuple[int, int], curr: Tuple[int, int]) -> Optional[float]:
+    idle_delta = curr[0] - prev[0]
+    total_delta = curr[1] - prev[1]
+    if total_delta <= 0:
+        return None
+    return round((1 - idle_delta / total_delta) * 100, 1)
+
+
+class ProcSampler:
+    """
+    /proc 백그라운드 샘플러 (Linux 전용)
+
+    - interval 마다 /proc/stat, /proc/meminfo 를 한 번씩만 파싱
+    - 직전 /proc/stat 스냅샷을 보관하여 sleep 없이 구간 CPU 사용률 계산
+    - 결과는 불변 SystemSample 로 통째로 교체하므로 읽는 쪽은 락 불필요
+    """
+
+    def __init__(self, interval: float = 1.0, stat_path: str = PROC_STAT_PATH,
+                 meminfo_path: str = PROC_MEMINFO_PATH):
+        self.interval = interval
+        self.stat_path = stat_path
+        self.meminfo_path = meminfo_path
+        # 생성 시점의 /proc/stat 을 기준값으로 잡아 첫 샘플도 부팅 이후 평균이 아닌 구간 사용률이 되도록 함
+        self._prev_times: Dict[str, Tuple[int, int]] = {}
+        self._prev_at = time.monotonic()
+        try:
+            self._prev_times = _read_cpu_times(stat_path)
+        except OSError:
+            pass
+        self._latest: Optional[SystemSample] = None
+        self._stop_evt = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def latest(self) -> Optional[SystemSample]:
+        return self._latest
+
+    def sample_once(self) -> SystemSample:
+        """즉시 한 번 샘플링하여 최신 스냅샷 갱신"""
+        curr_times = _read_cpu_times(self.stat_path)
+        # 기준값이 없는 항목은 현재값과 같게 두어 사용률을 계산하지 않음 (None)
+        prev_times = self._prev_times
+
+        cpu_percent = None
+        per_core: List[float] = []
+        for name, curr in curr_times.items():
+            usage = _usage_percent(prev_times.get(name, curr), curr)
+            if name == 'cpu':
+                cpu_percent = usage
+            else:
+                per_core.append(usage if usage is not None else 0.0)
+        self._prev_times = curr_times
+        self._prev_at = time.monotonic()
+
+        mem_info = _read_meminfo(self.meminfo_path)
+        sample = SystemSample(
+            timestamp=time.time(),
+            cpu_percent=cpu_percent,
+            per_core_percent=tuple(per_core),
+            mem_total_kb=mem_info.get('MemTotal', 0),
+            mem_available_kb=mem_info.get('MemAvailable', mem_info.get('MemFree', 0))
+        )
+        self._latest = sample
+        return sample
+
+    def start(self) -> 'ProcSampler':
+        """첫 샘플을 동기로 채운 뒤 백그라운드 스레드 시작"""
+        if self._thread is not None:
+            return self
+        # 기준값 직후에 바로 샘플링하면 구간이 너무 짧아 CPU 사용률이 부정확하므로 최초 1회만 대기
+        remaining = MIN_CPU_WINDOW - (time.monotonic() - self._prev_at)
+        if remaining > 0:
+            time.sleep(remaining)
+        self.sample_once()
+        self._stop_evt.clear()
+        self._thread = threading.Thread(target=self._run, name='ProcSampler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop_evt.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_evt.wait(self.interval):
+            try:
+                self.sample_once()
+            except Exception as e:
+                print(f'시스템 샘플링 오류: {e}')
+
+
+# 프로세스별 공유 샘플러 (fork 후에는 자식에서 새로 생성)
+_sampler: Optional[ProcSampler] = None
+_sampler_pid: Optional[int] = None
+_sampler_lock = threading.Lock()
+
+
+def get_system_sampler(interval: float = 1.0) -> Optional[ProcSampler]:
+    """현재 프로세스의 공유 샘플러 반환 (/proc 이 없으면 None)"""
+    global _sampler, _sampler_pid
+    if not os.path.exists(PROC_STAT_PATH):
+        return None
+    with _sampler_lock:
+        if _sampler is None or _sampler_pid != os.getpid():
+            _sampler = ProcSampler(interval).start()
+            _sampler_pid = os.getpid()
+        return _sampler
@@ -0,0 +1,308 @@
+# telemetry_archive.py
+import glob
+import os
+import struct
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from sensor_simulator import ENV_KEYS
+
+DEFAULT_ARCHIVE_DIR = os.path.join('result', 'archive')
+
+# ====== 세그먼트 파일 레이아웃 ======
+# [헤더 4096B][희소 시간 인덱스 float64 x (capacity / stride)][timestamp float64 x capacity]
+# [지표1 float32 x capacity] ... [지표6 float32 x capacity]
+MAGIC = b'MARSENV1'
+VERSION = 1
+HEADER_SIZE = 4096
+_HEADER_STRUCT = struct.Struct('<8sIIQQI')  # magic, version, ncols, capacity, row_count, index_stride
+_ROW_COUNT_OFFSET = 8 + 4 + 4 + 8
+
+DEFAULT_CAPACITY = 131072  # 1Hz 기준 하루(86400행) + 여유
+DEFAULT_INDEX_STRIDE = 1024
+TS_DTYPE = np.dtype('<f8')
+VALUE_DTYPE = np.dtype('<f4')
+
+
+def _layout(capacity: int, stride: int) -> Dict[str, int]:
+    """세그먼트 내 각 영역의 바이트 오프셋 계산"""
+    index_len = (capacity + stride - 1) // stride
+    index_offset = HEADER_SIZE
+    ts_offset = index_offset + index_len * TS_DTYPE.itemsize
+    values_offset = ts_offset + capacity * TS_DTYPE.itemsize
+    total = values_offset + len(ENV_KEYS) * capacity * VALUE_DTYPE.itemsize
+    return {'index_len': index_len, 'index': index_offset, 'ts': ts_offset,
+            'values': values_offset, 'total': total}
+
+
+class _Segment:
+    """하루치(또는 그 일부) 세그먼트 파일의 memmap 래퍼"""
+
+    def __init__(self, path: str, mode: str = 'r', capacity: int = DEFAULT_CAPACITY,
+                 stride: int = DEFAULT_INDEX_STRIDE):
+        self.path = path
+        if mode == 'w+':
+            layout = _layout(capacity, stride)
+            with open(path, 'wb') as f:
+                f.write(_HEADER_STRUCT.pack(MAGIC, VERSION, len(ENV_KEYS), capacity, 0, stride))
+                f.truncate(layout['total'])  # 희소 파일로 미리 공간 확보
+            mode = 'r+'
+
+        with open(path, 'rb') as f:
+            magic, version, ncols, capacity, _, stride = _HEADER_STRUCT.unpack(f.read(_HEADER_STRUCT.size))
+        if magic != MAGIC or version != VERSION or ncols != len(ENV_KEYS):
+            raise ValueError(f'아카이브 세그먼트 형식이 올바르지 않습니다: {path}')
+
+        self.capacity = capacity
+        self.stride = stride
+        layout = _layout(capacity, stride)
+        self._mm = np.memmap(path, dtype=np.uint8, mode=mode, offset=0, shape=(layout['total'],))
+        self._row_count = self._mm[_ROW_COUNT_OFFSET:_ROW_COUNT_OFFSET + 8].view('<u8')
+        self.index = self._mm[layout['index']:layout['ts']].view(TS_DTYPE)
+        self.timestamps = self._mm[layout['ts']:layout['values']].view(TS_DTYPE)
+        self.values = self._mm[layout['values']:].view(VALUE_DTYPE).reshape(len(ENV_KEYS), capacity)
+
+    @property
+    def row_count(self) -> int:
+        return int(self._row_count[0])
+
+    def append(self, timestamps: np.ndarray, values: np.ndarray) -> int:
+        """가능한 만큼 행 추가 후 추가된 행 수 반환 (값을 먼저 쓰고 row_count 로 커밋)"""
+        start = self.row_count
+        n = min(len(timestamps), self.capacity - start)
+        if n <= 0:
+            return 0
+        end = start + n
+        self.timestamps[start:end] = timestamps[:n]
+        self.values[:, start:end] = values[:n].T
+        # 새로 채워진 stride 경계마다 희소 인덱스 기록
+        first_block = (start + self.stride - 1) // self.stride
+        for block in range(first_block, (end - 1) // self.stride + 1):
+            self.index[block] = self.timestamps[block * self.stride]
+        self._row_count[0] = end
+        return n
+
+    def locate(self, start_ts: float, end_ts: float) -> slice:
+        """[start_ts, end_ts] 구간의 행 범위 (희소 인덱스로 블록을 좁힌 뒤 블록 내 이진 탐색)"""
+        rows = self.row_count
+        if rows == 0:
+            return slice(0, 0)
+        blocks = (rows + self.stride - 1) // self.stride
+        index = self.index[:blocks]
+        lo_block = max(int(np.searchsorted(index, start_ts, side='left')) - 1, 0)
+        hi_block = int(np.searchsorted(index, end_ts, side='right'))
+        lo_base = lo_block * self.stride
+        hi_limit = min(hi_block * self.stride, rows)
+        ts = self.timestamps
+        lo = lo_base + int(np.searchsorted(ts[lo_base:hi_limit], start_ts, side='left'))
+        hi = lo_base + int(np.searchsorted(ts[lo_base:hi_limit], end_ts, side='right'))
+        return slice(lo, hi)
+
+    def flush(self) -> None:
+        self._mm.flush()
+
+    def close(self) -> None:
+        if self._mm.mode != 'r':
+            self._mm.flush()
+        self._mm = None
+        self._row_count = self.index = self.timestamps = self.values = None
+
+
+@dataclass
+class ArchiveSlice:
+    """시간 구간 조회 결과 (세그먼트 memmap 위의 numpy 뷰)"""
+    path: str
+    timestamps: np.ndarray
+    values: np.ndarray  # (6, n) - 행 순서는 ENV_KEYS
+
+    def column(self, key: str) -> np.ndarray:
+        return self.values[ENV_KEYS.index(key)]
+
+
+def _segment_prefix(base_dir: str, day: datetime) -> str:
+    return os.path.join(base_dir, f'env_{day.strftime("%Y%m%d")}')
+
+
+class TelemetryArchiveWriter:
+    """
+    일별 세그먼트에 환경값을 추가 기록하는 단일 writer
+
+    - timestamp 는 세그먼트 안에서 단조 증가해야 함 (이진 탐색 전제)
+    - 세그먼트 용량을 넘으면 같은 날짜의 다음 파트(env_YYYYMMDD_1.bin ...)로 넘어감
+    """
+
+    def __init__(self, base_dir: str = DEFAULT_ARCHIVE_DIR, capacity: int = DEFAULT_CAPACITY,
+                 index_stride: int = DEFAULT_INDEX_STRIDE):
+        self.base_dir = base_dir
+        self.capacity = capacity
+        self.index_stride = index_stride
+        os.makedirs(base_dir, exist_ok=True)
+        self._segment: Optional[_Segment] = None
+        self._day: Optional[str] = None
+        self._last_ts = float('-inf')
+
+    def append(self, timestamp: float, env_values: Dict[str, float]) -> None:
+        """한 건 추가"""
+        row = np.array([[env_values.get(key, np.nan) for key in ENV_KEYS]], dtype=VALUE_DTYPE)
+        self.append_many(np.array([timestamp], dtype=TS_DTYPE), row)
+
+    def append_many(self, timestamps: Sequence[float], values: np.ndarray) -> None:
+        """여러 건 일괄 추가 (values 는 (n, 6), 열 순서 ENV_KEYS)"""
+        timestamps = np.asarray(timestamps, dtype=TS_DTYPE)
+        values = np.asarray(values, dtype=VALUE_DTYPE)
+        if len(timestamps) == 0:
+            return
+        if timestamps[0] < self._last_ts or np.any(np.diff(timestamps) < 0):
+            raise ValueError('아카이브 timestamp 는 단조 증가해야 합니다.')
+
+        pos = 0
+        while pos < len(timestamps):
+            day = datetime.fromtimestamp(float(timestamps[pos])).strftime('%Y%m%d')
+            # 같은 날짜에 속하는 연속 구간만 현재 세그먼트에 기록
+            day_end = datetime.strptime(day, '%Y%m%d') + timedelta(days=1)
+            end = pos + int(np.searchsorted(timestamps[pos:], day_end.timestamp(), side='left'))
+            segment = self._open_segment(day)
+            written = segment.append(timestamps[pos:end], values[pos:end])
+            if written == 0:
+                self._roll_segment(day)
+                continue
+            pos += written
+        self._last_ts = float(timestamps[-1])
+
+    def _open_segment(self, day: str) -> _Segment:
+        if self._segment is not None and self._day == day:
+            return self._segment
+        self.close()
+        prefix = _segment_prefix(self.base_dir, datetime.strptime(day, '%Y%m%d'))
+        parts = _list_parts(prefix)
+        if parts:
+            self._segment = _Segment(parts[-1], 'r+')
+        else:
+            self._segment = _Segment(f'{prefix}.bin', 'w+', self.capacity, self.index_stride)
+        self._day = day
+        return self._segment
+
+    def _roll_segment(self, day: str) -> None:
+        """현재 세그먼트가 가득 찼을 때 다음 파트 파일 생성"""
+        prefix = _segment_prefix(self.base_dir, datetime.strptime(day, '%Y%m%d'))
+        part_no = len(_list_parts(prefix))
+        self.close()
+        self._segment = _Segment(f'{prefix}_{part_no}.bin', 'w+', self.capacity, self.index_stride)
+        self._day = day
+
+    def flush(self) -> None:
+        if self._segment is not None:
+            self._segment.flush()
+
+    def close(self) -> None:
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+            self._day = None
+
+
+def _list_parts(prefix: str) -> List[str]:
+    """한 날짜의 세그먼트 파트 파일 목록 (파트 번호 순)"""
+    parts = glob.glob(f'{prefix}.bin') + glob.glob(f'{prefix}_*.bin')
+
+    def part_no(path: str) -> int:
+        stem = os.path.basename(path)[:-4]
+        return int(stem.rsplit('_', 1)[1]) if stem.count('_') > 1 else 0
+    return sorted(parts, key=part_no)
+
+
+class TelemetryArchiveReader:
+    """memmap 기반 아카이브 조회 (쓰기 중인 세그먼트도 커밋된 행까지 읽을 수 있음)"""
+
+    def __init__(self, base_dir: str = DEFAULT_ARCHIVE_DIR):
+        self.base_dir = base_dir
+        self._segments: Dict[str, _Segment] = {}
+
+    def _segment(self, path: str) -> _Segment:
+        if path not in self._segments:
+            self._segments[path] = _Segment(path, 'r')
+        return self._segments[path]
+
+    def iter_range(self, start_ts: float, end_ts: float) -> Iterator[ArchiveSlice]:
+        """구간에 걸친 세그먼트별로 numpy 뷰 반환 (복사 없음)"""
+        day = datetime.fromtimestamp(start_ts).replace(hour=0, minute=0, second=0, microsecond=0)
+        last_day = datetime.fromtimestamp(end_ts)
+        while day <= last_day:
+            for path in _list_parts(_segment_prefix(self.base_dir, day)):
+                segment = self._segment(path)
+                rows = segment.locate(start_ts, end_ts)
+                if rows.stop > rows.start:
+                    yield ArchiveSlice(path, segment.timestamps[rows], segment.values[:, rows])
+            day += timedelta(days=1)
+
+    def load_range(self, start_ts: float, end_ts: float) -> ArchiveSlice:
+        """구간 전체를 하나로 반환 (세그먼트가 하나면 뷰, 여러 개면 연결 복사)"""
+        slices = list(self.iter_range(start_ts, end_ts))
+        if len(slices) == 1:
+            return slices[0]
+        if not slices:
+            return ArchiveSlice('', np.empty(0, dtype=TS_DTYPE),
+                                np.empty((len(ENV_KEYS), 0), dtype=VALUE_DTYPE))
+        return ArchiveSlice('', np.concatenate([s.timestamps for s in slices]),
+                            np.concatenate([s.values for s in slices], axis=1))
+
+    def mean(self, start_ts: float, end_ts: float) -> Dict[str, float]:
+        """구간 평균 (세그먼트별 합/개수를 합산하므로 연결 복사 없음)"""
+        totals = np.zeros(len(ENV_KEYS), dtype=np.float64)
+        count = 0
+        for s in self.iter_range(start_ts, end_ts):
+            totals += s.values.sum(axis=1, dtype=np.float64)
+            count += s.values.shape[1]
+        if count == 0:
+            return {}
+        return {key: float(total / count) for key, total in zip(ENV_KEYS, totals)}
+
+    def close(self) -> None:
+        for segment in self._segments.values():
+            segment.close()
+        self._segments.clear()
+
+
+def benchmark_archive(rows: int = 86400) -> Dict[str, float]:
+    """1Hz 하루치 데이터 기록 후 로드/평균 시간(ms) 측정"""
+    from sensor_simulator import BatchSensorSimulator
+
+    sim = BatchSensorSimulator(rows, seed=7)
+    values = sim.tick().copy()
+    day_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+    timestamps = day_start + np.arange(rows, dtype=np.float64)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        writer = TelemetryArchiveWriter(tmp_dir)
+        start = time.perf_counter()
+        writer.append_many(timestamps, values)
+        writer.close()
+        results['write_ms'] = (time.perf_counter() - start) * 1000
+
+        reader = TelemetryArchiveReader(tmp_dir)
+        start = time.perf_counter()
+        means = reader.mean(day_start, day_start + rows)
+        results['day_mean_ms'] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        hour = reader.load_range(day_start + 3600 * 12, day_start + 3600 * 13)
+        hour_avg = float(hour.column('mars_base_internal_temperature').mean())
+        results['hour_query_ms'] = (time.perf_counter() - start) * 1000
+        reader.close()
+
+    for name, ms in results.items():
+        print(f'{name:<14} {ms:>10.2f} ms')
+    print(f'하루 평균 내부 온도: {means["mars_base_internal_temperature"]:.2f}, '
+          f'12시대 평균: {hour_avg:.2f} ({hour.timestamps.size}행)')
+    return results
+
+
+if __name__ == '__main__':
+    print('=== 텔레메트리 아카이브 벤치마크 ===')
+    benchmark_archive()
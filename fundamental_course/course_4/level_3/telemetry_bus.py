@@ -0,0 +1,168 @@
+# telemetry_bus.py
+import math
+import os
+import time
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from rolling_window import RollingWindowAggregator
+
+# 레코드 종류 = 레인 번호 (레인마다 writer 프로세스 하나: 단일 생산자 링 버퍼)
+KIND_SENSOR = 0
+KIND_LOAD = 1
+KIND_INFO = 2
+KIND_NAMES = {KIND_SENSOR: 'sensor', KIND_LOAD: 'load', KIND_INFO: 'info'}
+LANE_COUNT = len(KIND_NAMES)
+
+MAX_VALUES = 8
+
+# 종류별 values 배열 의미
+VALUE_FIELDS = {
+    KIND_SENSOR: [
+        'mars_base_internal_temperature',
+        'mars_base_external_temperature',
+        'mars_base_internal_humidity',
+        'mars_base_external_illuminance',
+        'mars_base_internal_co2',
+        'mars_base_internal_oxygen'
+    ],
+    KIND_LOAD: ['cpu_usage_percent', 'memory_usage_percent'],
+    KIND_INFO: ['cpu_cores', 'memory_total_gb'],
+}
+
+# 고정 레이아웃 레코드 (seq: 레인 내 1부터 증가하는 일련번호, 0 은 빈 슬롯)
+RECORD_DTYPE = np.dtype([
+    ('seq', '<u8'),
+    ('timestamp', '<f8'),
+    ('pid', '<u4'),
+    ('kind', 'u1'),
+    ('count', 'u1'),
+    ('values', '<f8', (MAX_VALUES,)),
+], align=True)
+
+# 헤더: 레인별 누적 write 카운터 (uint64)
+_HEADER_DTYPE = np.dtype('<u8')
+_HEADER_SIZE = 64  # 캐시 라인 정렬
+
+
+def _to_float(value) -> float:
+    return float(value) if isinstance(value, (int, float)) else math.nan
+
+
+class TelemetryBus:
+    """
+    multiprocessing.shared_memory 기반 텔레메트리 링 버퍼
+
+    - 레인(sensor/load/info)마다 고정 크기 링, 단일 writer 라 락 불필요
+    - 부모 프로세스는 numpy 뷰로 공유 메모리를 그대로 읽음 (복사 없음)
+    """
+
+    def __init__(self, name: Optional[str] = None, capacity: int = 1024, create: bool = False):
+        self.capacity = capacity
+        size = _HEADER_SIZE + LANE_COUNT * capacity * RECORD_DTYPE.itemsize
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=size if create else 0)
+        self.owner = create
+        self._counters = np.ndarray((LANE_COUNT,), dtype=_HEADER_DTYPE, buffer=self.shm.buf, offset=0)
+        self._records = np.ndarray((LANE_COUNT, capacity), dtype=RECORD_DTYPE,
+                                   buffer=self.shm.buf, offset=_HEADER_SIZE)
+        if create:
+            self._counters[:] = 0
+            self._records['seq'] = 0
+        self._read_pos = [int(c) for c in self._counters]
+        self.dropped = [0] * LANE_COUNT
+
+    @classmethod
+    def create(cls, capacity: int = 1024) -> 'TelemetryBus':
+        return cls(capacity=capacity, create=True)
+
+    @classmethod
+    def attach(cls, name: str, capacity: int) -> 'TelemetryBus':
+        return cls(name=name, capacity=capacity, create=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def publish(self, kind: int, values: Sequence) -> None:
+        """레코드 한 건 기록 (해당 레인의 유일한 writer 에서만 호출)"""
+        seq = int(self._counters[kind]) + 1
+        slot = self._records[kind, (seq - 1) % self.capacity]
+        count = min(len(values), MAX_VALUES)
+        slot['timestamp'] = time.time()
+        slot['pid'] = os.getpid()
+        slot['kind'] = kind
+        slot['count'] = count
+        slot['values'][:count] = [_to_float(v) for v in values[:count]]
+        slot['seq'] = seq
+        self._counters[kind] = seq
+
+    def poll(self, kind: int) -> List[np.ndarray]:
+        """
+        마지막 poll 이후 새 레코드를 공유 메모리 뷰(최대 2개 조각)로 반환
+
+        반환된 뷰는 writer 가 링을 한 바퀴 돌기 전까지만 유효하므로 즉시 소비해야 함
+        """
+        write_pos = int(self._counters[kind])
+        read_pos = self._read_pos[kind]
+        if write_pos - read_pos > self.capacity:
+            # 읽기가 늦어 덮어써진 구간은 건너뜀
+            self.dropped[kind] += write_pos - read_pos - self.capacity
+            read_pos = write_pos - self.capacity
+        if write_pos == read_pos:
+            return []
+
+        start = read_pos % self.capacity
+        end = write_pos % self.capacity
+        lane = self._records[kind]
+        if start < end:
+            chunks = [lane[start:end]]
+        else:
+            chunks = [lane[start:], lane[:end]]
+        self._read_pos[kind] = write_pos
+        return [c for c in chunks if len(c)]
+
+    def close(self) -> None:
+        # numpy 뷰를 먼저 해제해야 SharedMemory 를 닫을 수 있음
+        self._counters = None
+        self._records = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class TelemetryAggregator:
+    """부모 프로세스에서 버스를 읽어 종류별 최신값/건수/센서 5분 통계를 유지"""
+
+    def __init__(self, bus: TelemetryBus, window_seconds: float = 300):
+        self.bus = bus
+        self.counts = {kind: 0 for kind in KIND_NAMES}
+        self.latest: Dict[int, Dict[str, float]] = {}
+        self.sensor_window = RollingWindowAggregator(window_seconds, VALUE_FIELDS[KIND_SENSOR])
+
+    def poll(self) -> int:
+        """모든 레인의 새 레코드 반영, 처리한 건수 반환"""
+        processed = 0
+        for kind in KIND_NAMES:
+            for chunk in self.bus.poll(kind):
+                fields = VALUE_FIELDS[kind]
+                for record in chunk:
+                    values = dict(zip(fields, record['values'][:record['count']].tolist()))
+                    if kind == KIND_SENSOR:
+                        self.sensor_window.add(values, float(record['timestamp']))
+                    self.latest[kind] = values
+                processed += len(chunk)
+                self.counts[kind] += len(chunk)
+        return processed
+
+    def summary(self) -> Dict:
+        sensor_stats = self.sensor_window.snapshot(time.time())
+        return {
+            'records': {KIND_NAMES[k]: v for k, v in self.counts.items()},
+            'dropped': {KIND_NAMES[k]: self.bus.dropped[k] for k in KIND_NAMES},
+            'latest': {KIND_NAMES[k]: v for k, v in self.latest.items()},
+            'sensor_5min_avg': {
+                key: round(stats['mean'], 4) for key, stats in sensor_stats.items() if stats['count']
+            }
+        }
@@ -0,0 +1,84 @@
+# test_alert_engine.py
+import numpy as np
+
+from alert_engine import DEFAULT_RULES, AlertEngine
+from sensor_simulator import ENV_KEYS, BatchSensorSimulator
+
+CO2 = 'mars_base_internal_co2'
+OXYGEN = 'mars_base_internal_oxygen'
+TEMP = 'mars_base_internal_temperature'
+
+
+def _env(**overrides):
+    """정상 범위 가운데 값에 일부 지표만 바꾼 측정값"""
+    env = {key: 0.0 for key in ENV_KEYS}
+    env.update({TEMP: 24.0, 'mars_base_internal_humidity': 55.0, CO2: 0.05, OXYGEN: 5.5})
+    env.update(overrides)
+    return env
+
+
+def _states(alerts):
+    return [(alert.rule, alert.state) for alert in alerts]
+
+
+def test_threshold_raises_once_and_clears_after_hysteresis():
+    engine = AlertEngine({'thresholds': [{'metric': CO2, 'max': 0.08, 'hysteresis': 0.01}]})
+
+    assert engine.evaluate(_env(**{CO2: 0.079}), timestamp=0) == []
+    assert _states(engine.evaluate(_env(**{CO2: 0.081}), timestamp=1)) == [(f'{CO2}>max', 'raised')]
+    # 발생 중에는 한계 근처를 오가도 다시 알리지 않음
+    for ts, value in enumerate([0.09, 0.079, 0.075, 0.0705, 0.085], start=2):
+        assert engine.evaluate(_env(**{CO2: value}), timestamp=ts) == []
+    assert engine.active_count() == 1
+    # 한계 - 히스테리시스 아래로 내려가야 해제
+    assert _states(engine.evaluate(_env(**{CO2: 0.069}), timestamp=10)) == [(f'{CO2}>max', 'cleared')]
+    assert engine.active_count() == 0
+
+
+def test_lower_bound_rule_uses_mirrored_hysteresis():
+    engine = AlertEngine({'thresholds': [{'metric': OXYGEN, 'min': 4.5, 'hysteresis': 0.2}]})
+
+    alerts = engine.evaluate(_env(**{OXYGEN: 4.4}), timestamp=0)
+    assert _states(alerts) == [(f'{OXYGEN}<min', 'raised')]
+    assert alerts[0].value == 4.4 and alerts[0].metric == OXYGEN
+    assert engine.evaluate(_env(**{OXYGEN: 4.6}), timestamp=1) == []
+    assert _states(engine.evaluate(_env(**{OXYGEN: 4.71}), timestamp=2)) == [(f'{OXYGEN}<min', 'cleared')]
+
+
+def test_rate_rule_uses_elapsed_time():
+    engine = AlertEngine({'rates': [{'metric': TEMP, 'max_per_sec': 1.0, 'hysteresis': 0.2}]})
+
+    assert engine.evaluate(_env(**{TEMP: 20.0}), timestamp=0) == []
+    # 10초에 5도 변화는 0.5/s 이므로 정상, 1초에 3도는 3/s
+    assert engine.evaluate(_env(**{TEMP: 25.0}), timestamp=10) == []
+    assert _states(engine.evaluate(_env(**{TEMP: 28.0}), timestamp=11)) == [(f'{TEMP}:rate', 'raised')]
+    assert engine.evaluate(_env(**{TEMP: 28.9}), timestamp=12) == []  # 0.9/s: 히스테리시스 안쪽
+    assert _states(engine.evaluate(_env(**{TEMP: 28.9}), timestamp=13)) == [(f'{TEMP}:rate', 'cleared')]
+
+
+def test_batch_state_is_tracked_per_sensor():
+    engine = AlertEngine({'thresholds': [{'metric': CO2, 'max': 0.08, 'hysteresis': 0.01}]}, n_sensors=3)
+    values = np.array([[_env()[key] for key in ENV_KEYS]] * 3)
+    co2 = ENV_KEYS.index(CO2)
+
+    values[1, co2] = 0.09
+    alerts = engine.evaluate_batch(values, timestamp=0)
+    assert [(a.sensor_index, a.state) for a in alerts] == [(1, 'raised')]
+
+    values[2, co2] = 0.09
+    alerts = engine.evaluate_batch(values, timestamp=1)
+    assert [(a.sensor_index, a.state) for a in alerts] == [(2, 'raised')]
+
+    values[:, co2] = 0.05
+    alerts = engine.evaluate_batch(values, timestamp=2)
+    assert sorted((a.sensor_index, a.state) for a in alerts) == [(1, 'cleared'), (2, 'cleared')]
+
+
+def test_default_rules_stay_quiet_for_normal_readings():
+    # DummySensor 와 같은 범위의 균등 분포 값, 5초 주기
+    simulator = BatchSensorSimulator(200, seed=5)
+    engine = AlertEngine(DEFAULT_RULES, n_sensors=200)
+    alerts = []
+    for tick in range(100):
+        alerts += engine.evaluate_batch(simulator.tick(), timestamp=tick * 5.0)
+    assert alerts == []
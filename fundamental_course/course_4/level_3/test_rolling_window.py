@@ -0,0 +1,67 @@
+# test_rolling_window.py
+import math
+import random
+
+import pytest
+
+from rolling_window import RollingWindowAggregator
+
+
+def _brute_force(samples, key, now, window):
+    """윈도우 안의 샘플을 매번 다시 모아 계산한 기준값"""
+    values = [values[key] for ts, values in samples if ts > now - window and key in values]
+    if not values:
+        return {'count': 0}
+    mean = sum(values) / len(values)
+    variance = sum((v - mean) ** 2 for v in values) / len(values)
+    return {'count': len(values), 'mean': mean, 'min': min(values), 'max': max(values),
+            'stddev': math.sqrt(variance)}
+
+
+def test_matches_brute_force_over_sliding_window():
+    rng = random.Random(7)
+    window = 30.0
+    aggregator = RollingWindowAggregator(window, ['temp', 'co2'])
+    samples = []
+    now = 0.0
+    for _ in range(500):
+        now += rng.uniform(0.1, 3.0)
+        values = {'temp': round(rng.uniform(18, 30), 2), 'co2': round(rng.uniform(0.02, 0.1), 4)}
+        aggregator.add(values, timestamp=now)
+        samples.append((now, values))
+
+        for key in ('temp', 'co2'):
+            expected = _brute_force(samples, key, now, window)
+            actual = aggregator.stats(key)
+            assert actual['count'] == expected['count']
+            assert actual['min'] == expected['min']
+            assert actual['max'] == expected['max']
+            assert actual['mean'] == pytest.approx(expected['mean'])
+            assert actual['stddev'] == pytest.approx(expected['stddev'], abs=1e-6)
+    assert len(aggregator) == _brute_force(samples, 'temp', now, window)['count']
+
+
+def test_evicts_everything_after_window_passes():
+    aggregator = RollingWindowAggregator(10, ['temp'])
+    for ts in range(5):
+        aggregator.add({'temp': 20.0 + ts}, timestamp=float(ts))
+
+    assert aggregator.stats('temp', now=100.0) == {'count': 0}
+    assert len(aggregator) == 0
+    # 비워진 뒤 다시 추가해도 누적 오차 없이 새 값만 반영
+    aggregator.add({'temp': 25.0}, timestamp=101.0)
+    assert aggregator.stats('temp') == {'count': 1, 'mean': 25.0, 'min': 25.0, 'max': 25.0, 'stddev': 0.0}
+
+
+def test_ignores_non_numeric_values_and_adds_new_keys():
+    aggregator = RollingWindowAggregator(60)
+    aggregator.add({'temp': 21.5, 'datetime': '2025-01-01 00:00:00'}, timestamp=0.0)
+
+    snapshot = aggregator.snapshot()
+    assert set(snapshot) == {'temp'}
+    assert snapshot['temp']['mean'] == 21.5
+
+
+def test_rejects_non_positive_window():
+    with pytest.raises(ValueError):
+        RollingWindowAggregator(0)
@@ -0,0 +1,84 @@
+# test_telemetry_archive.py
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from sensor_simulator import ENV_KEYS
+from telemetry_archive import TelemetryArchiveReader, TelemetryArchiveWriter, _Segment
+
+
+def _rows(timestamps):
+    """행 번호를 값으로 쓰는 (n, 6) 배열 (조회 결과를 원본 위치와 대조하기 쉽게)"""
+    base = np.arange(len(timestamps), dtype=np.float32)[:, None]
+    return base + np.arange(len(ENV_KEYS), dtype=np.float32)[None, :] * 0.25
+
+
+def test_segment_locate_matches_linear_scan(tmp_path):
+    rng = np.random.default_rng(11)
+    # 같은 시각이 반복되는 구간도 포함한 단조 증가 timestamp
+    timestamps = np.cumsum(rng.choice([0.0, 0.5, 1.0, 2.5], size=900))
+    segment = _Segment(str(tmp_path / 'seg.bin'), 'w+', capacity=1000, stride=16)
+    assert segment.append(timestamps, _rows(timestamps)) == len(timestamps)
+
+    bounds = [(-5.0, -1.0), (timestamps[-1] + 1, timestamps[-1] + 9), (timestamps[0], timestamps[-1])]
+    bounds += [tuple(sorted(rng.uniform(-10, timestamps[-1] + 10, size=2))) for _ in range(300)]
+    bounds += [(timestamps[i], timestamps[i]) for i in rng.integers(0, len(timestamps), size=50)]
+    for start_ts, end_ts in bounds:
+        expected = np.nonzero((timestamps >= start_ts) & (timestamps <= end_ts))[0]
+        rows = segment.locate(start_ts, end_ts)
+        if expected.size:
+            assert (rows.start, rows.stop) == (expected[0], expected[-1] + 1), (start_ts, end_ts)
+        else:
+            assert rows.stop == rows.start, (start_ts, end_ts)
+    segment.close()
+
+
+def test_segment_append_stops_at_capacity(tmp_path):
+    segment = _Segment(str(tmp_path / 'seg.bin'), 'w+', capacity=10, stride=4)
+    timestamps = np.arange(15, dtype=np.float64)
+    assert segment.append(timestamps, _rows(timestamps)) == 10
+    assert segment.append(timestamps[10:], _rows(timestamps[10:])) == 0
+    assert segment.row_count == 10
+    segment.close()
+
+
+def test_reader_range_across_days_and_parts(tmp_path):
+    day_start = datetime(2025, 3, 1, 22, 0, 0).timestamp()
+    # 22시부터 다음 날 2시까지 30초 간격, 용량이 작아 같은 날짜 안에서도 파트가 나뉨
+    timestamps = day_start + np.arange(0, 4 * 3600, 30, dtype=np.float64)
+    values = _rows(timestamps)
+    writer = TelemetryArchiveWriter(str(tmp_path), capacity=100, index_stride=8)
+    writer.append_many(timestamps[:200], values[:200])
+    writer.append_many(timestamps[200:], values[200:])
+    writer.close()
+    assert len(list(tmp_path.glob('env_20250301*.bin'))) == 3  # 22~24시 240행 → 100 + 100 + 40
+    assert len(list(tmp_path.glob('env_20250302*.bin'))) == 3
+
+    reader = TelemetryArchiveReader(str(tmp_path))
+    midnight = datetime(2025, 3, 2).timestamp()
+    for start_ts, end_ts in [(day_start, timestamps[-1]), (midnight - 600, midnight + 600),
+                             (day_start + 45, day_start + 3000), (midnight + 15, midnight + 15)]:
+        mask = (timestamps >= start_ts) & (timestamps <= end_ts)
+        loaded = reader.load_range(start_ts, end_ts)
+        np.testing.assert_array_equal(loaded.timestamps, timestamps[mask])
+        np.testing.assert_array_equal(loaded.values, values[mask].T)
+
+        means = reader.mean(start_ts, end_ts)
+        if mask.any():
+            for col, key in enumerate(ENV_KEYS):
+                assert means[key] == pytest.approx(values[mask, col].astype(np.float64).mean())
+        else:
+            assert means == {}
+    reader.close()
+
+
+def test_writer_rejects_out_of_order_timestamps(tmp_path):
+    writer = TelemetryArchiveWriter(str(tmp_path), capacity=16, index_stride=4)
+    now = (datetime(2025, 3, 1) + timedelta(hours=12)).timestamp()
+    writer.append(now, {key: 1.0 for key in ENV_KEYS})
+    with pytest.raises(ValueError):
+        writer.append(now - 1, {key: 1.0 for key in ENV_KEYS})
+    with pytest.raises(ValueError):
+        writer.append_many([now + 2, now + 1], np.ones((2, len(ENV_KEYS))))
+    writer.close()
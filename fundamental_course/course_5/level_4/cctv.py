@@ -4,6 +4,8 @@ import cv2
 import zipfile
 from typing import List, Optional, Tuple
 
+from frame_stream import FrameStream, MotionGate
+
 
 class ImageProcessor:
     """CCTV 이미지 처리를 위한 클래스"""
@@ -255,6 +257,62 @@ def problem2_people_detection():
     print('사람 감지 시스템을 종료합니다.')
 
 
+def problem3_stream_detection(source: str, show: bool = True) -> Optional[dict]:
+    """동영상 파일 / 카메라 / 이미지 시퀀스(glob)에서 사람 감지 (움직임이 있을 때만 감지 실행)"""
+    print('=== 문제 3: 동영상/스트림 사람 감지 ===')
+    print('ESC 또는 창 닫기: 종료')
+
+    processor = ImageProcessor()
+    motion_gate = MotionGate()
+    window_name = 'CCTV Stream Detection'
+
+    try:
+        stream = FrameStream(source)
+    except FileNotFoundError as e:
+        print(e)
+        return None
+
+    # 입력이 열린 뒤에 창 생성 (입력 오류 시 빈 창이 남지 않도록)
+    if show:
+        cv2.namedWindow(window_name, cv2.WINDOW_AUTOSIZE)
+
+    detected_people: List[Tuple[int, int, int, int]] = []
+    with stream:
+        for frame_index, timestamp, frame in stream:
+            if motion_gate.should_detect(frame):
+                stream.stats.detections += 1
+                detected_people, _ = processor.detect_people(frame)
+                if detected_people:
+                    print(f'프레임 {frame_index} ({timestamp:.1f}초) - {len(detected_people)}명 감지됨')
+            else:
+                stream.stats.motion_skipped += 1
+
+            if not show:
+                continue
+
+            # 움직임이 없으면 마지막 감지 결과를 그대로 표시
+            result_image = frame.copy()
+            for (x, y, w, h) in detected_people:
+                cv2.rectangle(result_image, (x, y), (x + w, y + h), (0, 255, 0), 2)
+            cv2.imshow(window_name, processor.resize_image_for_display(result_image))
+
+            key = cv2.waitKey(1) & 0xFF
+            if key == 27 or not processor.is_window_open(window_name):
+                break
+
+    if show:
+        cv2.destroyWindow(window_name)
+        cv2.waitKey(1)  # macOS에서 창이 확실히 닫히도록 처리
+
+    if stream.error:
+        print(f'입력 오류: {stream.error}')
+    stats = stream.stats.summary()
+    print(f'처리 {stats["processed"]}프레임 ({stats["processed_fps"]} fps), '
+          f'감지 실행 {stats["detections"]}회, 움직임 없음 {stats["motion_skipped"]}회, '
+          f'건너뜀 {stats["skipped"]}, 버림 {stats["dropped"]}')
+    return stats
+
+
 def main():
     print('CCTV 이미지 처리 시스템')
     print('=' * 30)
@@ -263,20 +321,24 @@ def main():
         print('\n기능을 선택하세요:')
         print('1. 이미지 뷰어')
         print('2. 사람 감지 시스템')
+        print('3. 동영상/스트림 사람 감지')
         print('0. 종료')
 
         try:
-            choice = input('선택 (0-2): ').strip()
+            choice = input('선택 (0-3): ').strip()
 
             if choice == '1':
                 problem1_image_viewer()
             elif choice == '2':
                 problem2_people_detection()
+            elif choice == '3':
+                source = input('동영상 파일, 카메라 번호 또는 이미지 패턴(예: CCTV/*.jpg): ').strip()
+                problem3_stream_detection(source)
             elif choice == '0':
                 print('프로그램을 종료합니다.')
                 break
             else:
-                print('잘못된 선택입니다. 0, 1, 2 중에서 선택하세요.')
+                print('잘못된 선택입니다. 0, 1, 2, 3 중에서 선택하세요.')
 
         except KeyboardInterrupt:
             print('\n프로그램을 중단합니다.')
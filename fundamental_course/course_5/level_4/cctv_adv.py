@@ -1,14 +1,20 @@
 import os
+import sys
+import csv
+import json
 import logging
 import time
-import math
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Optional, Tuple
-from dataclasses import dataclass
+from typing import ClassVar, Dict, List, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass, fields
 from enum import Enum
 import cv2
 import numpy as np
 
+from frame_stream import FrameStream, MotionGate
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -35,10 +41,151 @@ class PersonCandidate:
     aspect_ratio: float
 
 
+@dataclass
+class CandidateArrays:
+    """
+    사람 후보 묶음 (struct-of-arrays)
+
+    HOG 감지 → 색상 검증 → 후보 선별 구간에서는 후보가 수백~수천 개가 되므로
+    PersonCandidate 객체 대신 필드별 NumPy 배열로 다루고, 최종 선별된 후보만 객체로 변환함.
+    """
+    x: np.ndarray
+    y: np.ndarray
+    w: np.ndarray
+    h: np.ndarray
+    confidence: np.ndarray
+    method: np.ndarray  # METHODS 인덱스
+    area: np.ndarray
+    aspect_ratio: np.ndarray
+
+    METHODS: ClassVar[Tuple[DetectionMethod, ...]] = tuple(DetectionMethod)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    @classmethod
+    def _field_names(cls) -> List[str]:
+        return [field.name for field in fields(cls)]
+
+    @classmethod
+    def empty(cls) -> 'CandidateArrays':
+        ints = np.empty(0, np.int64)
+        floats = np.empty(0, np.float64)
+        return cls(ints, ints, ints, ints, floats, np.empty(0, np.int8), floats, floats)
+
+    @classmethod
+    def from_candidates(cls, candidates: Sequence[PersonCandidate]) -> 'CandidateArrays':
+        if not candidates:
+            return cls.empty()
+        method_index = {method: i for i, method in enumerate(cls.METHODS)}
+        return cls(
+            x=np.array([c.x for c in candidates], np.int64),
+            y=np.array([c.y for c in candidates], np.int64),
+            w=np.array([c.w for c in candidates], np.int64),
+            h=np.array([c.h for c in candidates], np.int64),
+            confidence=np.array([c.confidence for c in candidates], np.float64),
+            method=np.array([method_index[c.method] for c in candidates], np.int8),
+            area=np.array([c.area for c in candidates], np.float64),
+            aspect_ratio=np.array([c.aspect_ratio for c in candidates], np.float64),
+        )
+
+    @classmethod
+    def concat(cls, parts: Sequence['CandidateArrays']) -> 'CandidateArrays':
+        parts = [part for part in parts if len(part)]
+        if not parts:
+            return cls.empty()
+        return cls(*(np.concatenate([getattr(part, name) for part in parts])
+                     for name in cls._field_names()))
+
+    def take(self, indices: np.ndarray) -> 'CandidateArrays':
+        return CandidateArrays(*(getattr(self, name)[indices] for name in self._field_names()))
+
+    def to_candidates(self) -> List[PersonCandidate]:
+        return [
+            PersonCandidate(
+                x=int(x), y=int(y), w=int(w), h=int(h),
+                confidence=float(confidence),
+                method=self.METHODS[method],
+                area=float(area),
+                aspect_ratio=float(aspect_ratio)
+            )
+            for x, y, w, h, confidence, method, area, aspect_ratio in zip(
+                self.x, self.y, self.w, self.h, self.confidence, self.method, self.area, self.aspect_ratio)
+        ]
+
+
+def _select_by_center_distance(cx: np.ndarray, cy: np.ndarray, confidence: np.ndarray,
+                               radius: float, max_keep: int) -> np.ndarray:
+    """
+    중심점 거리 기준 탐욕적 중복 제거 (공간 해시 격자)
+
+    신뢰도가 가장 높은 후보를 고르고 radius 안의 후보를 지우는 과정을 반복함.
+    격자 칸 크기가 radius 이므로 한 후보를 고를 때 주변 3x3 칸의 후보만 거리 계산하면 됨.
+
+    Returns:
+        선택된 후보 인덱스 (신뢰도 순)
+    """
+    order = np.argsort(-confidence, kind='stable')
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+
+    cell_x = np.floor_divide(cx, radius).astype(np.int64)
+    cell_y = np.floor_divide(cy, radius).astype(np.int64)
+    keys = cell_x * 1_000_003 + cell_y  # 충돌하더라도 거리 계산 대상이 늘어날 뿐 결과는 같음
+    by_key = np.argsort(keys, kind='stable')
+    unique_keys, starts, counts = np.unique(keys[by_key], return_index=True, return_counts=True)
+    cells = {int(key): by_key[start:start + count]
+             for key, start, count in zip(unique_keys, starts, counts)}
+
+    alive = np.ones(len(order), bool)  # 신뢰도 순위 기준
+    keep = []
+    position = 0
+    radius_sq = radius * radius
+    while position < len(order) and len(keep) < max_keep:
+        index = order[position]
+        keep.append(index)
+
+        neighbors = [cells[key] for key in
+                     ((cell_x[index] + dx) * 1_000_003 + cell_y[index] + dy
+                      for dx in (-1, 0, 1) for dy in (-1, 0, 1)) if key in cells]
+        near = np.concatenate(neighbors)
+        dist_sq = (cx[near] - cx[index]) ** 2 + (cy[near] - cy[index]) ** 2
+        alive[rank[near[dist_sq < radius_sq]]] = False
+
+        # 다음으로 살아 있는 후보로 이동
+        remaining = alive[position + 1:]
+        if not remaining.any():
+            break
+        position += 1 + int(np.argmax(remaining))
+    return np.array(keep, np.intp)
+
+
+def _select_by_iou(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+                   confidence: np.ndarray, threshold: float, max_keep: int) -> np.ndarray:
+    """IoU 기준 NMS: 고른 후보와 IoU 가 threshold 를 넘는 후보를 제거"""
+    order = np.argsort(-confidence, kind='stable')
+    areas = (x2 - x1) * (y2 - y1)
+    keep = []
+    while len(order) and len(keep) < max_keep:
+        index = order[0]
+        keep.append(index)
+        rest = order[1:]
+        inter_w = np.clip(np.minimum(x2[index], x2[rest]) - np.maximum(x1[index], x1[rest]), 0, None)
+        inter_h = np.clip(np.minimum(y2[index], y2[rest]) - np.maximum(y1[index], y1[rest]), 0, None)
+        inter = inter_w * inter_h
+        iou = inter / np.maximum(areas[index] + areas[rest] - inter, 1)
+        order = rest[iou <= threshold]
+    return np.array(keep, np.intp)
+
+
 class SpacesuitColorDetector:
     """우주복 색상 기반 감지기"""
 
-    def __init__(self):
+    def __init__(self, downscale: float = 1.0):
+        """
+        Args:
+            downscale: 1.0 미만이면 축소 영상에서 마스크를 만든 뒤 원래 크기로 확대 (빠르지만 경계가 거칠어짐)
+        """
         # 우주복 색상 범위 (HSV) - 더 넓은 범위로 확장
         self.spacesuit_colors = {
             'white_bright': ([0, 0, 180], [180, 25, 255]),  # 밝은 흰색
@@ -47,29 +194,95 @@ class SpacesuitColorDetector:
             'beige': ([10, 20, 120], [25, 80, 220]),  # 베이지색
             'brown_light': ([8, 40, 140], [20, 100, 200])  # 밝은 갈색
         }
+        self.downscale = downscale
+        self._color_lut = self._build_color_lut()
+        # 형태 연산 커널 (축소 처리 시 배율에 맞춰 크기 조정)
+        self._kernel_small = self._scaled_kernel(3)
+        self._kernel_large = self._scaled_kernel(7)
+        # 프레임 크기별 작업 버퍼 (크기가 바뀔 때만 다시 할당)
+        self._buffer_shape: Optional[Tuple[int, int]] = None
+        self._buffers: Dict[str, np.ndarray] = {}
+
+    def _build_color_lut(self) -> np.ndarray:
+        """
+        색상 범위 → 채널별 비트마스크 LUT (256 x 1 x 3)
+
+        k 번째 색상 범위에 H/S/V 값이 들어가면 해당 채널 LUT 값의 k 번째 비트가 켜짐.
+        세 채널 LUT 결과를 AND 했을 때 남는 비트가 있으면 어느 한 범위에 속하는 픽셀이므로
+        inRange + bitwise_or 를 색상 수만큼 반복하는 것과 같은 결과를 한 번에 얻음.
+        """
+        if len(self.spacesuit_colors) > 8:
+            raise ValueError('색상 범위는 최대 8개까지 지원합니다.')
+        lut = np.zeros((256, 1, 3), dtype=np.uint8)
+        for bit, (lower, upper) in enumerate(self.spacesuit_colors.values()):
+            for channel in range(3):
+                lut[lower[channel]:upper[channel] + 1, 0, channel] |= 1 << bit
+        return lut
+
+    def _scaled_kernel(self, size: int) -> np.ndarray:
+        scaled = max(1, int(round(size * self.downscale)))
+        scaled += (scaled + 1) % 2  # 홀수 크기 유지
+        return np.ones((scaled, scaled), np.uint8)
+
+    def _prepare_buffers(self, shape: Tuple[int, int]) -> None:
+        if self._buffer_shape == shape:
+            return
+        height, width = shape
+        work = (max(1, int(round(height * self.downscale))), max(1, int(round(width * self.downscale))))
+        self._buffers = {
+            'small': np.empty((*work, 3), np.uint8),
+            'hsv': np.empty((*work, 3), np.uint8),
+            'bits': np.empty((*work, 3), np.uint8),
+            'planes': [np.empty(work, np.uint8) for _ in range(3)],
+            'mask': np.empty(work, np.uint8),
+            'morph': np.empty(work, np.uint8),
+            'output': np.empty(shape, np.uint8),
+        }
+        self._buffer_shape = shape
 
     def extract_spacesuit_regions(self, image: np.ndarray) -> np.ndarray:
-        """우주복 영역 추출"""
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-        combined_mask = np.zeros(hsv.shape[:2], dtype=np.uint8)
-
-        # 모든 우주복 색상 마스크 결합
-        for color_name, (lower, upper) in self.spacesuit_colors.items():
-            mask = cv2.inRange(hsv, np.array(lower), np.array(upper))
-            combined_mask = cv2.bitwise_or(combined_mask, mask)
+        """
+        우주복 영역 추출
+
+        반환 마스크는 재사용 버퍼이므로 다음 호출에서 덮어씀 (보관하려면 copy()).
+        """
+        self._prepare_buffers(image.shape[:2])
+        buffers = self._buffers
+        scaled = self.downscale != 1.0
+
+        source = image
+        if scaled:
+            work_height, work_width = buffers['mask'].shape
+            cv2.resize(image, (work_width, work_height), dst=buffers['small'], interpolation=cv2.INTER_AREA)
+            source = buffers['small']
+
+        # 모든 우주복 색상 마스크 결합 (채널별 비트마스크 LUT 한 번 + AND 두 번)
+        hsv = cv2.cvtColor(source, cv2.COLOR_BGR2HSV, dst=buffers['hsv'])
+        cv2.LUT(hsv, self._color_lut, dst=buffers['bits'])
+        hue_bits, sat_bits, val_bits = cv2.split(buffers['bits'], buffers['planes'])
+        mask = buffers['mask']
+        cv2.bitwise_and(hue_bits, sat_bits, dst=mask)
+        cv2.bitwise_and(mask, val_bits, dst=mask)
+        cv2.threshold(mask, 0, 255, cv2.THRESH_BINARY, dst=mask)
 
         # 노이즈 제거 및 형태 개선
-        kernel_small = np.ones((3, 3), np.uint8)
-        kernel_large = np.ones((7, 7), np.uint8)
-
+        morph = buffers['morph']
         # 작은 노이즈 제거
-        combined_mask = cv2.morphologyEx(combined_mask, cv2.MORPH_OPEN, kernel_small)
+        cv2.morphologyEx(mask, cv2.MORPH_OPEN, self._kernel_small, dst=morph)
         # 구멍 채우기
-        combined_mask = cv2.morphologyEx(combined_mask, cv2.MORPH_CLOSE, kernel_large)
-        # 연결된 영역 확장
-        combined_mask = cv2.dilate(combined_mask, kernel_small, iterations=2)
+        cv2.morphologyEx(morph, cv2.MORPH_CLOSE, self._kernel_large, dst=mask)
+
+        output = buffers['output']
+        if scaled:
+            # 연결된 영역 확장
+            cv2.dilate(mask, self._kernel_small, dst=morph, iterations=2)
+            cv2.resize(morph, (output.shape[1], output.shape[0]), dst=output,
+                       interpolation=cv2.INTER_NEAREST)
+        else:
+            # 연결된 영역 확장
+            cv2.dilate(mask, self._kernel_small, dst=output, iterations=2)
 
-        return combined_mask
+        return output
 
 
 class ContourHumanAnalyzer:
@@ -132,6 +345,35 @@ class ContourHumanAnalyzer:
         return candidates
 
 
+def _merge_regions(regions: List[Tuple[int, int, int, int]]) -> List[Tuple[int, int, int, int]]:
+    """겹치는 (x1, y1, x2, y2) 영역을 합쳐 같은 픽셀을 여러 번 탐색하지 않도록 함"""
+    merged = list(regions)
+    changed = True
+    while changed:
+        changed = False
+        result = []
+        for x1, y1, x2, y2 in merged:
+            for i, (ox1, oy1, ox2, oy2) in enumerate(result):
+                if x1 < ox2 and ox1 < x2 and y1 < oy2 and oy1 < y2:
+                    result[i] = (min(x1, ox1), min(y1, oy1), max(x2, ox2), max(y2, oy2))
+                    changed = True
+                    break
+            else:
+                result.append((x1, y1, x2, y2))
+        merged = result
+    return merged
+
+
+def _box_iou(a: PersonCandidate, b: PersonCandidate) -> float:
+    """두 후보 박스의 IoU"""
+    inter_w = min(a.x + a.w, b.x + b.w) - max(a.x, b.x)
+    inter_h = min(a.y + a.h, b.y + b.h) - max(a.y, b.y)
+    if inter_w <= 0 or inter_h <= 0:
+        return 0.0
+    inter = inter_w * inter_h
+    return inter / (a.w * a.h + b.w * b.h - inter)
+
+
 class HybridSpacesuitDetector:
     """하이브리드 우주복 착용자 감지기"""
 
@@ -145,8 +387,31 @@ class HybridSpacesuitDetector:
         ARROW_RIGHT = [83, 3, 115, 100, 65363, 8316, 63235]
         SPACE = 32
 
-    def __init__(self, folder_path: str = 'CCTV'):
+    # 회전 각도들 (누워있는 사람 감지용)
+    HOG_ANGLES = (0, 30, 60, 90, 120, 150, 180, 210, 240, 270, 300, 330)
+    # 세밀한 탐색: 매우 세밀한 검색 (기존 파라미터)
+    HOG_FINE_PARAMS = {'winStride': (2, 2), 'padding': (8, 8), 'scale': 1.02, 'useMeanshiftGrouping': False}
+    # 거친 탐색: 창 이동 간격과 스케일 간격을 크게, 임계값은 낮춰 재현율 우선
+    HOG_COARSE_PARAMS = {'winStride': (4, 4), 'padding': (8, 8), 'scale': 1.1, 'hitThreshold': -0.5}
+    # 거친 탐색 영상 배율: 1.0 미만이면 키가 128/배율 px 보다 작은 사람은 HOG 창(64x128)에 못 미쳐
+    # 거친 탐색에서 빠지고 그 주변 ROI 도 세밀한 탐색을 못 받음. 640x480 합성 인물(140~260px) 측정에서
+    # 0.75 는 재현율 95% -> 75% 에 속도 이득 없음, 0.5 는 재현율 50% 에 1.5배라 전체 해상도를 유지함
+    # (속도는 거친 탐색의 stride / scale 간격과 ROI 로 얻음)
+    HOG_COARSE_RESIZE = 1.0
+    HOG_ROI_MARGIN = 0.5  # 거친 탐색 박스 주변 여유 (박스 크기 대비)
+    DUPLICATE_DISTANCE = 60  # 중심점 거리가 이보다 가까우면 중복 (selection='distance')
+    NMS_IOU_THRESHOLD = 0.3  # IoU 가 이보다 크면 중복 (selection='iou')
+    MAX_DETECTIONS = 12  # 최대 감지 수
+
+    def __init__(self, folder_path: str = 'CCTV', hog_search: str = 'coarse_to_fine',
+                 mask_downscale: float = 1.0, selection: str = 'distance'):
+        if hog_search not in ('coarse_to_fine', 'exhaustive'):
+            raise ValueError(f'지원하지 않는 HOG 탐색 방식: {hog_search}')
+        if selection not in ('distance', 'iou'):
+            raise ValueError(f'지원하지 않는 후보 선별 방식: {selection}')
+        self.selection = selection
         self.folder_path = Path(folder_path)
+        self.hog_search = hog_search
         self.image_files: List[Path] = []
         self.current_index: int = 0
 
@@ -154,7 +419,7 @@ class HybridSpacesuitDetector:
         self.window_name = 'HybridSpacesuitCCTV'
 
         # 서브 감지기들 초기화
-        self.color_detector = SpacesuitColorDetector()
+        self.color_detector = SpacesuitColorDetector(mask_downscale)
         self.contour_analyzer = ContourHumanAnalyzer()
 
         # HOG 감지기 초기화
@@ -193,89 +458,147 @@ class HybridSpacesuitDetector:
                 logger.error(f'이미지 너무 작음: {image_path.name}')
                 return None
 
-            # 최적 크기로 조정
-            target_size = 800
-            if max(height, width) > target_size:
-                scale = target_size / max(height, width)
-                new_width = int(width * scale)
-                new_height = int(height * scale)
-                image = cv2.resize(image, (new_width, new_height),
-                                   interpolation=cv2.INTER_AREA)
-                logger.info(f'리사이징: {width}x{height} -> {new_width}x{new_height}')
-
-            return image
+            return self._fit_detection_size(image)
 
         except Exception as e:
             logger.error(f'이미지 로드 오류: {image_path.name} - {e}')
             return None
 
+    def _rotated_gray_frames(self, gray: np.ndarray) -> Dict[int, np.ndarray]:
+        """각도별 회전 영상 생성 (θ+180° 는 θ 회전 결과를 180° 뒤집어 재사용, 보간 없음)"""
+        height, width = gray.shape[:2]
+        center = (width // 2, height // 2)
+        frames = {}
+
+        for angle in self.HOG_ANGLES:
+            opposite = (angle - 180) % 360
+            if angle == 0:
+                frames[angle] = gray
+            elif opposite in frames:
+                # 0/180, 30/210, 90/270 ... 쌍은 같은 캔버스의 180도 뒤집기
+                frames[angle] = cv2.rotate(frames[opposite], cv2.ROTATE_180)
+            else:
+                M = cv2.getRotationMatrix2D(center, angle, 1.0)
+                frames[angle] = cv2.warpAffine(gray, M, (width, height),
+                                               borderMode=cv2.BORDER_REFLECT)
+        return frames
+
+    def _coarse_hog_regions(self, frames: Dict[int, np.ndarray]) -> Dict[int, List[Tuple[int, int, int, int]]]:
+        """큰 stride / 거친 스케일(선택적으로 저해상도) HOG 로 유망한 각도와 영역(ROI) 선정"""
+        regions = {}
+
+        for angle, frame in frames.items():
+            height, width = frame.shape[:2]
+            small = frame
+            if self.HOG_COARSE_RESIZE != 1.0:
+                small = cv2.resize(frame, None, fx=self.HOG_COARSE_RESIZE, fy=self.HOG_COARSE_RESIZE,
+                                   interpolation=cv2.INTER_AREA)
+            try:
+                boxes, _ = self.hog.detectMultiScale(small, **self.HOG_COARSE_PARAMS)
+            except cv2.error as e:
+                logger.warning(f'{angle}도 HOG 거친 탐색 실패: {e}')
+                continue
+
+            if len(boxes) == 0:
+                continue
+
+            rois = []
+            for x, y, w, h in np.asarray(boxes, dtype=np.float64) / self.HOG_COARSE_RESIZE:
+                # 정밀 탐색 창이 박스 주변까지 미끄러질 수 있도록 여유를 둠
+                margin_x, margin_y = w * self.HOG_ROI_MARGIN, h * self.HOG_ROI_MARGIN
+                rois.append((max(0, int(x - margin_x)), max(0, int(y - margin_y)),
+                             min(width, int(x + w + margin_x)), min(height, int(y + h + margin_y))))
+            regions[angle] = _merge_regions(rois)
+            logger.debug(f'{angle}도 거친 탐색: {len(boxes)}개 → ROI {len(regions[angle])}개')
+
+        return regions
+
+    def _hog_candidates(self, detections, weights, angle: int, width: int, height: int,
+                        offset: Tuple[int, int] = (0, 0)) -> CandidateArrays:
+        """HOG 감지 결과를 후보 배열로 변환 (offset: ROI 좌상단)"""
+        boxes = np.asarray(detections, np.int64).reshape(-1, 4)
+        weights = np.asarray(weights, np.float64).reshape(-1)
+        if len(weights) < len(boxes):
+            weights = np.concatenate([weights, np.full(len(boxes) - len(weights), -1.0)])
+
+        x = boxes[:, 0] + offset[0]
+        y = boxes[:, 1] + offset[1]
+        w = boxes[:, 2]
+        h = boxes[:, 3]
+
+        # 매우 관대한 기준
+        keep = (weights >= -2.0) & (w >= 15) & (h >= 25)
+        x, y, w, h, weights = x[keep], y[keep], w[keep], h[keep], weights[keep]
+
+        # 회전 보정 (근사치)
+        if angle != 0:
+            offset_px = abs(angle) // 30
+            x = np.maximum(0, np.minimum(width - w, x + offset_px))
+            y = np.maximum(0, np.minimum(height - h, y + offset_px))
+
+        return CandidateArrays(
+            x=x, y=y, w=w, h=h,
+            confidence=np.clip((weights + 2.0) / 4.0, 0.1, 0.9),
+            method=np.full(len(x), CandidateArrays.METHODS.index(DetectionMethod.HOG_DETECTION), np.int8),
+            area=(w * h).astype(np.float64),
+            aspect_ratio=h / w
+        )
+
+    def _fit_detection_size(self, image: np.ndarray, target_size: int = 800) -> np.ndarray:
+        """최적 크기로 조정 (긴 변이 target_size 를 넘으면 축소)"""
+        height, width = image.shape[:2]
+        if max(height, width) > target_size:
+            scale = target_size / max(height, width)
+            new_width = int(width * scale)
+            new_height = int(height * scale)
+            image = cv2.resize(image, (new_width, new_height),
+                               interpolation=cv2.INTER_AREA)
+            logger.debug(f'리사이징: {width}x{height} -> {new_width}x{new_height}')
+        return image
+
     def _multi_angle_hog_detection(self, image: np.ndarray) -> List[PersonCandidate]:
         """다중 각도 HOG 감지"""
-        candidates = []
+        return self._multi_angle_hog_arrays(image).to_candidates()
 
-        # 회전 각도들 (누워있는 사람 감지용)
-        angles = [0, 30, 60, 90, 120, 150, 180, 210, 240, 270, 300, 330]
-        height, width = image.shape[:2]
-        center = (width // 2, height // 2)
+    def _multi_angle_hog_arrays(self, image: np.ndarray) -> CandidateArrays:
+        """
+        다중 각도 HOG 감지 (후보 배열 반환)
 
-        for angle in angles:
-            try:
-                # 이미지 회전
-                if angle == 0:
-                    rotated = image
-                else:
-                    M = cv2.getRotationMatrix2D(center, angle, 1.0)
-                    rotated = cv2.warpAffine(image, M, (width, height),
-                                             borderMode=cv2.BORDER_REFLECT)
-
-                # 그레이스케일 변환
-                gray = cv2.cvtColor(rotated, cv2.COLOR_BGR2GRAY)
-
-                # 매우 관대한 HOG 감지
-                detections, weights = self.hog.detectMultiScale(
-                    gray,
-                    winStride=(2, 2),  # 매우 세밀한 검색
-                    padding=(8, 8),
-                    scale=1.02,  # 세밀한 스케일
-                    useMeanshiftGrouping=False
-                )
-
-                for i, (x, y, w, h) in enumerate(detections):
-                    weight = weights[i] if i < len(weights) else -1.0
-
-                    # 매우 관대한 기준
-                    if weight >= -2.0 and w >= 15 and h >= 25:
-                        # 회전 보정 (근사치)
-                        if angle != 0:
-                            offset = abs(angle) // 30
-                            x = max(0, min(width - w, x + offset))
-                            y = max(0, min(height - h, y + offset))
-
-                        area = w * h
-                        aspect_ratio = h / w if w > 0 else 0
-                        confidence = max(0.1, min(0.9, (weight + 2.0) / 4.0))
-
-                        candidates.append(PersonCandidate(
-                            x=x, y=y, w=w, h=h,
-                            confidence=confidence,
-                            method=DetectionMethod.HOG_DETECTION,
-                            area=area,
-                            aspect_ratio=aspect_ratio
-                        ))
-
-                logger.debug(f'{angle}도 회전: {len(detections)}개 감지')
-
-            except Exception as e:
-                logger.warning(f'{angle}도 HOG 감지 실패: {e}')
-                continue
+        hog_search 가 'coarse_to_fine' 이면 모든 각도에 거친 탐색을 먼저 하고,
+        사람이 나올 만한 각도의 ROI 에서만 세밀한 탐색(winStride 2, scale 1.02)을 실행함.
+        'exhaustive' 는 모든 각도의 전체 영상에 세밀한 탐색을 실행(기존 방식).
+        """
+        parts = []
 
-        return candidates
+        # 회색조 변환은 회전 전에 한 번만
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        height, width = gray.shape[:2]
+        frames = self._rotated_gray_frames(gray)
+
+        if self.hog_search == 'exhaustive':
+            regions = {angle: [(0, 0, width, height)] for angle in frames}
+        else:
+            regions = self._coarse_hog_regions(frames)
+
+        for angle, rois in regions.items():
+            for x1, y1, x2, y2 in rois:
+                try:
+                    # 매우 관대한 HOG 감지
+                    detections, weights = self.hog.detectMultiScale(
+                        frames[angle][y1:y2, x1:x2], **self.HOG_FINE_PARAMS)
+                    parts.append(self._hog_candidates(detections, weights, angle,
+                                                      width, height, (x1, y1)))
+                    logger.debug(f'{angle}도 회전: {len(detections)}개 감지')
+
+                except Exception as e:
+                    logger.warning(f'{angle}도 HOG 감지 실패: {e}')
+                    continue
+
+        return CandidateArrays.concat(parts)
 
     def _comprehensive_hybrid_detection(self, image: np.ndarray) -> Tuple[bool, np.ndarray, List[PersonCandidate]]:
         """종합 하이브리드 감지"""
         try:
-            all_candidates = []
-
             # 1단계: 색상 기반 우주복 영역 추출
             logger.info('색상 기반 우주복 영역 추출...')
             spacesuit_mask = self.color_detector.extract_spacesuit_regions(image)
@@ -283,22 +606,21 @@ class HybridSpacesuitDetector:
             # 2단계: 컨투어 기반 사람 형태 분석
             logger.info('컨투어 기반 형태 분석...')
             contour_candidates = self.contour_analyzer.analyze_human_contours(spacesuit_mask)
-            all_candidates.extend(contour_candidates)
             logger.info(f'컨투어 감지: {len(contour_candidates)}개')
 
             # 3단계: 다중 각도 HOG 감지
             logger.info('다중 각도 HOG 감지...')
-            hog_candidates = self._multi_angle_hog_detection(image)
-            all_candidates.extend(hog_candidates)
+            hog_candidates = self._multi_angle_hog_arrays(image)
             logger.info(f'HOG 감지: {len(hog_candidates)}개')
 
             # 4단계: 하이브리드 검증 (색상 마스크 + HOG 결과 조합)
             logger.info('하이브리드 검증...')
-            hybrid_candidates = self._verify_with_color_mask(image, spacesuit_mask, hog_candidates)
-            all_candidates.extend(hybrid_candidates)
+            hybrid_candidates = self._verify_arrays_with_color_mask(spacesuit_mask, hog_candidates)
             logger.info(f'하이브리드 검증: {len(hybrid_candidates)}개')
 
             # 5단계: 중복 제거 및 최종 선별
+            all_candidates = CandidateArrays.concat([
+                CandidateArrays.from_candidates(contour_candidates), hog_candidates, hybrid_candidates])
             final_candidates = self._intelligent_candidate_selection(all_candidates)
 
             # 6단계: 결과 이미지 생성
@@ -325,66 +647,57 @@ class HybridSpacesuitDetector:
     def _verify_with_color_mask(self, image: np.ndarray, mask: np.ndarray,
                                 hog_candidates: List[PersonCandidate]) -> List[PersonCandidate]:
         """색상 마스크로 HOG 결과 검증"""
-        verified_candidates = []
-
-        for candidate in hog_candidates:
-            # 후보 영역의 색상 마스크 겹침 확인
-            roi_mask = mask[candidate.y:candidate.y + candidate.h,
-            candidate.x:candidate.x + candidate.w]
-
-            if roi_mask.size > 0:
-                overlap_ratio = np.sum(roi_mask > 0) / roi_mask.size
-
-                # 10% 이상 겹치면 우주복으로 인정
-                if overlap_ratio > 0.1:
-                    # 색상 검증으로 신뢰도 향상
-                    boosted_confidence = min(0.95, candidate.confidence + overlap_ratio * 0.3)
-
-                    verified_candidates.append(PersonCandidate(
-                        x=candidate.x, y=candidate.y,
-                        w=candidate.w, h=candidate.h,
-                        confidence=boosted_confidence,
-                        method=DetectionMethod.HYBRID_DETECTION,
-                        area=candidate.area,
-                        aspect_ratio=candidate.aspect_ratio
-                    ))
-
-        return verified_candidates
-
-    def _intelligent_candidate_selection(self, candidates: List[PersonCandidate]) -> List[PersonCandidate]:
-        """지능적 후보 선별"""
-        if not candidates:
+        return self._verify_arrays_with_color_mask(
+            mask, CandidateArrays.from_candidates(hog_candidates)).to_candidates()
+
+    def _verify_arrays_with_color_mask(self, mask: np.ndarray, hog: CandidateArrays) -> CandidateArrays:
+        """색상 마스크로 HOG 결과 검증 (적분 영상으로 모든 박스의 마스크 겹침 비율을 한 번에 계산)"""
+        if not len(hog):
+            return CandidateArrays.empty()
+
+        # 후보 영역의 색상 마스크 겹침 확인 (마스크는 0/255 이진 영상)
+        height, width = mask.shape[:2]
+        integral = cv2.integral(mask)
+        x1 = np.clip(hog.x, 0, width)
+        y1 = np.clip(hog.y, 0, height)
+        x2 = np.clip(hog.x + hog.w, 0, width)
+        y2 = np.clip(hog.y + hog.h, 0, height)
+        roi_size = (x2 - x1) * (y2 - y1)
+        inside = (integral[y2, x2] - integral[y1, x2] - integral[y2, x1] + integral[y1, x1]) / 255
+        overlap_ratio = inside / np.maximum(roi_size, 1)
+
+        # 10% 이상 겹치면 우주복으로 인정
+        keep = (roi_size > 0) & (overlap_ratio > 0.1)
+        verified = hog.take(keep)
+        # 색상 검증으로 신뢰도 향상
+        verified.confidence = np.minimum(0.95, verified.confidence + overlap_ratio[keep] * 0.3)
+        verified.method = np.full(len(verified), CandidateArrays.METHODS.index(DetectionMethod.HYBRID_DETECTION),
+                                  np.int8)
+        return verified
+
+    def _intelligent_candidate_selection(
+            self, candidates: Union[List[PersonCandidate], CandidateArrays]) -> List[PersonCandidate]:
+        """
+        지능적 후보 선별
+
+        selection='distance': 중심점 거리 DUPLICATE_DISTANCE 이내를 중복으로 제거 (격자 인덱스)
+        selection='iou': IoU 가 NMS_IOU_THRESHOLD 를 넘으면 중복으로 제거
+        어느 쪽이든 신뢰도 높은 순으로 최대 MAX_DETECTIONS 개만 선택함.
+        """
+        if not isinstance(candidates, CandidateArrays):
+            candidates = CandidateArrays.from_candidates(candidates)
+        if not len(candidates):
             return []
 
-        # 신뢰도로 정렬
-        sorted_candidates = sorted(candidates, key=lambda x: x.confidence, reverse=True)
-        selected_candidates = []
-
-        for current in sorted_candidates:
-            is_duplicate = False
-
-            for existing in selected_candidates:
-                # 중복 판정 (중심점 거리 기반)
-                curr_center = (current.x + current.w // 2, current.y + current.h // 2)
-                exist_center = (existing.x + existing.w // 2, existing.y + existing.h // 2)
-
-                distance = math.sqrt((curr_center[0] - exist_center[0]) ** 2 +
-                                     (curr_center[1] - exist_center[1]) ** 2)
-
-                # 겹치지 않는 상황이므로 거리 기준으로만 판정
-                if distance < 60:  # 60픽셀 이내면 중복으로 간주
-                    is_duplicate = True
-                    break
-
-            if not is_duplicate:
-                selected_candidates.append(current)
-
-        # 최대 감지 수 제한
-        max_detections = 12
-        if len(selected_candidates) > max_detections:
-            selected_candidates = selected_candidates[:max_detections]
-
-        return selected_candidates
+        if self.selection == 'iou':
+            keep = _select_by_iou(candidates.x, candidates.y, candidates.x + candidates.w,
+                                  candidates.y + candidates.h, candidates.confidence,
+                                  self.NMS_IOU_THRESHOLD, self.MAX_DETECTIONS)
+        else:
+            # 겹치지 않는 상황이므로 거리 기준으로만 판정
+            keep = _select_by_center_distance(candidates.x + candidates.w // 2, candidates.y + candidates.h // 2,
+                                              candidates.confidence, self.DUPLICATE_DISTANCE, self.MAX_DETECTIONS)
+        return candidates.take(keep).to_candidates()
 
     def _draw_detection_results(self, image: np.ndarray, candidates: List[PersonCandidate],
                                 mask: np.ndarray) -> np.ndarray:
@@ -501,6 +814,322 @@ def stable_problem1_viewer() -> None:
         cv2.destroyAllWindows()
 
 
+# 일괄 감지 워커 프로세스마다 한 번만 만드는 감지기 (HOG 포함)
+_batch_detector: Optional[HybridSpacesuitDetector] = None
+
+
+def _init_batch_worker(folder_path: str) -> None:
+    """일괄 감지 워커 초기화: 감지기/HOG 를 프로세스당 한 번만 생성"""
+    global _batch_detector
+    # 프로세스 수만큼 이미 병렬이므로 OpenCV 내부 스레드는 끔 (코어 과다 사용 방지)
+    cv2.setNumThreads(1)
+    # 이미지마다 찍히는 단계별 INFO 로그는 일괄 처리에서 생략
+    logger.setLevel(logging.WARNING)
+    _batch_detector = HybridSpacesuitDetector(folder_path)
+
+
+def _batch_detect_file(task: Tuple[int, str, Optional[str]]) -> Dict:
+    """워커: 이미지 1장 감지 후 결과를 dict 로 반환 (결과 이미지는 output_dir 가 있을 때만 저장)"""
+    index, file_path, output_dir = task
+    image_path = Path(file_path)
+    record = {'index': index, 'file': image_path.name, 'pid': os.getpid()}
+
+    start = time.perf_counter()
+    image = _batch_detector._load_and_verify_image(image_path)
+    load_ms = (time.perf_counter() - start) * 1000
+    if image is None:
+        record.update({'ok': False, 'error': '이미지 로드 실패', 'load_ms': round(load_ms, 2)})
+        return record
+
+    start = time.perf_counter()
+    detected, result_image, candidates = _batch_detector._comprehensive_hybrid_detection(image)
+    detect_ms = (time.perf_counter() - start) * 1000
+
+    if output_dir:
+        output_path = Path(output_dir) / f'{image_path.stem}_hybrid.jpg'
+        if not cv2.imwrite(str(output_path), result_image):
+            raise OSError(f'결과 이미지 저장 실패: {output_path}')
+
+    record.update({
+        'ok': True,
+        'width': image.shape[1],
+        'height': image.shape[0],
+        'detected': detected,
+        'person_count': len(candidates),
+        'boxes': [
+            {'x': int(c.x), 'y': int(c.y), 'w': int(c.w), 'h': int(c.h),
+             'confidence': round(float(c.confidence), 4), 'method': c.method.value}
+            for c in candidates
+        ],
+        'load_ms': round(load_ms, 2),
+        'detect_ms': round(detect_ms, 2),
+    })
+    return record
+
+
+def _batch_error_record(index: int, file_path: str, error: BaseException) -> Dict:
+    """작업 예외를 보고서의 실패 행으로 변환"""
+    return {'index': index, 'file': Path(file_path).name, 'ok': False,
+            'error': f'{type(error).__name__}: {error}'}
+
+
+class _BatchReportWriter:
+    """일괄 감지 결과 기록기 (확장자가 .csv 면 CSV, 그 외는 JSON Lines)"""
+
+    CSV_FIELDS = ['index', 'file', 'ok', 'error', 'width', 'height', 'detected',
+                  'person_count', 'boxes', 'load_ms', 'detect_ms', 'pid']
+
+    def __init__(self, report_path: str):
+        self.is_csv = Path(report_path).suffix.lower() == '.csv'
+        self._file = open(report_path, 'w', encoding='utf-8', newline='')
+        self._csv = None
+        if self.is_csv:
+            self._csv = csv.DictWriter(self._file, fieldnames=self.CSV_FIELDS)
+            self._csv.writeheader()
+
+    def write(self, record: Dict) -> None:
+        if self._csv is not None:
+            row = dict(record)
+            row['boxes'] = json.dumps(record.get('boxes', []), ensure_ascii=False)
+            self._csv.writerow(row)
+        else:
+            self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def batch_hybrid_detection(folder_path: str = 'CCTV', report_path: str = 'hybrid_report.jsonl',
+                           workers: Optional[int] = None, max_in_flight: Optional[int] = None,
+                           output_dir: Optional[str] = None) -> Dict:
+    """
+    헤드리스 일괄 하이브리드 감지 (키 입력/화면 표시 없음)
+
+    프로세스 풀에 이미지를 나눠 _comprehensive_hybrid_detection 을 실행하고,
+    완료되는 순서대로 보고서(JSON Lines 또는 CSV)에 기록함.
+    동시에 제출하는 작업 수를 max_in_flight 로 제한하므로 이미지가 수천 장이어도
+    대기 중인 작업/결과가 메모리에 쌓이지 않음.
+
+    Args:
+        workers: 워커 프로세스 수 (None 이면 CPU 코어 수)
+        max_in_flight: 동시에 제출해 둘 최대 작업 수 (None 이면 workers * 2)
+        output_dir: 지정하면 결과 이미지(박스 표시)를 저장
+
+    Returns:
+        처리 통계 dict
+    """
+    image_files = HybridSpacesuitDetector(folder_path)._get_image_files()
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    stats = {'images': len(image_files), 'processed': 0, 'failed': 0,
+             'detected_images': 0, 'total_persons': 0, 'detect_ms_total': 0.0}
+    tasks = iter(enumerate(str(path) for path in image_files))
+    writer = _BatchReportWriter(report_path)
+    start = time.perf_counter()
+    last_bucket = 0
+
+    def collect(record: Dict) -> None:
+        nonlocal last_bucket
+        writer.write(record)
+        if record['ok']:
+            stats['processed'] += 1
+            stats['detect_ms_total'] += record['detect_ms']
+            if record['detected']:
+                stats['detected_images'] += 1
+                stats['total_persons'] += record['person_count']
+        else:
+            stats['failed'] += 1
+
+        # 한 번의 wait() 에서 여러 작업이 끝나 100 의 배수를 건너뛰어도 구간마다 한 번 출력
+        finished = stats['processed'] + stats['failed']
+        if finished // 100 > last_bucket or finished == stats['images']:
+            last_bucket = finished // 100
+            print(f'진행: {finished}/{stats["images"]} '
+                  f'({finished / (time.perf_counter() - start):.2f} images/s)')
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(folder_path,)) as pool:
+            in_flight: Dict = {}  # future -> (index, file_path)
+            while True:
+                # 창(window)이 빌 때마다 다음 이미지를 제출
+                for index, file_path in tasks:
+                    try:
+                        future = pool.submit(_batch_detect_file, (index, file_path, output_dir))
+                    except BrokenProcessPool as e:
+                        # 워커가 비정상 종료된 풀에는 더 제출할 수 없으므로 남은 이미지는 실패로 기록
+                        collect(_batch_error_record(index, file_path, e))
+                        for index, file_path in tasks:
+                            collect(_batch_error_record(index, file_path, e))
+                        break
+                    in_flight[future] = (index, file_path)
+                    if len(in_flight) >= max_in_flight:
+                        break
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, file_path = in_flight.pop(future)
+                    try:
+                        record = future.result()
+                    except Exception as e:
+                        # 한 작업의 예외(저장 실패, 워커 종료 등)로 전체 실행을 멈추지 않음
+                        record = _batch_error_record(index, file_path, e)
+                    collect(record)
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    stats['elapsed_s'] = round(elapsed, 2)
+    stats['images_per_s'] = round((stats['processed'] + stats['failed']) / elapsed, 2) if elapsed else 0.0
+    stats['avg_detect_ms'] = round(stats.pop('detect_ms_total') / stats['processed'], 2) \
+        if stats['processed'] else 0.0
+    stats['workers'] = workers
+    return stats
+
+
+def hybrid_batch_detector(folder_path: str = 'CCTV', report_path: str = 'hybrid_report.jsonl',
+                          workers: Optional[int] = None) -> None:
+    """문제 2 일괄 모드: 전체 이미지를 병렬 감지하고 보고서 저장"""
+    print('=== 하이브리드 우주복 감지 일괄 처리 (헤드리스) ===')
+    try:
+        stats = batch_hybrid_detection(folder_path, report_path, workers)
+    except FileNotFoundError as e:
+        print(f'오류 발생: {e}')
+        return
+
+    print(f'\n✅ 일괄 감지 완료! (워커 {stats["workers"]}개, {stats["elapsed_s"]}초)')
+    print(f'   처리 완료: {stats["processed"]}개 이미지 (실패 {stats["failed"]}개)')
+    print(f'   감지 성공: {stats["detected_images"]}개 이미지')
+    print(f'   총 감지 인원: {stats["total_persons"]}명')
+    print(f'   처리 속도: {stats["images_per_s"]} images/s (이미지당 감지 {stats["avg_detect_ms"]} ms)')
+    print(f'   보고서: {report_path}')
+
+
+def benchmark_hog_search(folder_path: str = 'CCTV', limit: Optional[int] = None,
+                         iou_threshold: float = 0.5) -> Dict:
+    """
+    HOG 회전 탐색 방식 비교: 기존 전수 탐색(exhaustive) 대비 coarse_to_fine 의 속도와 재현율
+
+    재현율 = 전수 탐색 박스 중 coarse_to_fine 박스와 IoU >= iou_threshold 로 겹치는 비율
+    """
+    exhaustive = HybridSpacesuitDetector(folder_path, hog_search='exhaustive')
+    coarse = HybridSpacesuitDetector(folder_path, hog_search='coarse_to_fine')
+    image_files = exhaustive._get_image_files()[:limit]
+
+    totals = {'images': 0, 'exhaustive_s': 0.0, 'coarse_to_fine_s': 0.0, 'reference_boxes': 0, 'matched': 0}
+    for image_path in image_files:
+        image = exhaustive._load_and_verify_image(image_path)
+        if image is None:
+            continue
+
+        start = time.perf_counter()
+        reference = exhaustive._multi_angle_hog_detection(image)
+        exhaustive_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = coarse._multi_angle_hog_detection(image)
+        coarse_s = time.perf_counter() - start
+
+        matched = sum(1 for ref in reference if any(_box_iou(ref, box) >= iou_threshold for box in found))
+        totals['images'] += 1
+        totals['exhaustive_s'] += exhaustive_s
+        totals['coarse_to_fine_s'] += coarse_s
+        totals['reference_boxes'] += len(reference)
+        totals['matched'] += matched
+
+        recall = matched / len(reference) if reference else 1.0
+        print(f'{image_path.name}: 전수 {exhaustive_s:.2f}s ({len(reference)}개) / '
+              f'coarse_to_fine {coarse_s:.2f}s ({len(found)}개), 재현율 {recall:.1%}')
+
+    totals['speedup'] = round(totals['exhaustive_s'] / totals['coarse_to_fine_s'], 2) \
+        if totals['coarse_to_fine_s'] else 0.0
+    totals['recall'] = round(totals['matched'] / totals['reference_boxes'], 4) \
+        if totals['reference_boxes'] else 1.0
+    print(f'\n📊 HOG 탐색 비교 ({totals["images"]}개 이미지): '
+          f'속도 {totals["speedup"]}배, 재현율 {totals["recall"]:.1%}')
+    return totals
+
+
+def hybrid_stream_detector(source: str, report_path: Optional[str] = None, show: bool = True,
+                           realtime: Optional[bool] = None) -> Dict:
+    """
+    동영상 파일 / 카메라 / 이미지 시퀀스(glob) 하이브리드 감지
+
+    디코딩은 백그라운드 스레드(FrameStream)가 하고, 움직임 게이트를 통과한 프레임만
+    _comprehensive_hybrid_detection 을 실행함. report_path 를 주면 감지 결과를 JSON Lines 로 기록.
+    """
+    print('=== 하이브리드 우주복 감지 (동영상/스트림) ===')
+    print('ESC: 종료')
+
+    detector = HybridSpacesuitDetector()
+    motion_gate = MotionGate()
+    stream = FrameStream(source, realtime=realtime)
+    report = open(report_path, 'w', encoding='utf-8') if report_path else None
+    # 스트림에서는 프레임마다 찍히는 단계별 INFO 로그 생략
+    previous_level = logger.level
+    logger.setLevel(logging.WARNING)
+
+    last_result: Optional[np.ndarray] = None
+    try:
+        with stream:
+            for frame_index, timestamp, frame in stream:
+                frame = detector._fit_detection_size(frame)
+                if motion_gate.should_detect(frame):
+                    stream.stats.detections += 1
+                    start = time.perf_counter()
+                    detected, last_result, candidates = detector._comprehensive_hybrid_detection(frame)
+                    detect_ms = (time.perf_counter() - start) * 1000
+                    if detected:
+                        print(f'🎯 프레임 {frame_index} ({timestamp:.1f}초): {len(candidates)}명 감지 '
+                              f'({detect_ms:.0f} ms)')
+                    if report:
+                        report.write(json.dumps({
+                            'frame': frame_index,
+                            'time_s': round(timestamp, 3),
+                            'changed_ratio': round(motion_gate.last_changed_ratio, 4),
+                            'person_count': len(candidates),
+                            'boxes': [
+                                {'x': c.x, 'y': c.y, 'w': c.w, 'h': c.h,
+                                 'confidence': round(c.confidence, 4), 'method': c.method.value}
+                                for c in candidates
+                            ],
+                            'detect_ms': round(detect_ms, 2),
+                        }, ensure_ascii=False) + '\n')
+                else:
+                    stream.stats.motion_skipped += 1
+
+                if show:
+                    # 움직임이 없으면 마지막 감지 결과 화면을 유지
+                    display = last_result if last_result is not None else frame
+                    if not detector._safe_imshow(f'하이브리드 스트림 감지 - 프레임 {frame_index}', display):
+                        break
+                    if cv2.waitKey(1) & 0xFF == detector.KeyCodes.ESC:
+                        break
+    except KeyboardInterrupt:
+        print('\n사용자에 의해 중단되었습니다.')
+    finally:
+        logger.setLevel(previous_level)
+        if report:
+            report.close()
+        if show:
+            cv2.destroyAllWindows()
+
+    if stream.error:
+        print(f'입력 오류: {stream.error}')
+    stats = stream.stats.summary()
+    print(f'\n📊 스트림 처리 통계:')
+    print(f'   처리 프레임: {stats["processed"]}개 ({stats["processed_fps"]} fps)')
+    print(f'   감지 실행: {stats["detections"]}회 ({stats["detection_fps"]} fps), '
+          f'움직임 없음 생략: {stats["motion_skipped"]}회')
+    print(f'   디코딩: {stats["decoded"]}, 건너뜀: {stats["skipped"]}, 버림: {stats["dropped"]}')
+    return stats
+
+
 def hybrid_problem2_detector() -> None:
     """문제 2: 하이브리드 우주복 감지 시스템"""
     print('=== 하이브리드 우주복 착용자 감지 시스템 ===')
@@ -639,16 +1268,23 @@ def main():
     print('하이브리드 CCTV 이미지 분석 시스템 v8.0')
     print('1: 안정적 이미지 뷰어 (기존 기능)')
     print('2: 하이브리드 우주복 감지 (HOG+색상+컨투어)')
+    print('3: 하이브리드 우주복 감지 일괄 처리 (헤드리스, 보고서 저장)')
+    print('4: 하이브리드 우주복 감지 (동영상/카메라/이미지 시퀀스)')
 
     try:
-        choice = input('선택하세요 (1 또는 2): ').strip()
+        choice = input('선택하세요 (1-4): ').strip()
 
         if choice == '1':
             stable_problem1_viewer()
         elif choice == '2':
             hybrid_problem2_detector()
+        elif choice == '3':
+            hybrid_batch_detector()
+        elif choice == '4':
+            source = input('동영상 파일, 카메라 번호 또는 이미지 패턴(예: CCTV/*.jpg): ').strip()
+            hybrid_stream_detector(source)
         else:
-            print('1 또는 2를 입력하세요.')
+            print('1, 2, 3 또는 4를 입력하세요.')
 
     except KeyboardInterrupt:
         print('\n중단됨')
@@ -657,7 +1293,26 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench-hog':
+        # python cctv_adv.py bench-hog [폴더] [최대 이미지 수]
+        logger.setLevel(logging.WARNING)
+        benchmark_hog_search(sys.argv[2] if len(sys.argv) > 2 else 'CCTV',
+                             int(sys.argv[3]) if len(sys.argv) > 3 else None)
+    elif len(sys.argv) > 2 and sys.argv[1] == 'stream':
+        # python cctv_adv.py stream <동영상|카메라 번호|이미지 패턴> [보고서.jsonl] (화면 표시 없음)
+        try:
+            hybrid_stream_detector(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None, show=False)
+        except FileNotFoundError as e:
+            print(f'오류 발생: {e}')
+    elif len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        # python cctv_adv.py batch [폴더] [보고서.jsonl|.csv] [워커 수]
+        hybrid_batch_detector(
+            sys.argv[2] if len(sys.argv) > 2 else 'CCTV',
+            sys.argv[3] if len(sys.argv) > 3 else 'hybrid_report.jsonl',
+            int(sys.argv[4]) if len(sys.argv) > 4 else None
+        )
+    else:
+        main()
     # 출력 예시:
     # 하이브리드 CCTV 이미지 분석 시스템 v8.0
     # 1: 안정적 이미지 뷰어 (기존 기능)
@@ -0,0 +1,264 @@
+import glob
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from queue import Empty, Full, Queue
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+# (프레임 번호, 원본 기준 시각(초), 프레임)
+Frame = Tuple[int, float, np.ndarray]
+
+
+@dataclass
+class StreamStats:
+    """스트림 처리 통계"""
+    decoded: int = 0  # 디코딩한 프레임 수
+    skipped: int = 0  # 부하로 디코딩하지 않고 건너뛴 프레임 수 (grab 만 함)
+    dropped: int = 0  # Queue 가 가득 차서 버린 프레임 수
+    processed: int = 0  # 소비자가 처리한 프레임 수
+    detections: int = 0  # 감지를 실제로 실행한 프레임 수
+    motion_skipped: int = 0  # 움직임이 없어 감지를 생략한 프레임 수
+    started: float = field(default_factory=time.perf_counter)
+
+    def summary(self) -> Dict[str, float]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            'decoded': self.decoded,
+            'skipped': self.skipped,
+            'dropped': self.dropped,
+            'processed': self.processed,
+            'detections': self.detections,
+            'motion_skipped': self.motion_skipped,
+            'elapsed_s': round(elapsed, 2),
+            'processed_fps': round(self.processed / elapsed, 2) if elapsed else 0.0,
+            'detection_fps': round(self.detections / elapsed, 2) if elapsed else 0.0,
+        }
+
+
+class FrameStream:
+    """
+    동영상 파일 / 카메라 / 이미지 시퀀스(glob) 입력을 백그라운드 스레드에서 디코딩하는 프레임 소스
+
+    - 디코딩 결과는 크기가 제한된 Queue 로 전달 (메모리 사용량 고정)
+    - realtime 모드: 원본 속도를 따라가며, 소비자가 느리면 가장 오래된 프레임을 버리고(dropped)
+      Queue 가 차 있는 정도에 따라 디코딩 없이 건너뛰는 프레임 수(skip)를 자동으로 늘리고 줄임
+    - realtime 이 아니면 프레임을 버리지 않고 소비자 속도에 맞춰 디코딩함 (파일 일괄 분석용)
+    """
+
+    def __init__(self, source: Union[str, int], queue_size: int = 8, max_skip: int = 10,
+                 realtime: Optional[bool] = None, fps: Optional[float] = None):
+        """
+        Args:
+            source: 동영상 파일 경로, 카메라 번호(int 또는 숫자 문자열), 스트림 URL, 이미지 glob 패턴
+            realtime: None 이면 카메라/URL 은 True, 파일/이미지 시퀀스는 False
+            fps: 이미지 시퀀스의 재생 속도 (realtime 모드에서만 사용, 기본 30)
+        """
+        if isinstance(source, str) and source.isdigit():
+            source = int(source)
+        self.source = source
+        self.is_live = isinstance(source, int) or '://' in str(source)
+        self.image_files: Optional[List[str]] = None
+        if not self.is_live and any(ch in str(source) for ch in '*?['):
+            self.image_files = sorted(glob.glob(str(source)))
+            if not self.image_files:
+                raise FileNotFoundError(f'패턴에 맞는 이미지가 없습니다: {source}')
+        elif not self.is_live and not os.path.exists(str(source)):
+            raise FileNotFoundError(f'입력 파일을 찾을 수 없습니다: {source}')
+
+        self.realtime = self.is_live if realtime is None else realtime
+        self.fps = fps
+        self.max_skip = max_skip
+        self.skip = 0
+        self.stats = StreamStats()
+
+        self._queue: Queue = Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.error: Optional[str] = None
+
+    def start(self) -> 'FrameStream':
+        self._thread = threading.Thread(target=self._decode_loop, name='FrameDecoder', daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self._stop.set()
+        # 디코더가 put 에서 대기 중이면 풀어 줌
+        try:
+            while True:
+                self._queue.get_nowait()
+        except Empty:
+            pass
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+    def __enter__(self) -> 'FrameStream':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Frame]:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            self.stats.processed += 1
+            yield item
+
+    # ====== 디코더 스레드 ======
+    def _adapt_skip(self) -> None:
+        """Queue 가 3/4 이상 차 있으면 건너뛰기를 늘리고, 1/4 이하면 줄임"""
+        fill = self._queue.qsize() / self._queue.maxsize
+        if fill >= 0.75:
+            self.skip = min(self.skip + 1, self.max_skip)
+        elif fill <= 0.25:
+            self.skip = max(self.skip - 1, 0)
+
+    def _deliver(self, frame: Frame) -> None:
+        if not self.realtime:
+            while not self._stop.is_set():
+                try:
+                    self._queue.put(frame, timeout=0.1)
+                    return
+                except Full:
+                    continue
+            return
+
+        try:
+            self._queue.put_nowait(frame)
+        except Full:
+            # 가장 오래된 프레임을 버리고 최신 프레임을 넣음
+            try:
+                self._queue.get_nowait()
+                self.stats.dropped += 1
+            except Empty:
+                pass
+            try:
+                self._queue.put_nowait(frame)
+            except Full:
+                self.stats.dropped += 1
+        self._adapt_skip()
+
+    def _decode_loop(self) -> None:
+        try:
+            if self.image_files is not None:
+                self._decode_images()
+            else:
+                self._decode_video()
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            # 종료 표시 (소비자가 멈춰 있어도 close() 가 Queue 를 비우므로 막히지 않음)
+            while not self._stop.is_set():
+                try:
+                    self._queue.put(None, timeout=0.1)
+                    break
+                except Full:
+                    continue
+
+    def _decode_video(self) -> None:
+        capture = cv2.VideoCapture(self.source)
+        if not capture.isOpened():
+            raise IOError(f'입력을 열 수 없습니다: {self.source}')
+        source_fps = capture.get(cv2.CAP_PROP_FPS) or self.fps or 30.0
+        pace = self.realtime and not self.is_live  # 파일을 실시간처럼 재생
+        started = time.perf_counter()
+        index = -1
+        try:
+            while not self._stop.is_set():
+                # 건너뛸 프레임은 grab 만 하고 디코딩(retrieve)은 하지 않음
+                for _ in range(self.skip):
+                    if not capture.grab():
+                        return
+                    index += 1
+                    self.stats.skipped += 1
+
+                ok, frame = capture.read()
+                if not ok:
+                    return
+                index += 1
+                self.stats.decoded += 1
+                timestamp = index / source_fps
+
+                if pace:
+                    delay = timestamp - (time.perf_counter() - started)
+                    if delay > 0:
+                        time.sleep(delay)
+                self._deliver((index, timestamp, frame))
+        finally:
+            capture.release()
+
+    def _decode_images(self) -> None:
+        fps = self.fps or 30.0
+        started = time.perf_counter()
+        index = 0
+        while index < len(self.image_files) and not self._stop.is_set():
+            if self.realtime:
+                # 재생 시각보다 늦었으면 그만큼 건너뜀 (이미지는 건너뛸 때 읽지 않음)
+                behind = int((time.perf_counter() - started) * fps) - index
+                jump = min(max(self.skip, behind), self.max_skip)
+                if jump > 0:
+                    jump = min(jump, len(self.image_files) - index - 1)
+                    index += jump
+                    self.stats.skipped += jump
+
+            frame = cv2.imread(self.image_files[index], cv2.IMREAD_COLOR)
+            if frame is not None:
+                self.stats.decoded += 1
+                timestamp = index / fps
+                if self.realtime:
+                    delay = timestamp - (time.perf_counter() - started)
+                    if delay > 0:
+                        time.sleep(delay)
+                self._deliver((index, timestamp, frame))
+            index += 1
+
+
+class MotionGate:
+    """
+    프레임 차분 기반 움직임 게이트
+
+    마지막으로 감지를 실행한 프레임과 현재 프레임을 작은 회색조 영상으로 비교해
+    바뀐 픽셀 비율이 min_changed_ratio 이상일 때만 감지를 실행하도록 함.
+    움직임이 없어도 max_idle_frames 마다 한 번은 감지를 실행함 (결과가 너무 오래되지 않도록).
+    """
+
+    def __init__(self, pixel_threshold: int = 25, min_changed_ratio: float = 0.01,
+                 width: int = 160, max_idle_frames: int = 30):
+        self.pixel_threshold = pixel_threshold
+        self.min_changed_ratio = min_changed_ratio
+        self.width = width
+        self.max_idle_frames = max_idle_frames
+        self._reference: Optional[np.ndarray] = None
+        self._idle = 0
+        self.last_changed_ratio = 0.0
+
+    def _prepare(self, frame: np.ndarray) -> np.ndarray:
+        height, width = frame.shape[:2]
+        small_height = max(1, int(height * self.width / width))
+        small = cv2.resize(frame, (self.width, small_height), interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+        return cv2.GaussianBlur(gray, (5, 5), 0)
+
+    def should_detect(self, frame: np.ndarray) -> bool:
+        gray = self._prepare(frame)
+        if self._reference is None or self._reference.shape != gray.shape:
+            self._reference = gray
+            self._idle = 0
+            return True
+
+        diff = cv2.absdiff(gray, self._reference)
+        _, changed = cv2.threshold(diff, self.pixel_threshold, 255, cv2.THRESH_BINARY)
+        self.last_changed_ratio = cv2.countNonZero(changed) / changed.size
+
+        if self.last_changed_ratio >= self.min_changed_ratio or self._idle >= self.max_idle_frames:
+            self._reference = gray
+            self._idle = 0
+            return True
+        self._idle += 1
+        return False
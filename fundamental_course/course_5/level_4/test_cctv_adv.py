@@ -0,0 +1,195 @@
+# test_cctv_adv.py
+import csv
+import json
+import math
+import random
+
+import cv2
+import numpy as np
+import pytest
+
+from cctv_adv import (CandidateArrays, DetectionMethod, HybridSpacesuitDetector, PersonCandidate,
+                      SpacesuitColorDetector, _box_iou, batch_hybrid_detection)
+
+
+def _reference_mask(detector, image):
+    """색상 범위별 inRange 를 OR 로 합친 뒤 같은 형태 연산을 적용한 원래 방식"""
+    hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+    mask = np.zeros(hsv.shape[:2], np.uint8)
+    for lower, upper in detector.spacesuit_colors.values():
+        mask = cv2.bitwise_or(mask, cv2.inRange(hsv, np.array(lower), np.array(upper)))
+
+    kernel_small = np.ones((3, 3), np.uint8)
+    kernel_large = np.ones((7, 7), np.uint8)
+    mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel_small)
+    mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel_large)
+    return cv2.dilate(mask, kernel_small, iterations=2)
+
+
+def _synthetic_image(seed):
+    """우주복 색 근처의 사각형을 흩뿌린 영상 (범위 경계 값 포함)"""
+    rng = np.random.default_rng(seed)
+    hsv = rng.integers(0, 256, size=(240, 320, 3), dtype=np.uint8)
+    hsv[..., 0] %= 180
+    detector = SpacesuitColorDetector()
+    for lower, upper in detector.spacesuit_colors.values():
+        for _ in range(6):
+            y, x = rng.integers(0, 200), rng.integers(0, 280)
+            h, w = rng.integers(5, 40), rng.integers(5, 40)
+            low = np.maximum(np.array(lower) - 2, 0)
+            high = np.minimum(np.array(upper) + 2, [179, 255, 255])
+            hsv[y:y + h, x:x + w] = rng.integers(low, high + 1, size=(min(h, 240 - y), min(w, 320 - x), 3))
+    return cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
+
+
+def test_color_lut_bits_match_ranges():
+    detector = SpacesuitColorDetector()
+    lut = detector._build_color_lut()
+    assert lut.shape == (256, 1, 3)
+    values = np.arange(256)
+    for bit, (lower, upper) in enumerate(detector.spacesuit_colors.values()):
+        for channel in range(3):
+            expected = (values >= lower[channel]) & (values <= upper[channel])
+            np.testing.assert_array_equal((lut[:, 0, channel] >> bit) & 1, expected)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_lut_mask_matches_in_range(seed):
+    detector = SpacesuitColorDetector(downscale=1.0)
+    rng = np.random.default_rng(100 + seed)
+    images = [rng.integers(0, 256, size=(180, 260, 3), dtype=np.uint8), _synthetic_image(seed)]
+    for image in images:
+        # 반환 마스크는 재사용 버퍼이므로 복사해서 비교
+        mask = detector.extract_spacesuit_regions(image).copy()
+        np.testing.assert_array_equal(mask, _reference_mask(detector, image))
+
+
+def _reference_selection(candidates, distance=60, max_detections=12):
+    """신뢰도 순으로 훑으며 이미 고른 모든 후보와 중심점 거리를 재는 원래 O(n^2) 선별"""
+    selected = []
+    for current in sorted(candidates, key=lambda c: c.confidence, reverse=True):
+        curr_center = (current.x + current.w // 2, current.y + current.h // 2)
+        if all(math.sqrt((curr_center[0] - e.x - e.w // 2) ** 2 + (curr_center[1] - e.y - e.h // 2) ** 2)
+               >= distance for e in selected):
+            selected.append(current)
+    return selected[:max_detections]
+
+
+def _random_candidates(rng, count):
+    return [PersonCandidate(x=rng.randint(-5, 700), y=rng.randint(0, 500), w=rng.randint(20, 120),
+                            h=rng.randint(20, 200), confidence=round(rng.random(), 2),  # 동점 신뢰도 포함
+                            method=rng.choice(list(DetectionMethod)), area=100, aspect_ratio=1.0)
+            for _ in range(count)]
+
+
+def _key(candidates):
+    return [(c.x, c.y, c.w, c.h, c.confidence, c.method) for c in candidates]
+
+
+def test_grid_selection_matches_pairwise_selection():
+    detector = HybridSpacesuitDetector(selection='distance')
+    assert (detector.DUPLICATE_DISTANCE, detector.MAX_DETECTIONS) == (60, 12)
+    rng = random.Random(0)
+    for _ in range(200):
+        candidates = _random_candidates(rng, rng.choice([0, 1, 2, 5, 50, 500]))
+        expected = _key(_reference_selection(candidates))
+        assert _key(detector._intelligent_candidate_selection(candidates)) == expected
+        assert _key(detector._intelligent_candidate_selection(
+            CandidateArrays.from_candidates(candidates))) == expected
+
+
+def test_grid_selection_on_boundaries():
+    # 정확히 반경 거리(60)는 중복이 아님, 격자 칸 경계를 넘는 이웃도 제거됨
+    detector = HybridSpacesuitDetector(selection='distance')
+    centers = [(0, 0, 0.9), (60, 0, 0.8), (59, 1, 0.7), (119, 0, 0.6), (-1, -60, 0.5), (36, 48, 0.4)]
+    candidates = [PersonCandidate(x - 10, y - 10, 20, 20, conf, DetectionMethod.HOG_DETECTION, 400, 1.0)
+                  for x, y, conf in centers]
+    selected = detector._intelligent_candidate_selection(candidates)
+    assert _key(selected) == _key(_reference_selection(candidates))
+    assert [c.confidence for c in selected] == [0.9, 0.8, 0.5]
+
+
+@pytest.fixture
+def cctv_folder(tmp_path):
+    """생성 영상 5장 + 읽을 수 없는 파일 1개가 들어 있는 CCTV 폴더"""
+    folder = tmp_path / 'CCTV'
+    folder.mkdir()
+    for seed in range(5):
+        cv2.imwrite(str(folder / f'frame_{seed}.png'), _synthetic_image(seed))
+    (folder / 'broken.jpg').write_bytes(b'not an image')
+    return folder
+
+
+def test_batch_detection_reports_every_image(cctv_folder, tmp_path):
+    output_dir = tmp_path / 'out'
+    # 결과 파일 자리에 디렉터리가 있으면 워커의 imwrite 가 실패 -> 해당 이미지만 실패 행
+    (output_dir / 'frame_3_hybrid.jpg').mkdir(parents=True)
+    report = tmp_path / 'report.jsonl'
+
+    stats = batch_hybrid_detection(str(cctv_folder), str(report), workers=2, output_dir=str(output_dir))
+    records = [json.loads(line) for line in report.read_text(encoding='utf-8').splitlines()]
+
+    assert sorted(r['file'] for r in records) == sorted(p.name for p in cctv_folder.iterdir())
+    assert sorted(r['index'] for r in records) == list(range(6))
+    failed = {r['file']: r['error'] for r in records if not r['ok']}
+    assert failed.keys() == {'broken.jpg', 'frame_3.png'}
+    assert failed['frame_3.png'].startswith('OSError')
+    assert (stats['images'], stats['processed'], stats['failed']) == (6, 4, 2)
+    assert {r['pid'] for r in records if r['ok']}  # 워커 프로세스에서 처리
+    assert sorted(p.name for p in output_dir.glob('*.jpg') if p.is_file()) == \
+        [f'frame_{seed}_hybrid.jpg' for seed in (0, 1, 2, 4)]
+    for record in records:
+        if record['ok']:
+            assert record['person_count'] == len(record['boxes'])
+
+
+def test_batch_detection_writes_csv(cctv_folder, tmp_path):
+    report = tmp_path / 'report.csv'
+    stats = batch_hybrid_detection(str(cctv_folder), str(report), workers=2, max_in_flight=1)
+
+    with open(report, encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == stats['images'] == 6
+    assert [row['index'] for row in rows] == [str(i) for i in range(6)]  # 동시 작업 1개면 제출 순서대로
+    for row in rows:
+        if row['ok'] == 'True':
+            assert len(json.loads(row['boxes'])) == int(row['person_count'])
+        else:
+            assert row['file'] == 'broken.jpg' and row['error']
+
+
+def _person_image(seed, height=150, size=(220, 200)):
+    """배경 잡음 위에 밝은 사람 실루엣(머리, 몸통, 팔, 다리) 하나를 그린 영상"""
+    rng = np.random.default_rng(seed)
+    image = np.full((*size, 3), 90, np.uint8) + rng.integers(0, 20, size=(*size, 3), dtype=np.uint8)
+    cx, top, s = size[1] // 2 + int(rng.integers(-20, 20)), 20 + int(rng.integers(0, 20)), height / 128
+    color = (230, 230, 230)
+
+    def line(x1, y1, x2, y2, width):
+        cv2.line(image, (int(cx + x1 * s), int(top + y1 * s)), (int(cx + x2 * s), int(top + y2 * s)),
+                 color, max(1, int(width * s)))
+
+    cv2.circle(image, (cx, int(top + 12 * s)), int(10 * s), color, -1)
+    cv2.rectangle(image, (int(cx - 14 * s), int(top + 24 * s)), (int(cx + 14 * s), int(top + 72 * s)), color, -1)
+    line(-14, 28, -22, 66, 6)
+    line(14, 28, 22, 66, 6)
+    line(-6, 72, -10, 120, 8)
+    line(6, 72, 10, 120, 8)
+    return image
+
+
+@pytest.mark.parametrize('seed', [1, 2])
+def test_coarse_to_fine_finds_subset_of_exhaustive_boxes(seed):
+    exhaustive = HybridSpacesuitDetector(hog_search='exhaustive')
+    coarse = HybridSpacesuitDetector(hog_search='coarse_to_fine')
+    for detector in (exhaustive, coarse):
+        detector.HOG_ANGLES = (0, 90, 180)  # 테스트 시간 단축
+
+    image = _person_image(seed)
+    reference = exhaustive._multi_angle_hog_detection(image)
+    found = coarse._multi_angle_hog_detection(image)
+
+    assert found
+    # ROI 를 잘라 탐색하므로 창 위치가 픽셀 단위로 같지는 않음: IoU 0.5 이상 겹치면 같은 박스
+    for box in found:
+        assert max(_box_iou(box, ref) for ref in reference) >= 0.5
@@ -0,0 +1,83 @@
+# test_frame_stream.py
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from frame_stream import FrameStream, MotionGate
+
+
+@pytest.fixture
+def image_sequence(tmp_path):
+    """프레임 번호를 픽셀 값으로 가진 이미지 시퀀스 (glob 패턴 반환)"""
+    def make(count: int) -> str:
+        for index in range(count):
+            frame = np.full((48, 64, 3), index, np.uint8)
+            cv2.imwrite(str(tmp_path / f'frame_{index:04d}.png'), frame)
+        return str(tmp_path / 'frame_*.png')
+
+    return make
+
+
+def test_lossless_stream_delivers_every_frame_in_order(image_sequence):
+    stream = FrameStream(image_sequence(40), queue_size=2)
+    assert not stream.realtime
+
+    seen = []
+    with stream:
+        for index, timestamp, frame in stream:
+            time.sleep(0.002)  # 소비자가 디코더보다 느려도 버리지 않음
+            assert frame[0, 0, 0] == index and timestamp == pytest.approx(index / 30.0)
+            seen.append(index)
+
+    assert seen == list(range(40))
+    assert (stream.stats.decoded, stream.stats.processed) == (40, 40)
+    assert (stream.stats.dropped, stream.stats.skipped) == (0, 0)
+    assert stream.error is None
+
+
+def test_close_mid_iteration_does_not_hang(image_sequence):
+    stream = FrameStream(image_sequence(100), queue_size=2).start()
+    for index, _, _ in stream:
+        if index == 3:
+            break
+
+    # 디코더는 가득 찬 Queue 의 put 에서 대기 중
+    start = time.perf_counter()
+    stream.close()
+    assert time.perf_counter() - start < 1.0
+    assert not stream._thread.is_alive()
+    assert stream.stats.decoded < 100
+
+
+def test_realtime_stream_drops_and_skips_for_slow_consumer(image_sequence):
+    stream = FrameStream(image_sequence(120), queue_size=4, max_skip=5, realtime=True, fps=200)
+
+    seen = []
+    with stream:
+        for index, _, _ in stream:
+            time.sleep(0.03)  # 원본 속도(200fps)보다 훨씬 느린 소비자
+            seen.append(index)
+
+    assert stream.stats.skipped > 0 and stream.stats.dropped > 0
+    assert stream.stats.decoded + stream.stats.skipped == 120
+    assert stream.stats.decoded == len(seen) + stream.stats.dropped
+    assert seen == sorted(seen) and len(seen) < 120
+    assert stream.skip <= 5
+
+
+def test_motion_gate_skips_static_frames_until_idle_limit():
+    gate = MotionGate(max_idle_frames=3)
+    frame = np.full((120, 160, 3), 80, np.uint8)
+
+    assert gate.should_detect(frame)  # 첫 프레임은 항상 감지
+    assert [gate.should_detect(frame.copy()) for _ in range(4)] == [False, False, False, True]
+    assert gate.last_changed_ratio == 0.0
+
+    moved = frame.copy()
+    cv2.rectangle(moved, (40, 30), (90, 90), (255, 255, 255), -1)
+    assert gate.should_detect(moved)
+    assert gate.last_changed_ratio > gate.min_changed_ratio
+    # 비교 기준이 움직인 프레임으로 바뀌었으므로 같은 프레임은 다시 생략
+    assert not gate.should_detect(moved)